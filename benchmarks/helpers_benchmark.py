@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Streaming Helpers Benchmark for Mix Python SDK
+
+Pushes pre-decoded SSE events through `helpers.query` using an in-memory stand-in
+for the `Mix` client, so only the helper layer is measured: event wrapping,
+dispatch and attribute access. The current `StreamEvent` is compared against a
+copy of the previous dict-backed implementation.
+
+Usage:
+    python benchmarks/helpers_benchmark.py [--events 1000000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+from mix_python_sdk import helpers
+from mix_python_sdk.models import (
+    SSECompleteEvent,
+    SSEContentEvent,
+    SSEThinkingEvent,
+    SSEToolExecutionStartEvent,
+)
+
+
+class LegacyStreamEvent:
+    """The previous StreamEvent: per-instance __dict__ and hasattr on access."""
+
+    def __init__(self, event_type: str, data: Any):
+        self.type = event_type
+        self.data = data
+
+    @property
+    def content(self) -> Optional[str]:
+        if self.type == "content" and hasattr(self.data, "content"):
+            return self.data.content
+        return None
+
+    @property
+    def thinking(self) -> Optional[str]:
+        if self.type == "thinking" and hasattr(self.data, "content"):
+            return self.data.content
+        return None
+
+    @property
+    def tool_name(self) -> Optional[str]:
+        if self.type == "tool" and hasattr(self.data, "name"):
+            return self.data.name
+        return None
+
+
+def build_events(count: int) -> List[Any]:
+    """Build a token-heavy event mix: mostly content, some thinking and tools."""
+    content = SSEContentEvent.model_validate(
+        {"event": "content", "id": "1", "data": {"content": "tok", "type": "content"}}
+    )
+    thinking = SSEThinkingEvent.model_validate(
+        {"event": "thinking", "id": "2", "data": {"content": "hmm", "type": "thinking"}}
+    )
+    tool = SSEToolExecutionStartEvent.model_validate(
+        {
+            "event": "tool_execution_start",
+            "id": "3",
+            "data": {
+                "progress": "running",
+                "toolCallId": "call-1",
+                "toolName": "bash",
+                "type": "tool_execution_start",
+            },
+        }
+    )
+    complete = SSECompleteEvent.model_validate(
+        {"event": "complete", "id": "4", "data": {"done": True, "type": "complete"}}
+    )
+
+    events: List[Any] = []
+    for i in range(count - 1):
+        if i % 50 == 0:
+            events.append(tool)
+        elif i % 10 == 0:
+            events.append(thinking)
+        else:
+            events.append(content)
+    events.append(complete)
+    return events
+
+
+class _EventStream:
+    def __init__(self, events: List[Any]):
+        self._events = events
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    async def __aiter__(self):
+        for event in self._events:
+            yield event
+
+
+def make_mix(events: List[Any]) -> Any:
+    async def stream_events_async(session_id: str):
+        return SimpleNamespace(result=_EventStream(events))
+
+    async def send_async(id: str, text: str):
+        return None
+
+    return SimpleNamespace(
+        streaming=SimpleNamespace(stream_events_async=stream_events_async),
+        messages=SimpleNamespace(send_async=send_async),
+    )
+
+
+async def consume(mix: Any) -> float:
+    start = time.perf_counter()
+    chars = 0
+    async for event in helpers.query(mix, "session", "hello"):
+        text = event.content or event.thinking
+        if text:
+            chars += len(text)
+        elif event.tool_name:
+            chars += 1
+    return time.perf_counter() - start
+
+
+def run(count: int) -> None:
+    events = build_events(count)
+    sample = events[1]
+
+    results = {}
+    for label, event_class in (
+        ("legacy", LegacyStreamEvent),
+        ("slotted", helpers.StreamEvent),
+    ):
+        helpers.StreamEvent = event_class  # type: ignore[misc]
+        elapsed = asyncio.run(consume(make_mix(events)))
+        instance = event_class(helpers.EventType.CONTENT, sample.data)
+        size = sys.getsizeof(instance) + (
+            sys.getsizeof(instance.__dict__) if hasattr(instance, "__dict__") else 0
+        )
+        # query() sleeps once while the stream connects; leave that out.
+        results[label] = elapsed - 0.5
+        print(
+            f"{label:>8}: {results[label]:6.2f} s for {count:,} events "
+            f"({results[label] / count * 1e9:5.0f} ns/event, {size} bytes/event)"
+        )
+
+    print(f"Speedup: {results['legacy'] / results['slotted']:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark for Mix Python SDK
+
+Imports each target module in a fresh interpreter under ``python -X importtime``
+and parses the per-module timings into a report: the target's total import
+time, the share spent in the SDK's own modules, and the modules with the
+highest self time. Every target is imported ``--repeat`` times and the fastest
+run is kept, which filters out disk cache and scheduling noise.
+
+Because model schemas are built on first validation, the report also times the
+first and second decode of an SSE event in a fresh interpreter, with and
+without ``utils.warm_up``, to show where the deferred cost lands.
+
+Usage:
+    python benchmarks/import_time_benchmark.py [--module NAME ...]
+        [--repeat 5] [--top 15] [--json PATH]
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULES = [
+    "mix_python_sdk",
+    "mix_python_sdk.models.sseeventstream",
+    "mix_python_sdk.tool_models",
+    "mix_python_sdk.helpers",
+]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+_FIRST_USE = """
+import sys, time
+from mix_python_sdk import models, utils
+event = '{"id": "1", "event": "content", "data": {"content": "hi", "type": "content"}}'
+if sys.argv[1] == "warm":
+    utils.warm_up(background=True).join()
+timings = []
+for _ in range(2):
+    started = time.perf_counter()
+    utils.unmarshal_json(event, models.SSEEventStream)
+    timings.append((time.perf_counter() - started) * 1e6)
+print(timings[0], timings[1])
+"""
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """``{module: (self_us, cumulative_us)}`` from one fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is not None:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return timings
+
+
+def fastest(module: str, repeat: int) -> Dict[str, Tuple[int, int]]:
+    """Per-module timings of the run with the lowest total for ``module``."""
+    runs = [import_times(module) for _ in range(repeat)]
+    return min(runs, key=lambda run: run.get(module, (0, 0))[1])
+
+
+def report(module: str, timings: Dict[str, Tuple[int, int]], top: int) -> Dict:
+    total = timings.get(module, (0, 0))[1]
+    sdk = sum(
+        self_us
+        for name, (self_us, _) in timings.items()
+        if name == "mix_python_sdk" or name.startswith("mix_python_sdk.")
+    )
+    ranked = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+    return {
+        "module": module,
+        "total_ms": total / 1000,
+        "sdk_self_ms": sdk / 1000,
+        "modules": len(timings),
+        "top": [
+            {"module": name, "self_ms": s / 1000, "cumulative_ms": c / 1000}
+            for name, (s, c) in ranked[:top]
+        ],
+    }
+
+
+def first_use(mode: str, repeat: int) -> Tuple[float, float]:
+    """Microseconds for the first and second SSE decode in a fresh process."""
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _FIRST_USE, mode],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        first, second = result.stdout.split()
+        runs.append((float(first), float(second)))
+    return min(runs)
+
+
+def print_report(entry: Dict) -> None:
+    print(
+        f"\n{entry['module']}: {entry['total_ms']:.1f} ms total, "
+        f"{entry['sdk_self_ms']:.1f} ms in SDK modules, "
+        f"{entry['modules']} modules"
+    )
+    print(f"  {'module':<52} {'self ms':>9} {'cum ms':>9}")
+    for row in entry["top"]:
+        print(
+            f"  {row['module']:<52} {row['self_ms']:>9.1f} "
+            f"{row['cumulative_ms']:>9.1f}"
+        )
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--module",
+        action="append",
+        help="Module to import (repeatable); defaults to the SDK entry points",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args(argv)
+
+    entries = []
+    for module in args.module or DEFAULT_MODULES:
+        entry = report(module, fastest(module, args.repeat), args.top)
+        entries.append(entry)
+        print_report(entry)
+
+    print("\nFirst SSE decode in a fresh process:")
+    decode = {}
+    for mode in ("cold", "warm"):
+        first, second = first_use(mode, args.repeat)
+        decode[mode] = {"first_us": first, "second_us": second}
+        label = "after warm_up" if mode == "warm" else "cold"
+        print(f"  {label:<14} first {first:>10,.0f} us   second {second:>8,.0f} us")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"imports": entries, "first_decode": decode}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
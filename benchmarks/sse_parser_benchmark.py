@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+SSE Parser Benchmark for Mix Python SDK
+
+Feeds synthetic SSE byte streams through `utils.eventstreaming.stream_events`,
+once with a pass-through decoder to measure framing alone and once with the
+`SSEEventStream` decoder used by `mix.streaming.stream_events`. Each workload
+reports events/s, MB/s, p99 latency per event and transient memory allocated
+per event (tracemalloc peak while producing one event).
+
+Results can be saved as a baseline JSON and later runs compared against it;
+the comparison exits non-zero if any workload regressed by more than the
+threshold. Baselines are machine-specific, so compare on the machine that
+recorded them.
+
+Usage:
+    python benchmarks/sse_parser_benchmark.py [--events 1000] [--workload NAME]
+        [--save-baseline PATH] [--compare PATH] [--threshold 0.1]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List
+
+import httpx
+
+from mix_python_sdk import models, utils
+from mix_python_sdk.utils.eventstreaming import stream_events
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baselines", "sse_parser.json"
+)
+
+# Metrics checked against a baseline, and whether larger values are worse.
+_COMPARED = {"events_per_s": False, "p99_us": True, "alloc_bytes_per_event": True}
+
+
+def _frame(event_id: int, event: str, data: Dict[str, Any], newline: str) -> str:
+    return (
+        f"id: {event_id}{newline}event: {event}{newline}"
+        f"data: {json.dumps(data)}{newline}{newline}"
+    )
+
+
+def content_events(count: int, newline: str = "\n") -> str:
+    """Token-rate content storm: short deltas with the odd heartbeat."""
+    frames = []
+    for i in range(count):
+        if i % 200 == 199:
+            frames.append(_frame(i, "heartbeat", {"type": "heartbeat"}, newline))
+        else:
+            frames.append(
+                _frame(
+                    i,
+                    "content",
+                    {
+                        "content": f" token{i % 97}",
+                        "type": "content",
+                        "assistantMessageId": "msg-1",
+                    },
+                    newline,
+                )
+            )
+    return "".join(frames)
+
+
+def tool_input_events(count: int, size: int = 64 * 1024) -> str:
+    """Large tool payloads: completed `write` inputs of ``size`` bytes."""
+    body = ("line of generated file content\n" * (size // 31 + 1))[:size]
+    frames = []
+    for i in range(count):
+        tool_input = json.dumps({"file_path": f"/tmp/out-{i}.txt", "content": body})
+        frames.append(
+            _frame(
+                i,
+                "tool_use_parameter_streaming_complete",
+                {
+                    "id": f"call-{i}",
+                    "input": tool_input,
+                    "name": "write",
+                    "type": "tool_use_parameter_streaming_complete",
+                },
+                "\n",
+            )
+        )
+    return "".join(frames)
+
+
+def chunked(payload: bytes, size: int) -> List[bytes]:
+    return [payload[i : i + size] for i in range(0, len(payload), size)]
+
+
+WORKLOADS: Dict[str, Callable[[int], List[bytes]]] = {
+    "content_lf": lambda n: chunked(content_events(n).encode(), 4096),
+    "content_crlf": lambda n: chunked(content_events(n, "\r\n").encode(), 4096),
+    "content_cr": lambda n: chunked(content_events(n, "\r").encode(), 4096),
+    "content_bom": lambda n: chunked(
+        b"\xef\xbb\xbf" + content_events(n).encode(), 4096
+    ),
+    "small_chunks": lambda n: chunked(content_events(n).encode(), 7),
+    "large_chunks": lambda n: chunked(content_events(n).encode(), 1024 * 1024),
+    "large_tool_inputs": lambda n: chunked(
+        tool_input_events(max(n // 200, 10)).encode(), 16 * 1024
+    ),
+}
+
+DECODERS: Dict[str, Callable[[str], Any]] = {
+    "parse": lambda raw: raw,
+    "decode": lambda raw: utils.unmarshal_json(raw, models.SSEEventStream),
+}
+
+
+def _events(chunks: List[bytes], decoder: Callable[[str], Any]) -> Iterator[Any]:
+    return stream_events(httpx.Response(200), decoder, chunks=iter(chunks))
+
+
+def measure(chunks: List[bytes], decoder: Callable[[str], Any], repeat: int) -> dict:
+    size = sum(len(chunk) for chunk in chunks)
+
+    # Throughput: best of ``repeat`` uninstrumented runs.
+    elapsed = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in _events(chunks, decoder))
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    # Latency per event, including the chunk reads that complete it.
+    latencies = []
+    clock = time.perf_counter_ns
+    events = _events(chunks, decoder)
+    last = clock()
+    for _ in events:
+        now = clock()
+        latencies.append(now - last)
+        last = clock()
+    latencies.sort()
+
+    # Transient allocation per event: tracemalloc peak above the baseline
+    # while producing each event.
+    peaks = 0
+    events = _events(chunks, decoder)
+    tracemalloc.start()
+    try:
+        while True:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            try:
+                next(events)
+            except StopIteration:
+                break
+            peaks += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "events": count,
+        "events_per_s": count / elapsed,
+        "mb_per_s": size / elapsed / 1e6,
+        "p50_us": latencies[len(latencies) // 2] / 1e3,
+        "p99_us": latencies[int(len(latencies) * 0.99)] / 1e3,
+        "alloc_bytes_per_event": peaks / max(count, 1),
+    }
+
+
+def run(events: int, workloads: List[str], repeat: int) -> Dict[str, dict]:
+    results: Dict[str, dict] = {}
+    print(
+        f"{'workload':<26}{'events':>8}{'events/s':>12}{'MB/s':>9}"
+        f"{'p50 us':>9}{'p99 us':>9}{'alloc B/ev':>12}"
+    )
+    for name in workloads:
+        chunks = WORKLOADS[name](events)
+        for mode, decoder in DECODERS.items():
+            key = f"{name}/{mode}"
+            result = results[key] = measure(chunks, decoder, repeat)
+            print(
+                f"{key:<26}{result['events']:>8,}{result['events_per_s']:>12,.0f}"
+                f"{result['mb_per_s']:>9.1f}{result['p50_us']:>9.1f}"
+                f"{result['p99_us']:>9.1f}{result['alloc_bytes_per_event']:>12,.0f}"
+            )
+    return results
+
+
+def compare(
+    results: Dict[str, dict], baseline: Dict[str, dict], threshold: float
+) -> bool:
+    """Print regressions beyond ``threshold``; returns whether any were found."""
+    regressed = False
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, larger_is_worse in _COMPARED.items():
+            if not base.get(metric):
+                continue
+            value = result[metric]
+            change = value / base[metric] - 1
+            if (change if larger_is_worse else -change) > threshold:
+                regressed = True
+                print(
+                    f"REGRESSION {key} {metric}: {base[metric]:,.1f} -> "
+                    f"{value:,.1f} ({change:+.0%})"
+                )
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument(
+        "--workload",
+        action="append",
+        choices=sorted(WORKLOADS),
+        help="workload to run (repeatable); defaults to all",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        metavar="PATH",
+        help=f"write results as the baseline (default {DEFAULT_BASELINE})",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        metavar="PATH",
+        help="compare against a saved baseline and fail on regressions",
+    )
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = run(args.events, args.workload or list(WORKLOADS), args.repeat)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.save_baseline) or ".", exist_ok=True)
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "events": args.events,
+                    "python": sys.version.split()[0],
+                    "results": results,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("events") != args.events:
+            print(
+                f"Warning: baseline used --events {baseline.get('events')}, "
+                f"this run {args.events}"
+            )
+        if compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+SSE Replay Benchmark for Mix Python SDK
+
+Replays a stream recorded with `mix.streaming.stream_events(..., capture=path)`
+through `stream_events` and `stream_events_async`, so parser and decoder
+throughput can be compared across SDK versions on the exact same bytes.
+
+Usage:
+    python benchmarks/sse_replay_benchmark.py CAPTURE [--repeat 5] [--realtime]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from mix_python_sdk import Mix
+from mix_python_sdk.utils.ssecapture import load_capture, replay_transport
+
+
+def make_client(transport: httpx.MockTransport) -> Mix:
+    return Mix(
+        server_url="http://replay.local",
+        client=httpx.Client(transport=transport),
+        async_client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def replay_sync(mix: Mix) -> int:
+    res = mix.streaming.stream_events(session_id="replay")
+    with res.result as events:
+        return sum(1 for _ in events)
+
+
+async def replay_async(mix: Mix) -> int:
+    res = await mix.streaming.stream_events_async(session_id="replay")
+    count = 0
+    async with res.result as events:
+        async for _ in events:
+            count += 1
+    return count
+
+
+def run(path: str, repeat: int, realtime: bool) -> None:
+    capture = load_capture(path)
+    print(
+        f"Capture: {len(capture.chunks):,} chunks, {capture.size / 1e6:.2f} MB, "
+        f"recorded over {capture.duration:.2f} s"
+    )
+    mix = make_client(replay_transport(capture, realtime=realtime))
+
+    for label, replay in (
+        ("sync", lambda: replay_sync(mix)),
+        ("async", lambda: asyncio.run(replay_async(mix))),
+    ):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            events = replay()
+            timings.append(time.perf_counter() - start)
+        elapsed = statistics.median(timings)
+        if realtime:
+            print(
+                f"{label:>6}: {events:,} events in {elapsed:.3f} s "
+                f"({(elapsed - capture.duration) * 1000:+.1f} ms vs recording)"
+            )
+        else:
+            print(
+                f"{label:>6}: {events:,} events, median {elapsed * 1000:.1f} ms "
+                f"({events / elapsed:,.0f} events/s, "
+                f"{capture.size / elapsed / 1e6:.1f} MB/s)"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("capture", help="capture file to replay")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="replay with the recorded timing instead of as fast as possible",
+    )
+    args = parser.parse_args()
+    run(args.capture, args.repeat, args.realtime)
+
+
+if __name__ == "__main__":
+    main()
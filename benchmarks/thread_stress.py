@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Thread Stress Test for Mix Python SDK
+
+Runs many threads against a local stand-in server, started in a separate
+process so that it does not compete with the client for the GIL:
+
+- Lazy sub-SDK creation: all threads touch ``mix.sessions`` on a fresh client
+  at the same moment, and every thread must get the same instance.
+- Throughput: every thread sends ``--requests`` ``sessions.get`` calls, once
+  through a shared ``httpx.Client`` and once through a ``PerThreadClient``.
+  The server counts concurrent requests, which must stay within the
+  ``PerThreadClient`` limit.
+
+Exits non-zero on duplicate sub-SDKs, failed requests or an exceeded limit.
+
+Usage:
+    python benchmarks/thread_stress.py [--threads 64] [--requests 100]
+        [--max-connections 32] [--rounds 20]
+"""
+
+import argparse
+import json
+import multiprocessing
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Tuple
+
+import httpx
+
+from mix_python_sdk import Mix
+from mix_python_sdk.threadclient import PerThreadClient
+
+SESSION = {
+    "id": "session-1",
+    "title": "Stress session",
+    "browserMode": "local-browser-service",
+    "sessionType": "main",
+    "createdAt": "2025-01-15T10:30:00Z",
+    "assistantMessageCount": 0,
+    "userMessageCount": 0,
+    "toolCallCount": 0,
+    "promptTokens": 0,
+    "completionTokens": 0,
+    "cost": 0.0,
+    "workingDirectory": "/workspace",
+    "callbacks": [],
+}
+
+
+def serve(port_queue, peak) -> None:
+    """Stand-in server: answers every GET with a session, counting concurrency."""
+    body = json.dumps(SESSION).encode()
+    active = [0]
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this, delayed
+        # ACKs stall every keep-alive request by tens of milliseconds.
+        disable_nagle_algorithm = True
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            with lock:
+                active[0] += 1
+                if active[0] > peak.value:
+                    peak.value = active[0]
+            try:
+                time.sleep(0.001)  # Stand in for server-side work
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 1024
+        daemon_threads = True
+
+    server = Server(("127.0.0.1", 0), Handler)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def run_threads(count: int, target: Callable[[int], None]) -> float:
+    barrier = threading.Barrier(count)
+    threads = [
+        threading.Thread(target=lambda i=i: (barrier.wait(), target(i)))
+        for i in range(count)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def lazy_creation(url: str, threads: int, rounds: int) -> int:
+    """Rounds in which threads got different ``sessions`` instances."""
+    duplicates = 0
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads often to widen any race
+    try:
+        for _ in range(rounds):
+            mix = Mix(server_url=url)
+            seen: List[int] = []
+            run_threads(threads, lambda i: seen.append(id(mix.sessions)))
+            if len(set(seen)) != 1:
+                duplicates += 1
+    finally:
+        sys.setswitchinterval(interval)
+    return duplicates
+
+
+def throughput(
+    mix: Mix, threads: int, requests: int
+) -> Tuple[float, List[float], int]:
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def worker(_: int) -> None:
+        local = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            try:
+                mix.sessions.get(id="session-1")
+            except Exception:  # pylint: disable=broad-exception-caught
+                with lock:
+                    errors[0] += 1
+                continue
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    elapsed = run_threads(threads, worker)
+    return elapsed, latencies, errors[0]
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--max-connections", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    peak = multiprocessing.Value("i", 0)
+    ports: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(ports, peak), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{ports.get(timeout=10)}"
+    failed = False
+
+    duplicates = lazy_creation(url, args.threads, args.rounds)
+    print(
+        f"lazy sub-SDK creation: {args.rounds} rounds x {args.threads} threads, "
+        f"{duplicates} with duplicate instances"
+    )
+    failed |= duplicates > 0
+
+    total = args.threads * args.requests
+    clients = {
+        "shared": lambda: httpx.Client(
+            limits=httpx.Limits(max_connections=args.max_connections)
+        ),
+        "per-thread": lambda: PerThreadClient(args.max_connections),
+    }
+    for mode, make_client in clients.items():
+        with Mix(server_url=url, client=make_client()) as mix:
+            peak.value = 0
+            elapsed, latencies, errors = throughput(mix, args.threads, args.requests)
+            mix.sdk_configuration.client.close()
+        latencies = sorted(latencies) or [0.0]
+        p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+        print(
+            f"{mode:>10}: {total / elapsed:8,.0f} req/s  "
+            f"p50 {statistics.median(latencies) * 1000:6.2f} ms  "
+            f"p99 {p99 * 1000:6.2f} ms  errors {errors}  "
+            f"peak concurrency {peak.value}/{args.max_connections}"
+        )
+        failed |= errors > 0 or peak.value > args.max_connections
+
+    server.terminate()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -12,6 +12,7 @@ from mix_python_sdk.utils import (
     RetryConfig,
     SerializedRequestBody,
     get_body_content,
+    get_response_body_content,
     run_sync_in_thread,
 )
 from typing import Callable, List, Mapping, Optional, Tuple
@@ -272,7 +273,7 @@ class BaseSDK:
                 http_res.status_code,
                 http_res.url,
                 http_res.headers,
-                "<streaming response>" if stream else http_res.text,
+                get_response_body_content(http_res, stream),
             )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
@@ -350,7 +351,7 @@ class BaseSDK:
                 http_res.status_code,
                 http_res.url,
                 http_res.headers,
-                "<streaming response>" if stream else http_res.text,
+                get_response_body_content(http_res, stream),
             )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
@@ -0,0 +1,483 @@
+"""A load generator for Mix servers.
+
+Drives concurrent simulated users through the full life of a conversation:
+create a session, open its event stream, send messages and read each turn
+to ``complete``, then delete the session. Every operation is timed, as are
+the time to first token and the gaps between tokens, and the report gives
+percentiles for each along with event throughput and a breakdown of errors.
+
+Run it against any server, or against the local stand-in from
+:mod:`mix_python_sdk.fakeserver`::
+
+    python -m mix_python_sdk.bench --url http://localhost:8088 --users 50
+    python -m mix_python_sdk.bench --fake --fake-option tokens_per_second=50
+
+All users share one event loop and one client, so at high event rates the
+load generator itself can become the bottleneck; compare ``events/s`` with
+what the server sends, or split the load across several processes.
+"""
+
+import argparse
+import asyncio
+import collections
+import dataclasses
+import json
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from mix_python_sdk import Mix
+from mix_python_sdk.utils import BackoffStrategy, RetryConfig
+
+OPERATIONS = ("create_session", "open_stream", "send", "turn", "delete_session")
+
+_TOKEN_EVENTS = ("thinking", "content")
+
+_WORDS = (
+    "please summarise the attached report and list the three most important "
+    "findings with a short explanation of each one for the team"
+).split()
+
+
+@dataclass
+class LatencyStats:
+    """Latency percentiles of one operation, in milliseconds.
+
+    Attributes:
+        count: Successful samples
+        errors: Failed attempts
+    """
+
+    count: int = 0
+    errors: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @classmethod
+    def of(cls, samples: Sequence[float], errors: int = 0) -> "LatencyStats":
+        """Stats of ``samples`` given in seconds."""
+        if not samples:
+            return cls(errors=errors)
+        ordered = sorted(samples)
+        return cls(
+            count=len(ordered),
+            errors=errors,
+            mean_ms=sum(ordered) / len(ordered) * 1000,
+            p50_ms=_percentile(ordered, 50) * 1000,
+            p95_ms=_percentile(ordered, 95) * 1000,
+            p99_ms=_percentile(ordered, 99) * 1000,
+            max_ms=ordered[-1] * 1000,
+        )
+
+
+def _percentile(ordered: Sequence[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    rank = max(int(-(-len(ordered) * percent // 100)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class LoadReport:
+    """Results of a load run.
+
+    Attributes:
+        users: Concurrent simulated users
+        duration_s: Wall time of the run
+        operations: Latency of each operation in :data:`OPERATIONS`; ``turn``
+            runs from sending a message to its ``complete`` event
+        time_to_first_token: From sending a message to its first thinking or
+            content event
+        inter_token: Gaps between consecutive thinking or content events of
+            a turn
+        turns: Turns that reached ``complete``
+        events: Stream events received, heartbeats included
+        errors: Failures counted as ``"operation: kind"``
+    """
+
+    users: int
+    duration_s: float
+    operations: Dict[str, LatencyStats]
+    time_to_first_token: LatencyStats
+    inter_token: LatencyStats
+    turns: int = 0
+    events: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.duration_s if self.duration_s else 0.0
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.duration_s if self.duration_s else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The report as JSON-serialisable data."""
+        data = dataclasses.asdict(self)
+        data["events_per_second"] = self.events_per_second
+        data["turns_per_second"] = self.turns_per_second
+        return data
+
+    def format(self) -> str:
+        """The report as a text table."""
+        lines = [
+            f"{self.users} users, {self.turns} turns in {self.duration_s:.1f} s: "
+            f"{self.turns_per_second:,.2f} turns/s, "
+            f"{self.events_per_second:,.0f} events/s",
+            "",
+            f"{'':<22}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}"
+            f"{'p99 ms':>10}{'max ms':>10}",
+        ]
+        rows = list(self.operations.items()) + [
+            ("time to first token", self.time_to_first_token),
+            ("inter-token", self.inter_token),
+        ]
+        for name, stats in rows:
+            lines.append(
+                f"{name:<22}{stats.count:>8}{stats.errors:>8}{stats.p50_ms:>10.1f}"
+                f"{stats.p95_ms:>10.1f}{stats.p99_ms:>10.1f}{stats.max_ms:>10.1f}"
+            )
+        if self.errors:
+            lines += ["", "errors:"]
+            for kind, count in sorted(self.errors.items(), key=lambda e: -e[1]):
+                lines.append(f"  {kind:<52}{count:>8}")
+        return "\n".join(lines)
+
+
+class _TurnFailed(Exception):
+    pass
+
+
+class _Recorder:
+    """Samples and errors gathered by all users."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {name: [] for name in OPERATIONS}
+        self.failures: Dict[str, int] = collections.Counter()
+        self.errors: Dict[str, int] = collections.Counter()
+        self.first_token: List[float] = []
+        self.gaps: List[float] = []
+        self.events = 0
+
+    def fail(self, operation: str, kind: str) -> None:
+        self.failures[operation] += 1
+        self.errors[f"{operation}: {kind}"] += 1
+
+    async def timed(self, operation: str, awaitable):
+        started = time.perf_counter()
+        try:
+            result = await awaitable
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.fail(operation, _kind(exc))
+            raise _TurnFailed() from exc
+        self.samples[operation].append(time.perf_counter() - started)
+        return result
+
+
+def _kind(exc: BaseException) -> str:
+    """A short label for a failure, with the HTTP status if there is one."""
+    status = getattr(exc, "status_code", None)
+    if status is None and isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+    return f"{type(exc).__name__} {status}" if status else type(exc).__name__
+
+
+@dataclass
+class _Plan:
+    iterations: Optional[int]
+    deadline: Optional[float]
+    turns: int
+    think_time: float
+    prompt_words: Tuple[int, int]
+    timeout: float
+
+
+async def _read_turn(events, recorder: _Recorder, sent: float) -> None:
+    """Read one turn's events up to ``complete``."""
+    last_token: Optional[float] = None
+    async for event in events:
+        now = time.perf_counter()
+        recorder.events += 1
+        if event.event in _TOKEN_EVENTS:
+            if last_token is None:
+                recorder.first_token.append(now - sent)
+            else:
+                recorder.gaps.append(now - last_token)
+            last_token = now
+        elif event.event == "complete":
+            return
+        elif event.event == "error":
+            raise _TurnFailed("error event")
+    raise _TurnFailed("stream ended")
+
+
+async def _turn(mix: Mix, session_id: str, events, recorder, plan, rng) -> None:
+    words = rng.randint(*plan.prompt_words)
+    prompt = " ".join(rng.choice(_WORDS) for _ in range(words))
+    started = time.perf_counter()
+    await recorder.timed("send", mix.messages.send_async(id=session_id, text=prompt))
+    try:
+        await asyncio.wait_for(
+            _read_turn(events, recorder, started), timeout=plan.timeout
+        )
+    except _TurnFailed as exc:
+        recorder.fail("turn", str(exc))
+        raise
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        recorder.fail("turn", _kind(exc))
+        raise _TurnFailed() from exc
+    recorder.samples["turn"].append(time.perf_counter() - started)
+
+
+async def _think(plan: _Plan, rng: random.Random) -> None:
+    if plan.think_time > 0:
+        await asyncio.sleep(plan.think_time * rng.uniform(0.5, 1.5))
+
+
+async def _user(mix: Mix, recorder: _Recorder, plan: _Plan, seed: int) -> None:
+    rng = random.Random(seed)
+    iteration = 0
+    while (plan.iterations is None or iteration < plan.iterations) and (
+        plan.deadline is None or time.perf_counter() < plan.deadline
+    ):
+        iteration += 1
+        try:
+            session = await recorder.timed(
+                "create_session",
+                mix.sessions.create_async(
+                    title="Load test", browser_mode="local-browser-service"
+                ),
+            )
+        except _TurnFailed:
+            await _think(plan, rng)
+            continue
+        try:
+            response = await recorder.timed(
+                "open_stream",
+                mix.streaming.stream_events_async(session_id=session.id),
+            )
+            async with response.result as events:
+                for turn in range(plan.turns):
+                    if turn:
+                        await _think(plan, rng)
+                    await _turn(mix, session.id, events, recorder, plan, rng)
+        except _TurnFailed:
+            pass
+        try:
+            await recorder.timed(
+                "delete_session", mix.sessions.delete_async(id=session.id)
+            )
+        except _TurnFailed:
+            pass
+        await _think(plan, rng)
+
+
+async def run_load(
+    mix: Mix,
+    *,
+    users: int = 10,
+    iterations: Optional[int] = 1,
+    duration: Optional[float] = None,
+    turns: int = 1,
+    think_time: float = 1.0,
+    prompt_words: Tuple[int, int] = (50, 50),
+    ramp_up: float = 0.0,
+    timeout: float = 120.0,
+    seed: Optional[int] = None,
+) -> LoadReport:
+    """Run simulated users against the server of ``mix``.
+
+    Each user repeats: create a session, open its stream, send ``turns``
+    messages reading each to ``complete``, delete the session. A failed step
+    ends the iteration; the session is still deleted.
+
+    Args:
+        mix: Client to send the load with
+        users: Concurrent users
+        iterations: Sessions per user; None to run until ``duration``
+        duration: Seconds after which users start no new sessions
+        turns: Messages per session
+        think_time: Mean pause in seconds between turns and sessions; each
+            pause is drawn from 0.5 to 1.5 times this
+        prompt_words: Inclusive range of words per message
+        ramp_up: Seconds over which user starts are spread
+        timeout: Seconds a turn may take before counting as failed
+        seed: Seed for prompts and think times
+
+    Returns:
+        The load report
+    """
+    if iterations is None and duration is None:
+        raise ValueError("iterations or duration is required")
+    recorder = _Recorder()
+    started = time.perf_counter()
+    plan = _Plan(
+        iterations=iterations,
+        deadline=started + duration if duration is not None else None,
+        turns=turns,
+        think_time=think_time,
+        prompt_words=prompt_words,
+        timeout=timeout,
+    )
+    seeds = random.Random(seed)
+
+    async def user(index: int, user_seed: int) -> None:
+        if ramp_up > 0:
+            await asyncio.sleep(ramp_up * index / users)
+        await _user(mix, recorder, plan, user_seed)
+
+    await asyncio.gather(
+        *(user(index, seeds.getrandbits(32)) for index in range(users))
+    )
+    return LoadReport(
+        users=users,
+        duration_s=time.perf_counter() - started,
+        operations={
+            name: LatencyStats.of(recorder.samples[name], recorder.failures[name])
+            for name in OPERATIONS
+        },
+        time_to_first_token=LatencyStats.of(recorder.first_token),
+        inter_token=LatencyStats.of(recorder.gaps),
+        turns=len(recorder.samples["turn"]),
+        events=recorder.events,
+        errors=dict(recorder.errors),
+    )
+
+
+def _word_range(value: str) -> Tuple[int, int]:
+    low, _, high = value.partition("-")
+    words = (int(low), int(high or low))
+    if words[0] < 1 or words[1] < words[0]:
+        raise argparse.ArgumentTypeError("expected WORDS or MIN-MAX, at least 1")
+    return words
+
+
+def _start_fake(options: List[str]) -> Tuple[subprocess.Popen, str]:
+    """Start the stand-in server in its own process; returns it and its URL."""
+    command = [sys.executable, "-m", "mix_python_sdk.fakeserver", "--port", "0"]
+    for option in options:
+        name, sep, value = option.partition("=")
+        if not sep:
+            raise SystemExit(f"--fake-option expects NAME=VALUE, got {option!r}")
+        command += ["--" + name.replace("_", "-"), value]
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        command, stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline() if process.stdout else ""
+    if "http://" not in line:
+        process.kill()
+        raise SystemExit("the fake server did not start")
+    return process, line[line.index("http://") :].strip()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a load test from the command line; returns the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m mix_python_sdk.bench",
+        description="Drive simulated users against a Mix server and report "
+        "latency percentiles, time to first token and throughput.",
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Server to load")
+    target.add_argument(
+        "--fake",
+        action="store_true",
+        help="Start the local stand-in server in a separate process",
+    )
+    parser.add_argument(
+        "--fake-option",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Stand-in server setting, such as tokens_per_second=50 (repeatable)",
+    )
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument(
+        "--iterations", type=int, default=1, help="Sessions per user"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        help="Run for this many seconds instead of a set number of iterations",
+    )
+    parser.add_argument("--turns", type=int, default=1, help="Messages per session")
+    parser.add_argument(
+        "--think-time", type=float, default=1.0, help="Mean pause in seconds"
+    )
+    parser.add_argument(
+        "--prompt-words",
+        type=_word_range,
+        default=(50, 50),
+        metavar="WORDS|MIN-MAX",
+    )
+    parser.add_argument("--ramp-up", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument(
+        "--no-retries",
+        action="store_true",
+        help="Count every failed request instead of retrying it",
+    )
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", metavar="PATH", help="Also write the report here")
+    args = parser.parse_args(argv)
+
+    server = None
+    url = args.url
+    if args.fake:
+        server, url = _start_fake(args.fake_option)
+    try:
+        report = asyncio.run(_run(url, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"Mix load test against {url}")
+    print(report.format())
+    if args.json:
+        data = {"url": url, "options": _options(args), "report": report.to_dict()}
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    return 1 if report.turns == 0 else 0
+
+
+async def _run(url: str, args: argparse.Namespace) -> LoadReport:
+    # Every user holds a stream open while it sends.
+    limits = httpx.Limits(max_connections=args.users * 2)
+    options: Dict[str, Any] = {}
+    if args.no_retries:
+        options["retry_config"] = RetryConfig(
+            "none", BackoffStrategy(0, 0, 1, 0), False
+        )
+    async with httpx.AsyncClient(limits=limits, timeout=args.timeout) as client:
+        mix = Mix(server_url=url, async_client=client, **options)
+        return await run_load(
+            mix,
+            users=args.users,
+            iterations=None if args.duration else args.iterations,
+            duration=args.duration,
+            turns=args.turns,
+            think_time=args.think_time,
+            prompt_words=args.prompt_words,
+            ramp_up=args.ramp_up,
+            timeout=args.timeout,
+            seed=args.seed,
+        )
+
+
+def _options(args: argparse.Namespace) -> Dict[str, Any]:
+    options = dict(vars(args))
+    options["prompt_words"] = list(args.prompt_words)
+    return options
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,530 @@
+"""Routing requests across several Mix servers.
+
+Pass a list of server URLs to :class:`~mix_python_sdk.sdk.Mix` and its HTTP
+clients are wrapped so that every request goes to the healthiest server. An
+:class:`EndpointRouter` probes each server in the background with
+``system.get_health`` and ``health.get_o_auth_health`` and keeps an
+exponentially weighted moving average (EWMA) of latency and error rate per
+server, fed by the probes and by regular traffic. Requests that fail to
+connect are retried on the next server.
+
+A session lives on the server that created it, so every request for a session
+ID, including its event stream, goes to that server and is never failed over.
+A session the router has not seen, created by another client or dropped from
+the affinity cache, is looked up by trying each server until one answers
+with something other than 404, and is pinned once a server answers with 2xx.
+If every server answers 404, the last response is returned and the SDK raises
+its usual error for it.
+
+Permission and notification answers are addressed by their own ID, which only
+the server running the session knows, so they are searched the same way but
+never pinned. Token refreshes are sent to every server, since each server
+holds its own OAuth tokens.
+
+Example:
+    ```python
+    with Mix(server_url=["http://mix-a:8088", "http://mix-b:8088"]) as mix:
+        session = mix.sessions.create(title="Support", browser_mode=...)
+        mix.messages.send(id=session.id, text="Hello")  # same server
+        print(mix.endpoints.stats())
+    ```
+"""
+
+import collections
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, OrderedDict, Sequence, Tuple
+
+import httpx
+
+from mix_python_sdk.httpclient import AsyncHttpClient, HttpClient
+from mix_python_sdk.utils import remove_suffix
+
+_SESSION_PATH = re.compile(r"/api/sessions/([^/?#]+)")
+# Answers to a session's permission requests and notifications.
+_SESSION_REPLY_PATH = re.compile(r"/api/(?:permissions|notifications)/[^/?#]+/")
+# Requests every server has to see.
+_BROADCAST_PATHS = frozenset({"/internal/auth/refresh-tokens"})
+
+# Weight of the error rate in an endpoint's score.
+_ERROR_PENALTY = 4.0
+
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+@dataclass
+class EndpointStats:
+    """Health of one server, as seen by an :class:`EndpointRouter`.
+
+    Attributes:
+        url: Server URL
+        healthy: Whether new sessions are routed to this server
+        latency: EWMA of response time in seconds, None before the first one
+        error_rate: EWMA of failed requests and probes, from 0 to 1
+        oauth_status: Overall status from the last OAuth health probe
+        sessions: Sessions pinned to this server
+        probed_at: ``time.time()`` of the last probe
+    """
+
+    url: str
+    healthy: bool
+    latency: Optional[float]
+    error_rate: float
+    oauth_status: Optional[str]
+    sessions: int
+    probed_at: Optional[float]
+
+
+class _Endpoint:
+    __slots__ = (
+        "base",
+        "latency",
+        "error_rate",
+        "down",
+        "oauth_status",
+        "sessions",
+        "probed_at",
+    )
+
+    def __init__(self, base: str):
+        self.base = base
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.down = False
+        self.oauth_status: Optional[str] = None
+        self.sessions = 0
+        self.probed_at: Optional[float] = None
+
+
+class _Route:
+    __slots__ = ("suffix", "session_id", "candidates", "searching", "broadcast")
+
+    def __init__(
+        self,
+        suffix: str,
+        session_id: Optional[str],
+        candidates: List[_Endpoint],
+        searching: bool = False,
+        broadcast: bool = False,
+    ):
+        self.suffix = suffix
+        self.session_id = session_id
+        self.candidates = candidates
+        # A session with no pin: a 404 means "try the next server".
+        self.searching = searching
+        # Sent to every candidate; the first failure, or else the first
+        # response, is returned.
+        self.broadcast = broadcast
+
+    def next_on(self, response: httpx.Response, endpoint: _Endpoint) -> bool:
+        return (
+            self.searching
+            and response.status_code == 404
+            and endpoint is not self.candidates[-1]
+        )
+
+    def keep(
+        self, kept: Optional[httpx.Response], response: httpx.Response
+    ) -> Tuple[httpx.Response, Optional[httpx.Response]]:
+        if kept is None or (kept.is_success and not response.is_success):
+            return response, kept
+        return kept, response
+
+
+class EndpointRouter:
+    """Picks a server for each request and tracks the health of each server.
+
+    An endpoint is unhealthy after a connection failure, until a probe
+    succeeds again, or while its error rate is above ``max_error_rate``.
+    Requests not tied to a known session go to the healthy endpoint with the
+    lowest latency, weighted by error rate; if no endpoint is healthy, all
+    are tried.
+
+    Args:
+        urls: Server URLs; the first one is what the SDK builds requests for
+        alpha: Weight of the newest sample in the moving averages
+        probe_interval: Seconds between background probes
+        probe_timeout: Timeout of each probe request in seconds
+        max_error_rate: Error rate above which an endpoint is unhealthy
+        affinity_size: Number of session-to-server pins kept
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        *,
+        alpha: float = 0.3,
+        probe_interval: float = 5.0,
+        probe_timeout: float = 2.0,
+        max_error_rate: float = 0.5,
+        affinity_size: int = 100_000,
+    ):
+        if not urls:
+            raise ValueError("at least one server URL is required")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.max_error_rate = max_error_rate
+        self.affinity_size = affinity_size
+        self._endpoints = [_Endpoint(remove_suffix(url, "/")) for url in urls]
+        # Longest first, so a base that is a prefix of another never shadows it.
+        self._by_base = sorted(
+            self._endpoints, key=lambda endpoint: len(endpoint.base), reverse=True
+        )
+        self._affinity: OrderedDict[str, _Endpoint] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def primary(self) -> str:
+        """The URL the SDK builds requests for before they are routed."""
+        return self._endpoints[0].base
+
+    def stats(self) -> List[EndpointStats]:
+        """Health of every endpoint, in the order they were given."""
+        with self._lock:
+            return [
+                EndpointStats(
+                    url=endpoint.base,
+                    healthy=self._healthy(endpoint),
+                    latency=endpoint.latency,
+                    error_rate=endpoint.error_rate,
+                    oauth_status=endpoint.oauth_status,
+                    sessions=endpoint.sessions,
+                    probed_at=endpoint.probed_at,
+                )
+                for endpoint in self._endpoints
+            ]
+
+    def endpoint_for(self, session_id: str) -> Optional[str]:
+        """The URL of the server a session is pinned to, if any."""
+        endpoint = self._affinity.get(session_id)
+        return endpoint.base if endpoint is not None else None
+
+    def pin(self, session_id: str, url: str) -> None:
+        """Route a session created elsewhere to the server at ``url``."""
+        base = remove_suffix(url, "/")
+        for endpoint in self._endpoints:
+            if endpoint.base == base:
+                with self._lock:
+                    self._bind(session_id, endpoint)
+                return
+        raise ValueError(f"Unknown endpoint {url!r}")
+
+    def start(self, mix) -> None:
+        """Start probing the endpoints through ``mix`` on a daemon thread.
+
+        The thread holds only a weak reference to ``mix`` and exits once it is
+        garbage collected or :meth:`stop` is called.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(weakref.ref(mix),),
+            name="mix-endpoint-probe",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the probe thread."""
+        thread, self._thread = self._thread, None
+        self._stopped.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.probe_timeout * 2 * len(self._endpoints))
+
+    def __reduce__(self):
+        # Health and session pins are local to this process; only the
+        # configuration travels.
+        options = {
+            "alpha": self.alpha,
+            "probe_interval": self.probe_interval,
+            "probe_timeout": self.probe_timeout,
+            "max_error_rate": self.max_error_rate,
+            "affinity_size": self.affinity_size,
+        }
+        urls = [endpoint.base for endpoint in self._endpoints]
+        return (_restore_router, (urls, options))
+
+    def _after_fork(self) -> None:
+        # Locks may have been held by threads that do not exist in the child.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def probe(self, mix) -> None:
+        """Probe every endpoint once, from the calling thread."""
+        timeout_ms = int(self.probe_timeout * 1000)
+        self._local.pinned = True
+        try:
+            for endpoint in self._endpoints:
+                self._probe(mix, endpoint, timeout_ms)
+        finally:
+            self._local.pinned = False
+
+    def _probe(self, mix, endpoint: _Endpoint, timeout_ms: int) -> None:
+        started = time.perf_counter()
+        try:
+            health = mix.system.get_health(
+                server_url=endpoint.base, retries=None, timeout_ms=timeout_ms
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            with self._lock:
+                endpoint.down = True
+                endpoint.probed_at = time.time()
+                self._sample(endpoint, None, 1.0)
+            return
+        latency = time.perf_counter() - started
+        error = 1.0 if health.status in ("unhealthy", "error") else 0.0
+        oauth_status: Optional[str] = None
+        try:
+            oauth_status = mix.health.get_o_auth_health(
+                server_url=endpoint.base, retries=None, timeout_ms=timeout_ms
+            ).status
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+        if oauth_status == "unhealthy":
+            error = 1.0
+        elif oauth_status == "degraded":
+            error = max(error, 0.5)
+        with self._lock:
+            endpoint.down = False
+            endpoint.oauth_status = oauth_status
+            endpoint.probed_at = time.time()
+            self._sample(endpoint, latency, error)
+
+    def _run(self, mix_ref: "weakref.ref[Any]") -> None:
+        while not self._stopped.is_set():
+            mix = mix_ref()
+            if mix is None:
+                return
+            try:
+                self.probe(mix)
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+            del mix
+            self._stopped.wait(self.probe_interval)
+
+    def _healthy(self, endpoint: _Endpoint) -> bool:
+        return not endpoint.down and endpoint.error_rate <= self.max_error_rate
+
+    def _score(self, endpoint: _Endpoint) -> Tuple[bool, float]:
+        latency = endpoint.latency or 0.0
+        return (
+            not self._healthy(endpoint),
+            latency * (1 + _ERROR_PENALTY * endpoint.error_rate),
+        )
+
+    def _sample(
+        self, endpoint: _Endpoint, latency: Optional[float], error: float
+    ) -> None:
+        alpha = self.alpha
+        if latency is not None:
+            if endpoint.latency is None:
+                endpoint.latency = latency
+            else:
+                endpoint.latency += alpha * (latency - endpoint.latency)
+        endpoint.error_rate += alpha * (error - endpoint.error_rate)
+
+    def _bind(self, session_id: str, endpoint: _Endpoint) -> None:
+        previous = self._affinity.pop(session_id, None)
+        if previous is not None:
+            previous.sessions -= 1
+        self._affinity[session_id] = endpoint
+        endpoint.sessions += 1
+        if len(self._affinity) > self.affinity_size:
+            _, evicted = self._affinity.popitem(last=False)
+            evicted.sessions -= 1
+
+    def _route(self, request: httpx.Request) -> Optional[_Route]:
+        if getattr(self._local, "pinned", False):
+            return None
+        url = str(request.url)
+        for endpoint in self._by_base:
+            base = endpoint.base
+            if url.startswith(base) and url[len(base) : len(base) + 1] in ("/", "?"):
+                break
+        else:
+            return None
+        suffix = url[len(base) :]
+        path = suffix.split("?", 1)[0]
+        if path in _BROADCAST_PATHS:
+            return _Route(suffix, None, list(self._endpoints), broadcast=True)
+        session_id: Optional[str] = None
+        match = _SESSION_PATH.match(suffix)
+        if match is not None:
+            session_id = match.group(1)
+        elif suffix.startswith(("/stream?", "/stream/")) or suffix == "/stream":
+            session_id = request.url.params.get("sessionId")
+        with self._lock:
+            if session_id is not None:
+                pinned = self._affinity.get(session_id)
+                if pinned is not None:
+                    self._affinity.move_to_end(session_id)
+                    return _Route(suffix, session_id, [pinned])
+            candidates = sorted(self._endpoints, key=self._score)
+        searching = session_id is not None or bool(_SESSION_REPLY_PATH.match(path))
+        return _Route(suffix, session_id, candidates, searching)
+
+    def _retarget(
+        self, request: httpx.Request, route: _Route, endpoint: _Endpoint
+    ) -> None:
+        request.url = httpx.URL(endpoint.base + route.suffix)
+        request.headers["Host"] = request.url.netloc.decode("ascii")
+
+    def _failed(self, endpoint: _Endpoint) -> None:
+        with self._lock:
+            endpoint.down = True
+            self._sample(endpoint, None, 1.0)
+
+    def _completed(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        route: _Route,
+        endpoint: _Endpoint,
+        elapsed: float,
+    ) -> None:
+        created: Optional[str] = None
+        if (
+            response.status_code == 201
+            and request.method == "POST"
+            and route.suffix.split("?", 1)[0] == "/api/sessions"
+        ):
+            try:
+                response.read()
+                created = response.json().get("id")
+            except Exception:  # pylint: disable=broad-exception-caught
+                created = None
+        with self._lock:
+            error = 1.0 if response.status_code >= 500 else 0.0
+            self._sample(endpoint, elapsed, error)
+            if created is not None:
+                self._bind(created, endpoint)
+            elif (
+                route.searching
+                and route.session_id is not None
+                and 200 <= response.status_code < 300
+            ):
+                self._bind(route.session_id, endpoint)
+
+
+def _restore_router(urls: List[str], options: Dict[str, Any]) -> EndpointRouter:
+    return EndpointRouter(urls, **options)
+
+
+class FailoverClient(HttpClient):
+    """Sends each request through an :class:`EndpointRouter`.
+
+    Args:
+        client: The client that sends the routed requests
+        router: Router that picks the server
+    """
+
+    def __init__(self, client: HttpClient, router: EndpointRouter):
+        self.client = client
+        self.router = router
+
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        router = self.router
+        route = router._route(request)  # pylint: disable=protected-access
+        if route is None:
+            return self.client.send(request, **kwargs)
+        error: Optional[BaseException] = None
+        kept: Optional[httpx.Response] = None
+        for endpoint in route.candidates:
+            router._retarget(request, route, endpoint)  # pylint: disable=protected-access
+            started = time.perf_counter()
+            try:
+                response = self.client.send(request, **kwargs)
+            except _CONNECT_ERRORS as e:
+                router._failed(endpoint)  # pylint: disable=protected-access
+                error = e
+                continue
+            # pylint: disable-next=protected-access
+            router._completed(
+                request, response, route, endpoint, time.perf_counter() - started
+            )
+            if route.broadcast:
+                kept, dropped = route.keep(kept, response)
+                if dropped is not None:
+                    dropped.close()
+                continue
+            if route.next_on(response, endpoint):
+                response.close()
+                continue
+            return response
+        if kept is not None:
+            return kept
+        assert error is not None
+        raise error
+
+    def build_request(self, *args, **kwargs) -> httpx.Request:
+        return self.client.build_request(*args, **kwargs)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AsyncFailoverClient(AsyncHttpClient):
+    """Sends each request through an :class:`EndpointRouter`.
+
+    Args:
+        client: The client that sends the routed requests
+        router: Router that picks the server
+    """
+
+    def __init__(self, client: AsyncHttpClient, router: EndpointRouter):
+        self.client = client
+        self.router = router
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        router = self.router
+        route = router._route(request)  # pylint: disable=protected-access
+        if route is None:
+            return await self.client.send(request, **kwargs)
+        error: Optional[BaseException] = None
+        kept: Optional[httpx.Response] = None
+        for endpoint in route.candidates:
+            router._retarget(request, route, endpoint)  # pylint: disable=protected-access
+            started = time.perf_counter()
+            try:
+                response = await self.client.send(request, **kwargs)
+            except _CONNECT_ERRORS as e:
+                router._failed(endpoint)  # pylint: disable=protected-access
+                error = e
+                continue
+            elapsed = time.perf_counter() - started
+            if response.status_code == 201 and request.method == "POST":
+                await response.aread()
+            # pylint: disable-next=protected-access
+            router._completed(request, response, route, endpoint, elapsed)
+            if route.broadcast:
+                kept, dropped = route.keep(kept, response)
+                if dropped is not None:
+                    await dropped.aclose()
+                continue
+            if route.next_on(response, endpoint):
+                await response.aclose()
+                continue
+            return response
+        if kept is not None:
+            return kept
+        assert error is not None
+        raise error
+
+    def build_request(self, *args, **kwargs) -> httpx.Request:
+        return self.client.build_request(*args, **kwargs)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
     from .mixdefaulterror import MixDefaultError
     from .no_response_error import NoResponseError
     from .responsevalidationerror import ResponseValidationError
+    from .streamoverflowerror import StreamOverflowError
+    from .streamstallederror import StreamStalledError
 
 __all__ = [
     "ErrorResponse",
@@ -19,6 +21,8 @@ __all__ = [
     "MixError",
     "NoResponseError",
     "ResponseValidationError",
+    "StreamOverflowError",
+    "StreamStalledError",
 ]
 
 _dynamic_imports: dict[str, str] = {
@@ -27,6 +31,8 @@ _dynamic_imports: dict[str, str] = {
     "MixDefaultError": ".mixdefaulterror",
     "NoResponseError": ".no_response_error",
     "ResponseValidationError": ".responsevalidationerror",
+    "StreamOverflowError": ".streamoverflowerror",
+    "StreamStalledError": ".streamstallederror",
 }
 
 
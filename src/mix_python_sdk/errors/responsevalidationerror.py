@@ -1,7 +1,7 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 import httpx
-from typing import Optional
+from typing import Optional, Union
 from dataclasses import dataclass
 
 from mix_python_sdk.errors import MixError
@@ -16,10 +16,28 @@ class ResponseValidationError(MixError):
         message: str,
         raw_response: httpx.Response,
         cause: Exception,
-        body: Optional[str] = None,
+        body: Optional[Union[str, bytes]] = None,
     ):
         message = f"{message}: {cause}"
-        super().__init__(message, raw_response, body)
+        object.__setattr__(self, "message", message)
+        object.__setattr__(self, "status_code", raw_response.status_code)
+        object.__setattr__(self, "headers", raw_response.headers)
+        object.__setattr__(self, "raw_response", raw_response)
+        # Responses are decoded from bytes, so the text form is only built
+        # when someone actually reads it.
+        object.__setattr__(self, "_body", body)
+
+    @property  # type: ignore[override]
+    def body(self) -> str:
+        body = self.__dict__["_body"]
+        if isinstance(body, str):
+            return body
+        if body is None:
+            text = self.raw_response.text
+        else:
+            text = body.decode(self.raw_response.encoding or "utf-8", "replace")
+        object.__setattr__(self, "_body", text)
+        return text
 
     @property
     def cause(self):
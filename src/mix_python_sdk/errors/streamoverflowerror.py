@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(unsafe_hash=True)
+class StreamOverflowError(Exception):
+    """Error raised when a stream consumer falls too far behind its producer."""
+
+    message: str
+
+    def __init__(self, message: str = "Stream consumer fell behind"):
+        object.__setattr__(self, "message", message)
+        super().__init__(message)
+
+    def __str__(self):
+        return self.message
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(unsafe_hash=True)
+class StreamStalledError(Exception):
+    """Error raised when an event stream stops receiving data, heartbeats included."""
+
+    message: str
+
+    def __init__(self, message: str = "Event stream stalled"):
+        object.__setattr__(self, "message", message)
+        super().__init__(message)
+
+    def __str__(self):
+        return self.message
@@ -0,0 +1,1038 @@
+"""A local stand-in for the Mix server, for load tests and benchmarks.
+
+:class:`FakeMixServer` keeps sessions, messages and files in memory and
+answers the REST and SSE endpoints used by ``Sessions``, ``Messages``,
+``Streaming``, ``Files``, ``Permissions``, ``Notifications``, ``System``,
+``Health`` and the token calls of ``Authentication``. Every message starts a
+simulated turn: the user message, thinking, tool calls and content are
+streamed at a configurable token rate and end with ``complete``. Response
+latency, failed requests, failed turns and dropped streams are injected with
+configurable probabilities, from a seeded random source, so performance
+features can be measured reproducibly on a laptop, without a real server or
+model provider.
+
+The server runs in-process behind an ``httpx.MockTransport`` or as a local
+HTTP server on a background thread.
+
+Example:
+    ```python
+    from mix_python_sdk import Mix
+    from mix_python_sdk.fakeserver import FakeMixServer
+
+    fake = FakeMixServer(tokens_per_second=50, error_rate=0.01, seed=1)
+
+    mix = fake.mix()  # In-process
+    mix = Mix(server_url=fake.serve())  # Over a local socket
+
+    session = mix.sessions.create(
+        title="Load test", browser_mode="local-browser-service"
+    )
+    ```
+
+It can also be started from the command line::
+
+    python -m mix_python_sdk.fakeserver --port 8088 --tokens-per-second 50
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import itertools
+import json
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import httpx
+
+_WORDS = (
+    "the quick brown fox jumps over a lazy dog while streaming tokens from "
+    "an imaginary model to measure how fast the client keeps up"
+).split()
+
+
+@dataclass
+class FakeServerConfig:
+    """How the fake server behaves; may be changed while it is running.
+
+    Attributes:
+        latency: Seconds before every response starts
+        jitter: Up to this many seconds added to ``latency`` at random
+        error_rate: Probability that a request fails with ``error_status``
+        error_status: Status of injected failures
+        first_token_latency: Seconds from accepting a message to its first token
+        prompt_tokens_per_second: Prompt processing rate; each prompt token
+            adds ``1 / rate`` seconds to the first-token latency, 0 disables
+        tokens_per_second: Rate at which thinking and content tokens stream
+        tokens_per_event: Tokens carried by each thinking or content event
+        thinking_tokens: Thinking tokens per turn
+        response_tokens: Content tokens per turn
+        tool_calls: Tool calls per turn, made between thinking and content
+        tool_duration: Seconds each tool call takes to execute
+        turn_error_rate: Probability that a turn ends with an ``error`` event
+            instead of ``complete``
+        disconnect_rate: Probability that a stream is dropped before each event
+        heartbeat_interval: Seconds without events before a heartbeat is sent
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    first_token_latency: float = 0.2
+    prompt_tokens_per_second: float = 0.0
+    tokens_per_second: float = 100.0
+    tokens_per_event: int = 1
+    thinking_tokens: int = 0
+    response_tokens: int = 50
+    tool_calls: int = 0
+    tool_duration: float = 0.1
+    turn_error_rate: float = 0.0
+    disconnect_rate: float = 0.0
+    heartbeat_interval: float = 15.0
+
+
+@dataclass
+class FakeServerStats:
+    """Counters since the server was created or last reset.
+
+    Attributes:
+        requests: Requests received, by method and route
+        errors: Requests failed on purpose (``error_rate``)
+        turns: Turns started by sent messages
+        failed_turns: Turns ended with an ``error`` event (``turn_error_rate``)
+        disconnects: Streams dropped on purpose (``disconnect_rate``)
+        events: SSE events sent, heartbeats included
+        streams: Streams open right now
+    """
+
+    requests: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+    turns: int = 0
+    failed_turns: int = 0
+    disconnects: int = 0
+    events: int = 0
+    streams: int = 0
+
+
+class _Entry(NamedTuple):
+    due: float
+    id: int
+    chunk: bytes
+
+
+class _Log:
+    """A session's events in the order they are due, and their readers."""
+
+    def __init__(self):
+        self.entries: List[_Entry] = []
+        self.last_id = 0
+        self.closed = False
+        # Bumped on every change so that readers waiting for an entry's due
+        # time wake up when a new turn is scheduled or a turn is cancelled.
+        self.version = 0
+        self.cond = threading.Condition()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def changed(self) -> None:
+        """Wake every reader; call with ``cond`` held."""
+        self.version += 1
+        self.cond.notify_all()
+        waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def wait(self, version: int, timeout: float) -> None:
+        with self.cond:
+            if self.version == version:
+                self.cond.wait(timeout)
+
+    async def wait_async(self, version: int, timeout: float) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self.cond:
+            if self.version != version:
+                return
+            waiter = (loop, future)
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait([future], timeout=timeout)
+        finally:
+            # A reader that timed out or was cancelled must not be woken
+            # later, when its loop may already be closed.
+            with self.cond:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _EventStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """A session's SSE body, sent as the log's entries fall due."""
+
+    def __init__(
+        self, server: "FakeMixServer", session_id: str, log: _Log, position: int
+    ):
+        self._server = server
+        self._session_id = session_id
+        self._log = log
+        self._position = position
+        # Ids are given out when a turn is scheduled, so the id carried by
+        # ``connected`` and heartbeats is that of the last event sent, never
+        # one still to come, and a reconnect resumes in the right place.
+        self._last_id = log.entries[position - 1].id if position else 0
+        self._last_sent = time.monotonic()
+        self._closed = False
+
+    def _step(self) -> Tuple[Optional[bytes], float, int]:
+        """The next chunk, or how long to wait for one (negative: the end)."""
+        log = self._log
+        interval = self._server.config.heartbeat_interval
+        now = time.monotonic()
+        with log.cond:
+            if log.closed:
+                return None, -1.0, log.version
+            wait = interval
+            if self._position < len(log.entries):
+                entry = log.entries[self._position]
+                if entry.due <= now:
+                    self._position += 1
+                    self._last_id = entry.id
+                    self._last_sent = now
+                    return entry.chunk, 0.0, log.version
+                wait = entry.due - now
+            heartbeat = self._last_sent + interval - now
+            if heartbeat <= 0:
+                self._last_sent = now
+                return _event(self._last_id, "heartbeat", {}), 0.0, log.version
+            return None, min(wait, heartbeat), log.version
+
+    def _connected(self) -> bytes:
+        return _event(self._last_id, "connected", {"sessionId": self._session_id})
+
+    def _send(self, chunk: bytes) -> bytes:
+        server = self._server
+        if server._chance(server.config.disconnect_rate):
+            server._count("disconnects")
+            raise httpx.ReadError("stream dropped by the fake server")
+        server._count("events")
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._send(self._connected())
+        while True:
+            chunk, wait, version = self._step()
+            if chunk is not None:
+                yield self._send(chunk)
+            elif wait < 0:
+                return
+            else:
+                self._log.wait(version, wait)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._send(self._connected())
+        while True:
+            chunk, wait, version = self._step()
+            if chunk is not None:
+                yield self._send(chunk)
+            elif wait < 0:
+                return
+            else:
+                await self._log.wait_async(version, wait)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._server._count("streams", -1)
+
+    async def aclose(self) -> None:
+        self.close()
+
+
+class _Delayed(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Holds back a response body for the configured latency."""
+
+    def __init__(self, inner: Any, delay: float):
+        self._inner = inner
+        self._delay = delay
+
+    def __iter__(self) -> Iterator[bytes]:
+        time.sleep(self._delay)
+        if isinstance(self._inner, bytes):
+            yield self._inner
+            return
+        yield from self._inner
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        await asyncio.sleep(self._delay)
+        if isinstance(self._inner, bytes):
+            yield self._inner
+            return
+        async for chunk in self._inner:
+            yield chunk
+
+    def close(self) -> None:
+        if isinstance(self._inner, _EventStream):
+            self._inner.close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+
+class _Reply(NamedTuple):
+    status: int
+    body: bytes = b""
+    content_type: str = "application/json"
+    stream: Optional[_EventStream] = None
+    delay: float = 0.0
+
+
+def _json(status: int, payload: Any) -> _Reply:
+    return _Reply(status, json.dumps(payload).encode())
+
+
+def _error(status: int, kind: str, message: str) -> _Reply:
+    return _json(status, {"error": {"code": status, "message": message, "type": kind}})
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _form_file(content_type: str, body: bytes) -> Optional[Tuple[str, bytes]]:
+    """Name and content of the file in a ``multipart/form-data`` body."""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if match is None:
+        return None
+    for part in body.split(b"--" + match.group(1).encode()):
+        head, sep, data = part.partition(b"\r\n\r\n")
+        name = re.search(rb'filename="([^"]*)"', head)
+        if sep and name:
+            return name.group(1).decode(), data[:-2]
+    return None
+
+
+# (method, pattern, handler name); patterns are tried in order.
+_ROUTES = [
+    ("GET", "/health", "_health"),
+    ("GET", "/health/auth", "_oauth_health"),
+    ("POST", "/internal/auth/refresh-tokens", "_refresh_tokens"),
+    ("GET", "/api/auth/status", "_auth_status"),
+    ("GET", "/api/system/info", "_system_info"),
+    ("GET", "/api/commands", "_empty_list"),
+    ("GET", "/stream", "_stream"),
+    ("GET", "/api/sessions", "_list_sessions"),
+    ("POST", "/api/sessions", "_create_session"),
+    ("GET", "/api/sessions/{id}", "_get_session"),
+    ("DELETE", "/api/sessions/{id}", "_delete_session"),
+    ("PATCH", "/api/sessions/{id}/callbacks", "_update_callbacks"),
+    ("POST", "/api/sessions/{id}/cancel", "_cancel"),
+    ("POST", "/api/sessions/{id}/rewind", "_rewind"),
+    ("GET", "/api/sessions/{id}/messages", "_list_messages"),
+    ("POST", "/api/sessions/{id}/messages", "_send_message"),
+    ("GET", "/api/messages/history", "_history"),
+    ("GET", "/api/sessions/{id}/files", "_list_files"),
+    ("POST", "/api/sessions/{id}/files/upload", "_upload_file"),
+    ("GET", "/api/sessions/{id}/files/{name}", "_get_file"),
+    ("DELETE", "/api/sessions/{id}/files/{name}", "_delete_file"),
+    ("POST", "/api/permissions/{id}/grant", "_grant"),
+    ("POST", "/api/permissions/{id}/deny", "_deny"),
+    ("POST", "/api/notifications/{id}/respond", "_respond"),
+]
+
+_COMPILED = [
+    (
+        method,
+        route,
+        re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", route) + "$"),
+        handler,
+    )
+    for method, route, handler in _ROUTES
+]
+
+
+class FakeMixServer:
+    """An in-memory Mix server with simulated turns and injectable faults.
+
+    Options are the fields of :class:`FakeServerConfig`; ``config`` holds
+    them and may be changed at any time, for example to raise the error rate
+    halfway through a run. Turns of one session are queued, each starting once
+    the previous one has finished.
+
+    Args:
+        config: Behaviour to start from; defaults to ``FakeServerConfig()``
+        seed: Seed for injected faults and generated text, for repeatable runs
+        **options: Overrides for fields of ``config``
+    """
+
+    def __init__(
+        self,
+        config: Optional[FakeServerConfig] = None,
+        *,
+        seed: Optional[int] = None,
+        **options: Any,
+    ):
+        self.config = dataclasses.replace(config or FakeServerConfig(), **options)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._messages: Dict[str, List[Dict[str, Any]]] = {}
+        self._files: Dict[str, Dict[str, Tuple[bytes, int]]] = {}
+        self._logs: Dict[str, _Log] = {}
+        self._token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+        self._stats = FakeServerStats()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+
+    # Faults and counters
+
+    def _chance(self, probability: float) -> bool:
+        if probability <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < probability
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self._stats, name, getattr(self._stats, name) + amount)
+
+    def stats(self) -> FakeServerStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return dataclasses.replace(
+                self._stats, requests=dict(self._stats.requests)
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the counters, except for the streams currently open."""
+        with self._lock:
+            self._stats = FakeServerStats(streams=self._stats.streams)
+
+    def _next_id(self, prefix: str) -> str:
+        with self._lock:
+            return f"{prefix}-{next(self._ids)}"
+
+    # Dispatch
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> _Reply:
+        """Answer one request; the transports below are thin wrappers."""
+        for route_method, route, pattern, name in _COMPILED:
+            match = pattern.match(path)
+            if match is None or route_method != method:
+                continue
+            with self._lock:
+                requests = self._stats.requests
+                key = f"{method} {route}"
+                requests[key] = requests.get(key, 0) + 1
+            config = self.config
+            delay = config.latency
+            if config.jitter > 0:
+                with self._lock:
+                    delay += self._random.uniform(0, config.jitter)
+            if self._chance(config.error_rate):
+                self._count("errors")
+                reply = _error(config.error_status, "internal_error", "injected")
+            else:
+                params = {k: unquote(v) for k, v in match.groupdict().items()}
+                reply = getattr(self, name)(params, query, headers, body)
+            return reply._replace(delay=delay)
+        return _error(404, "not_found", f"{method} {path} is not simulated")
+
+    # System and authentication
+
+    def _health(self, params, query, headers, body) -> _Reply:
+        return _json(200, {"status": "ok", "timestamp": _now(), "version": "fake"})
+
+    def _oauth_health(self, params, query, headers, body) -> _Reply:
+        expires = self._token_expiry
+        remaining = expires - datetime.now(timezone.utc)
+        provider = {
+            "provider": "anthropic",
+            "status": "active" if remaining.total_seconds() > 0 else "expired",
+            "expires_at": expires.isoformat(),
+            "expires_in": str(remaining),
+        }
+        return _json(
+            200,
+            {
+                "providers": {"anthropic": provider},
+                "status": "healthy",
+                "timestamp": _now(),
+            },
+        )
+
+    def _refresh_tokens(self, params, query, headers, body) -> _Reply:
+        self._token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+        return _json(200, {"status": "ok", "message": "tokens refreshed"})
+
+    def _auth_status(self, params, query, headers, body) -> _Reply:
+        return _json(200, {"providers": {}})
+
+    def _system_info(self, params, query, headers, body) -> _Reply:
+        return _json(200, {"storageBasePath": "/tmp/mix-fake"})
+
+    def _empty_list(self, params, query, headers, body) -> _Reply:
+        return _json(200, [])
+
+    # Sessions
+
+    def _session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def _list_sessions(self, params, query, headers, body) -> _Reply:
+        with self._lock:
+            return _json(200, list(self._sessions.values()))
+
+    def _create_session(self, params, query, headers, body) -> _Reply:
+        request = json.loads(body or b"{}")
+        session_id = self._next_id("session")
+        session = {
+            "id": session_id,
+            "title": request.get("title", ""),
+            "browserMode": request.get("browserMode", "local-browser-service"),
+            "sessionType": request.get("sessionType", "main"),
+            "createdAt": _now(),
+            "assistantMessageCount": 0,
+            "userMessageCount": 0,
+            "toolCallCount": 0,
+            "promptTokens": 0,
+            "completionTokens": 0,
+            "cost": 0.0,
+            "callbacks": request.get("callbacks", []),
+        }
+        with self._lock:
+            self._sessions[session_id] = session
+            self._messages[session_id] = []
+            self._files[session_id] = {}
+            self._logs[session_id] = _Log()
+        return _json(201, session)
+
+    def _get_session(self, params, query, headers, body) -> _Reply:
+        session = self._session(params["id"])
+        if session is None:
+            return _error(404, "not_found", "session not found")
+        return _json(200, session)
+
+    def _delete_session(self, params, query, headers, body) -> _Reply:
+        with self._lock:
+            session = self._sessions.pop(params["id"], None)
+            self._messages.pop(params["id"], None)
+            self._files.pop(params["id"], None)
+            log = self._logs.pop(params["id"], None)
+        if session is None:
+            return _error(404, "not_found", "session not found")
+        if log is not None:
+            with log.cond:
+                log.closed = True
+                log.changed()
+        return _Reply(204)
+
+    def _update_callbacks(self, params, query, headers, body) -> _Reply:
+        session = self._session(params["id"])
+        if session is None:
+            return _error(404, "not_found", "session not found")
+        session["callbacks"] = json.loads(body or b"{}").get("callbacks", [])
+        return _json(200, session)
+
+    def _cancel(self, params, query, headers, body) -> _Reply:
+        with self._lock:
+            log = self._logs.get(params["id"])
+        if log is None:
+            return _error(404, "not_found", "session not found")
+        now = time.monotonic()
+        with log.cond:
+            pending = [entry for entry in log.entries if entry.due > now]
+            if pending:
+                del log.entries[-len(pending) :]
+                log.last_id += 1
+                data = {"type": "complete", "done": True, "content": ""}
+                log.entries.append(
+                    _Entry(now, log.last_id, _event(log.last_id, "complete", data))
+                )
+                log.changed()
+        return _json(200, {"cancelled": bool(pending)})
+
+    def _rewind(self, params, query, headers, body) -> _Reply:
+        session = self._session(params["id"])
+        if session is None:
+            return _error(404, "not_found", "session not found")
+        message_id = json.loads(body or b"{}").get("messageId")
+        with self._lock:
+            messages = self._messages[params["id"]]
+            for index, message in enumerate(messages):
+                if message["id"] == message_id:
+                    del messages[index:]
+                    break
+        return _json(200, session)
+
+    # Messages and turns
+
+    def _list_messages(self, params, query, headers, body) -> _Reply:
+        with self._lock:
+            messages = self._messages.get(params["id"])
+            if messages is None:
+                return _error(404, "not_found", "session not found")
+            return _json(200, list(messages))
+
+    def _history(self, params, query, headers, body) -> _Reply:
+        with self._lock:
+            messages = [m for ms in self._messages.values() for m in ms]
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 50))
+        return _json(200, messages[offset : offset + limit])
+
+    def _send_message(self, params, query, headers, body) -> _Reply:
+        session_id = params["id"]
+        with self._lock:
+            session = self._sessions.get(session_id)
+            log = self._logs.get(session_id)
+        if session is None or log is None:
+            return _error(404, "not_found", "session not found")
+        text = json.loads(body or b"{}").get("text", "")
+        timeline, message, usage = self._turn(session_id, text)
+        self._count("turns")
+        if timeline[-1][1] == "error":
+            self._count("failed_turns")
+        with self._lock:
+            self._messages[session_id].append(message)
+            for key, value in usage.items():
+                session[key] += value
+        now = time.monotonic()
+        with log.cond:
+            start = max([now] + [entry.due for entry in log.entries[-1:]])
+            for offset, name, data in timeline:
+                log.last_id += 1
+                log.entries.append(
+                    _Entry(start + offset, log.last_id, _event(log.last_id, name, data))
+                )
+            log.changed()
+        return _json(202, {"sessionId": session_id, "status": "processing"})
+
+    def _tokens(self, count: int) -> List[str]:
+        """``count`` words of text, grouped into event-sized chunks."""
+        with self._lock:
+            words = [self._random.choice(_WORDS) + " " for _ in range(count)]
+        size = max(self.config.tokens_per_event, 1)
+        return ["".join(words[i : i + size]) for i in range(0, count, size)]
+
+    def _turn(self, session_id: str, text: str):
+        """A turn's events as ``(seconds from start, name, data)``."""
+        config = self.config
+        user_id = self._next_id("msg")
+        assistant_id = self._next_id("msg")
+        prompt_tokens = len(text.split())
+        step = (
+            max(config.tokens_per_event, 1) / config.tokens_per_second
+            if config.tokens_per_second > 0
+            else 0.0
+        )
+        offset = config.first_token_latency
+        if config.prompt_tokens_per_second > 0:
+            offset += prompt_tokens / config.prompt_tokens_per_second
+        timeline: List[Tuple[float, str, Dict[str, Any]]] = [
+            (0.0, "user_message_created", {"messageId": user_id, "content": text})
+        ]
+
+        thinking = self._tokens(config.thinking_tokens)
+        thinking_started = offset
+        for chunk in thinking:
+            data = {"content": chunk, "assistantMessageId": assistant_id}
+            timeline.append((offset, "thinking", data))
+            offset += step
+        reasoning_ms = int((offset - thinking_started) * 1000) if thinking else 0
+
+        for _ in range(config.tool_calls):
+            call_id = self._next_id("call")
+            arguments = json.dumps({"command": "echo fake"})
+            timeline += [
+                (offset, "tool_use_start", {"id": call_id, "name": "bash"}),
+                (
+                    offset,
+                    "tool_use_parameter_delta",
+                    {"toolCallId": call_id, "input": arguments},
+                ),
+                (
+                    offset,
+                    "tool_use_parameter_streaming_complete",
+                    {"id": call_id, "name": "bash", "input": arguments},
+                ),
+                (
+                    offset,
+                    "tool_execution_start",
+                    {"toolCallId": call_id, "toolName": "bash", "progress": "running"},
+                ),
+            ]
+            offset += config.tool_duration
+            timeline.append(
+                (
+                    offset,
+                    "tool_execution_complete",
+                    {
+                        "toolCallId": call_id,
+                        "toolName": "bash",
+                        "progress": "done",
+                        "success": True,
+                    },
+                )
+            )
+
+        content = self._tokens(config.response_tokens)
+        for chunk in content:
+            data = {"content": chunk, "assistantMessageId": assistant_id}
+            timeline.append((offset, "content", data))
+            offset += step
+
+        response = "".join(content)
+        reasoning = "".join(thinking)
+        if self._chance(config.turn_error_rate):
+            timeline.append((offset, "error", {"error": "simulated model failure"}))
+        else:
+            timeline.append(
+                (
+                    offset,
+                    "complete",
+                    {
+                        "done": True,
+                        "messageId": assistant_id,
+                        "content": response,
+                        "reasoning": reasoning,
+                        "reasoningDuration": reasoning_ms,
+                    },
+                )
+            )
+
+        completion_tokens = config.thinking_tokens + config.response_tokens
+        cost = (prompt_tokens * 3 + completion_tokens * 15) / 1e6
+        message = {
+            "id": assistant_id,
+            "sessionId": session_id,
+            "role": "assistant",
+            "userInput": text,
+            "assistantResponse": response,
+            "reasoning": reasoning,
+            "reasoningDuration": reasoning_ms,
+            "inputTokens": prompt_tokens,
+            "outputTokens": completion_tokens,
+            "cost": cost,
+            "model": "fake",
+        }
+        usage = {
+            "userMessageCount": 1,
+            "assistantMessageCount": 1,
+            "toolCallCount": config.tool_calls,
+            "promptTokens": prompt_tokens,
+            "completionTokens": completion_tokens,
+            "cost": cost,
+        }
+        return timeline, message, usage
+
+    def _stream(self, params, query, headers, body) -> _Reply:
+        session_id = query.get("sessionId", "")
+        with self._lock:
+            log = self._logs.get(session_id)
+        if log is None:
+            return _error(404, "not_found", "session not found")
+        last_event_id = headers.get("last-event-id")
+        now = time.monotonic()
+        with log.cond:
+            entries = log.entries
+            if last_event_id:
+                # Replay everything after the last event the client saw.
+                after = int(last_event_id) if last_event_id.isdigit() else 0
+                position = next(
+                    (i for i, entry in enumerate(entries) if entry.id > after),
+                    len(entries),
+                )
+            else:
+                # Events still to come belong to the new connection.
+                position = next(
+                    (i for i, entry in enumerate(entries) if entry.due > now),
+                    len(entries),
+                )
+            stream = _EventStream(self, session_id, log, position)
+        self._count("streams")
+        return _Reply(200, content_type="text/event-stream", stream=stream)
+
+    # Files
+
+    def _session_files(self, session_id: str) -> Optional[Dict[str, Tuple[bytes, int]]]:
+        with self._lock:
+            return self._files.get(session_id)
+
+    def _file_info(self, session_id: str, name: str, content: bytes, modified: int):
+        return {
+            "name": name,
+            "size": len(content),
+            "isDir": False,
+            "modified": modified,
+            "url": f"/api/sessions/{session_id}/files/{name}",
+        }
+
+    def _list_files(self, params, query, headers, body) -> _Reply:
+        files = self._session_files(params["id"])
+        if files is None:
+            return _error(404, "not_found", "session not found")
+        return _json(
+            200,
+            [
+                self._file_info(params["id"], name, content, modified)
+                for name, (content, modified) in list(files.items())
+            ],
+        )
+
+    def _upload_file(self, params, query, headers, body) -> _Reply:
+        files = self._session_files(params["id"])
+        if files is None:
+            return _error(404, "not_found", "session not found")
+        upload = _form_file(headers.get("content-type", ""), body)
+        if upload is None:
+            return _error(400, "bad_request", "expected a multipart file upload")
+        name, content = upload
+        modified = int(time.time())
+        files[name] = (content, modified)
+        return _json(201, self._file_info(params["id"], name, content, modified))
+
+    def _get_file(self, params, query, headers, body) -> _Reply:
+        files = self._session_files(params["id"])
+        if files is None or params["name"] not in files:
+            return _error(404, "not_found", "file not found")
+        return _Reply(200, files[params["name"]][0], "application/octet-stream")
+
+    def _delete_file(self, params, query, headers, body) -> _Reply:
+        files = self._session_files(params["id"])
+        if files is None or files.pop(params["name"], None) is None:
+            return _error(404, "not_found", "file not found")
+        return _Reply(204)
+
+    # Permissions and notifications
+
+    def _grant(self, params, query, headers, body) -> _Reply:
+        return _json(200, {"granted": True})
+
+    def _deny(self, params, query, headers, body) -> _Reply:
+        return _json(200, {"denied": True})
+
+    def _respond(self, params, query, headers, body) -> _Reply:
+        return _Reply(204)
+
+    # Transports
+
+    def _handle_request(self, request: httpx.Request) -> httpx.Response:
+        reply = self.handle(
+            request.method,
+            request.url.path,
+            dict(request.url.params),
+            request.headers,
+            request.content,
+        )
+        content: Any = reply.stream if reply.stream is not None else reply.body
+        if reply.delay > 0:
+            content = _Delayed(content, reply.delay)
+        elif reply.stream is None:
+            return httpx.Response(
+                reply.status,
+                headers={"Content-Type": reply.content_type},
+                content=reply.body,
+            )
+        return httpx.Response(
+            reply.status,
+            headers={"Content-Type": reply.content_type},
+            stream=content,
+        )
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport serving this server in-process, to both client kinds.
+
+        Example:
+            ```python
+            transport = fake.transport()
+            mix = Mix(
+                server_url="http://mix.fake",
+                client=httpx.Client(transport=transport),
+                async_client=httpx.AsyncClient(transport=transport),
+            )
+            ```
+        """
+        return httpx.MockTransport(self._handle_request)
+
+    def mix(self, **kwargs: Any):
+        """A ``Mix`` client wired to :meth:`transport`.
+
+        Args:
+            **kwargs: Passed to ``Mix``, such as ``retry_config``
+        """
+        # pylint: disable=import-outside-toplevel
+        from mix_python_sdk import Mix
+
+        transport = self.transport()
+        return Mix(
+            server_url="http://mix.fake",
+            client=httpx.Client(transport=transport),
+            async_client=httpx.AsyncClient(transport=transport),
+            **kwargs,
+        )
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start answering HTTP on a background thread.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on; 0 picks a free one
+
+        Returns:
+            The server URL, to pass to ``Mix(server_url=...)``
+        """
+        if self._httpd is None:
+            self._httpd = _HTTPServer((host, port), _Handler)
+            self._httpd.fake = self
+            threading.Thread(
+                target=self._httpd.serve_forever, name="mix-fake-server", daemon=True
+            ).start()
+        return self.url
+
+    @property
+    def url(self) -> str:
+        """URL of the HTTP server started by :meth:`serve`."""
+        if self._httpd is None:
+            raise RuntimeError("the fake server is not serving HTTP")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def close(self) -> None:
+        """End open streams and stop the HTTP server, if started."""
+        with self._lock:
+            logs = list(self._logs.values())
+        for log in logs:
+            with log.cond:
+                log.closed = True
+                log.changed()
+        httpd, self._httpd = self._httpd, None
+        if httpd is not None:
+            httpd.shutdown()
+            httpd.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _event(event_id: int, name: str, data: Dict[str, Any]) -> bytes:
+    data = {"type": name, **data}
+    return (
+        f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data)}\n\n".encode()
+    )
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    fake: FakeMixServer
+
+    def handle_error(self, request, client_address):
+        # Clients closing idle keep-alive connections are not worth a traceback.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, delayed ACKs
+    # stall every keep-alive request by tens of milliseconds.
+    disable_nagle_algorithm = True
+    server: _HTTPServer
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        url = urlsplit(self.path)
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        reply = self.server.fake.handle(
+            self.command, url.path, dict(parse_qsl(url.query)), headers, body
+        )
+        if reply.delay > 0:
+            time.sleep(reply.delay)
+        self.send_response(reply.status)
+        self.send_header("Content-Type", reply.content_type)
+        if reply.stream is None:
+            self.send_header("Content-Length", str(len(reply.body)))
+            self.end_headers()
+            self.wfile.write(reply.body)
+            return
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for chunk in reply.stream:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        except (httpx.ReadError, OSError):
+            # A dropped stream ends without the final chunk, as a lost
+            # connection would.
+            self.close_connection = True
+        finally:
+            reply.stream.close()
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _serve
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m mix_python_sdk.fakeserver",
+        description="Serve a simulated Mix API for load tests and benchmarks.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--seed", type=int)
+    for option in dataclasses.fields(FakeServerConfig):
+        parser.add_argument(
+            "--" + option.name.replace("_", "-"),
+            type=type(option.default),
+            default=option.default,
+        )
+    args = vars(parser.parse_args(argv))
+    host, port, seed = args.pop("host"), args.pop("port"), args.pop("seed")
+    server = FakeMixServer(seed=seed, **args)
+    print(f"Fake Mix server listening on {server.serve(host, port)}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
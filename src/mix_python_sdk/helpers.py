@@ -6,52 +6,121 @@ modern Python SDKs.
 """
 
 import asyncio
-from typing import AsyncIterator, Callable, Optional, Any
-from mix_python_sdk.models import (
-    SSEThinkingEvent,
-    SSEContentEvent,
-    SSEToolExecutionStartEvent,
-    SSEToolExecutionCompleteEvent,
-    SSECompleteEvent,
-    SSEErrorEvent,
-    SSEPermissionEvent,
-    SessionData,
+import bisect
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Any,
+    Tuple,
+    Union,
 )
+from mix_python_sdk.models import CreateSessionBrowserMode, SessionData
+from mix_python_sdk.permission_policy import PermissionPolicy
+from mix_python_sdk.router import EventRouter
+from mix_python_sdk.streamhub import StreamHub, StreamSubscription
+
+
+class EventType(str, Enum):
+    """Event types yielded by the streaming helpers.
+
+    Members compare equal to their string values, so ``event.type == "content"``
+    keeps working while identity checks (``event.type is EventType.CONTENT``)
+    stay cheap. ``str()`` and f-strings give the plain value too.
+    """
+
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+    THINKING = "thinking"
+    CONTENT = "content"
+    TOOL = "tool"
+    TOOL_EXECUTION_START = "tool_execution_start"
+    TOOL_EXECUTION_COMPLETE = "tool_execution_complete"
+    ERROR = "error"
+    PERMISSION = "permission"
+    COMPLETE = "complete"
+    TOOL_USE_START = "tool_use_start"
+    TOOL_USE_PARAMETER_DELTA = "tool_use_parameter_delta"
+    TOOL_USE_PARAMETER_STREAMING_COMPLETE = "tool_use_parameter_streaming_complete"
+    NOTIFICATION = "notification"
+    USER_MESSAGE_CREATED = "user_message_created"
+
+
+_EVENT_TYPES: Dict[str, EventType] = {t.value: t for t in EventType}
+
+_TOOL_EVENT_TYPES = frozenset(
+    (
+        EventType.TOOL,
+        EventType.TOOL_USE_START,
+        EventType.TOOL_EXECUTION_START,
+        EventType.TOOL_EXECUTION_COMPLETE,
+    )
+)
+
+# SSE tags surfaced by the helpers. Connection-level events (connected,
+# heartbeat) and session lifecycle events are not part of a turn.
+_TURN_EVENT_TYPES = tuple(t for t in EventType if t is not EventType.TOOL)
 
 
 class StreamEvent:
-    """Unified event wrapper for streaming responses."""
+    """Unified event wrapper for streaming responses.
 
-    def __init__(self, event_type: str, data: Any):
-        self.type = event_type
-        self.data = data
+    One of these is created for every streamed token, so it uses ``__slots__``
+    and extracts the text fields once at construction instead of on access.
 
-    @property
-    def content(self) -> Optional[str]:
-        """Get content text if this is a content event."""
-        if self.type == "content" and hasattr(self.data, "content"):
-            return self.data.content
-        return None
+    Attributes:
+        type: Event type; a plain string for types this version does not know
+        data: Raw event data
+        content: Content text if this is a content event
+        thinking: Thinking text if this is a thinking event
+        tool_name: Tool name if this is a tool event
+    """
 
-    @property
-    def thinking(self) -> Optional[str]:
-        """Get thinking text if this is a thinking event."""
-        if self.type == "thinking" and hasattr(self.data, "content"):
-            return self.data.content
-        return None
+    __slots__ = ("type", "data", "content", "thinking", "tool_name")
 
-    @property
-    def tool_name(self) -> Optional[str]:
-        """Get tool name if this is a tool event."""
-        if self.type == "tool" and hasattr(self.data, "name"):
-            return self.data.name
-        return None
+    type: Union[EventType, str]
+    data: Any
+    content: Optional[str]
+    thinking: Optional[str]
+    tool_name: Optional[str]
+
+    def __init__(self, event_type: Union[EventType, str], data: Any):
+        if event_type.__class__ is not EventType:
+            event_type = _EVENT_TYPES.get(event_type, event_type)
+        self.type = event_type
+        self.data = data
+        self.content = None
+        self.thinking = None
+        self.tool_name = None
+        if event_type is EventType.CONTENT:
+            self.content = getattr(data, "content", None)
+        elif event_type is EventType.THINKING:
+            self.thinking = getattr(data, "content", None)
+        elif event_type in _TOOL_EVENT_TYPES:
+            self.tool_name = getattr(data, "tool_name", None) or getattr(
+                data, "name", None
+            )
+
+    def __repr__(self) -> str:
+        return f"StreamEvent(type={str(self.type)!r}, data={self.data!r})"
 
 
 async def query(
     mix,
     session_id: str,
     message: str,
+    *,
+    hub: Optional[StreamHub] = None,
+    stats: Optional["TurnStats"] = None,
+    permission_policy: Optional[PermissionPolicy] = None,
 ) -> AsyncIterator[StreamEvent]:
     """Simple async iterator for streaming interactions.
 
@@ -63,10 +132,21 @@ async def query(
         mix: Mix SDK client instance
         session_id: Session ID to send the message to
         message: Message text to send
+        hub: Optional StreamHub (such as ``mix.stream_hub``) to share the
+            session's connection with other consumers and later turns
+        stats: Optional TurnStats to record the turn's timing in as events
+            arrive
+        permission_policy: Optional PermissionPolicy that answers permission
+            requests as soon as they are read; the stream is then read on a
+            task, ahead of the consumer, so slow consumers do not delay the
+            answers
 
     Yields:
         StreamEvent objects with type and data
 
+    Tool-use streaming, notification and user message events are yielded as
+    well; connection heartbeats are not.
+
     Example:
         ```python
         async with Mix(server_url="http://localhost:8088") as mix:
@@ -79,31 +159,34 @@ async def query(
                     print(f"[thinking: {event.thinking}]")
         ```
     """
-    stream_response = await mix.streaming.stream_events_async(session_id=session_id)
-    await asyncio.sleep(0.5)  # Allow stream connection to establish
+    stream = await _open_stream(mix, session_id, hub)
 
     # Start sending the message
-    send_task = asyncio.create_task(
-        mix.messages.send_async(id=session_id, text=message)
-    )
+    send_task = asyncio.create_task(_send(mix, session_id, message, stats))
 
-    async with stream_response.result as event_stream:
-        async for event in event_stream:
-            if isinstance(event, SSEThinkingEvent):
-                yield StreamEvent("thinking", event.data)
-            elif isinstance(event, SSEContentEvent):
-                yield StreamEvent("content", event.data)
-            elif isinstance(event, SSEToolExecutionStartEvent):
-                yield StreamEvent("tool_execution_start", event.data)
-            elif isinstance(event, SSEToolExecutionCompleteEvent):
-                yield StreamEvent("tool_execution_complete", event.data)
-            elif isinstance(event, SSEErrorEvent):
-                yield StreamEvent("error", event.data)
-            elif isinstance(event, SSEPermissionEvent):
-                yield StreamEvent("permission", event.data)
-            elif isinstance(event, SSECompleteEvent):
-                yield StreamEvent("complete", event.data)
-                break
+    router = EventRouter()
+    received: List[StreamEvent] = []
+    for event_type in _TURN_EVENT_TYPES:
+        router.on(event_type.value, _collector(received, event_type))
+
+    async with stream as event_stream:
+        events = event_stream
+        if permission_policy is not None:
+            events = _read_ahead(event_stream, permission_policy)
+        try:
+            async for event in events:
+                router.dispatch_sync(event)
+                if not received:
+                    continue
+                stream_event = received.pop()
+                if stats is not None:
+                    stats.record(stream_event.type, stream_event.data)
+                yield stream_event
+                if stream_event.type is EventType.COMPLETE:
+                    break
+        finally:
+            if events is not event_stream:
+                await events.aclose()  # stops the reader task
 
     # Wait for send to complete if not already done
     await send_task
@@ -114,19 +197,27 @@ async def send_with_callbacks(
     session_id: str,
     message: str,
     *,
-    on_thinking: Optional[Callable[[str], None]] = None,
-    on_content: Optional[Callable[[str], None]] = None,
-    on_tool_execution_start: Optional[Callable[[Any], None]] = None,
-    on_tool_execution_complete: Optional[Callable[[Any], None]] = None,
-    on_error: Optional[Callable[[str], None]] = None,
-    on_permission: Optional[Callable[[Any], None]] = None,
-    on_complete: Optional[Callable[[], None]] = None,
-) -> None:
+    on_thinking: Optional[Callable[[str], Any]] = None,
+    on_content: Optional[Callable[[str], Any]] = None,
+    on_tool_use_start: Optional[Callable[[Any], Any]] = None,
+    on_tool_use_parameter_delta: Optional[Callable[[Any], Any]] = None,
+    on_tool_execution_start: Optional[Callable[[Any], Any]] = None,
+    on_tool_execution_complete: Optional[Callable[[Any], Any]] = None,
+    on_error: Optional[Callable[[str], Any]] = None,
+    on_permission: Optional[Callable[[Any], Any]] = None,
+    on_notification: Optional[Callable[[Any], Any]] = None,
+    on_user_message_created: Optional[Callable[[Any], Any]] = None,
+    on_complete: Optional[Callable[[], Any]] = None,
+    router: Optional[EventRouter] = None,
+    hub: Optional[StreamHub] = None,
+    permission_policy: Optional[PermissionPolicy] = None,
+) -> "TurnStats":
     """Send a message and process streaming events with callbacks.
 
     This is the most ergonomic way to handle streaming responses. Provide
     callback functions for the events you care about, and this function
-    handles all the complexity.
+    handles all the complexity. Callbacks may be plain functions or coroutine
+    functions.
 
     Args:
         mix: Mix SDK client instance
@@ -134,11 +225,26 @@ async def send_with_callbacks(
         message: Message text to send
         on_thinking: Callback for thinking events (receives thinking text)
         on_content: Callback for content events (receives content text)
+        on_tool_use_start: Callback when the model starts a tool call
+        on_tool_use_parameter_delta: Callback for streamed tool call arguments
         on_tool_execution_start: Callback for tool execution start events
         on_tool_execution_complete: Callback for tool execution complete events
         on_error: Callback for error events (receives error message)
         on_permission: Callback for permission events (receives permission data)
+        on_notification: Callback for notification events
+        on_user_message_created: Callback when the user message is stored
         on_complete: Callback when stream completes
+        router: Optional EventRouter that receives every event after the
+            callbacks, for handlers the keyword arguments don't cover
+        hub: Optional StreamHub (such as ``mix.stream_hub``) to share the
+            session's connection with other consumers and later turns
+        permission_policy: Optional PermissionPolicy that answers permission
+            requests as they arrive; only requests it leaves undecided reach
+            ``on_permission``
+
+    Returns:
+        The turn's timing: time to first token, gaps between tokens, tool
+        calls and the server's reasoning time
 
     Example:
         ```python
@@ -152,42 +258,611 @@ async def send_with_callbacks(
         )
         ```
     """
-    stream_response = await mix.streaming.stream_events_async(session_id=session_id)
-    await asyncio.sleep(0.5)  # Allow stream connection to establish
+    callbacks = EventRouter()
+    if on_thinking:
+        callbacks.on("thinking", lambda e: on_thinking(e.data.content))
+    if on_content:
+        callbacks.on("content", lambda e: on_content(e.data.content))
+    if on_error:
+        callbacks.on("error", lambda e: on_error(e.data.error))
+    if on_complete:
+        callbacks.on("complete", lambda e: on_complete())
+    if permission_policy is not None:
+        callbacks.on("permission", _policy_first(permission_policy, on_permission))
+        on_permission = None
+    for event_type, callback in (
+        ("tool_use_start", on_tool_use_start),
+        ("tool_use_parameter_delta", on_tool_use_parameter_delta),
+        ("tool_execution_start", on_tool_execution_start),
+        ("tool_execution_complete", on_tool_execution_complete),
+        ("permission", on_permission),
+        ("notification", on_notification),
+        ("user_message_created", on_user_message_created),
+    ):
+        if callback:
+            callbacks.on(event_type, lambda e, cb=callback: cb(e.data))
+
+    stream = await _open_stream(mix, session_id, hub)
+    stats = TurnStats()
 
-    async with stream_response.result as event_stream:
+    async with stream as event_stream:
 
         async def process_events():
             async for event in event_stream:
-                if isinstance(event, SSEThinkingEvent) and on_thinking:
-                    on_thinking(event.data.content)
-                elif isinstance(event, SSEContentEvent) and on_content:
-                    on_content(event.data.content)
-                elif (
-                    isinstance(event, SSEToolExecutionStartEvent)
-                    and on_tool_execution_start
-                ):
-                    on_tool_execution_start(event.data)
-                elif (
-                    isinstance(event, SSEToolExecutionCompleteEvent)
-                    and on_tool_execution_complete
-                ):
-                    on_tool_execution_complete(event.data)
-                elif isinstance(event, SSEErrorEvent):
-                    if on_error:
-                        on_error(event.data.error)
-                    break
-                elif isinstance(event, SSEPermissionEvent) and on_permission:
-                    on_permission(event.data)
-                elif isinstance(event, SSECompleteEvent):
-                    if on_complete:
-                        on_complete()
+                stats.record(event.event, event.data)
+                await callbacks.dispatch(event)
+                if router is not None:
+                    await router.dispatch(event)
+                if event.event in ("error", "complete"):
                     break
 
         await asyncio.gather(
-            mix.messages.send_async(id=session_id, text=message),
+            _send(mix, session_id, message, stats),
             process_events(),
         )
+    return stats
+
+
+@dataclass
+class Usage:
+    """Token and cost usage.
+
+    Attributes:
+        prompt_tokens: Prompt tokens consumed
+        completion_tokens: Completion tokens generated
+        cost: Cost in the server's currency units
+    """
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+
+    @classmethod
+    def of(cls, session: SessionData) -> "Usage":
+        """The cumulative usage of a session."""
+        return cls(session.prompt_tokens, session.completion_tokens, session.cost)
+
+    def __add__(self, other: "Usage") -> "Usage":
+        return Usage(
+            self.prompt_tokens + other.prompt_tokens,
+            self.completion_tokens + other.completion_tokens,
+            self.cost + other.cost,
+        )
+
+    def __sub__(self, other: "Usage") -> "Usage":
+        return Usage(
+            self.prompt_tokens - other.prompt_tokens,
+            self.completion_tokens - other.completion_tokens,
+            self.cost - other.cost,
+        )
+
+
+@dataclass
+class ToolTiming:
+    """When one tool call ran, as ``time.monotonic()`` timestamps.
+
+    Attributes:
+        tool_call_id: The call's ID
+        tool_name: The tool that was called
+        started: When ``tool_execution_start`` arrived
+        completed: When ``tool_execution_complete`` arrived, if it has
+        success: Whether the tool reported success, once completed
+    """
+
+    tool_call_id: str
+    tool_name: Optional[str] = None
+    started: Optional[float] = None
+    completed: Optional[float] = None
+    success: Optional[bool] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds from start to completion."""
+        if self.started is None or self.completed is None:
+            return None
+        return self.completed - self.started
+
+
+# Upper bounds, in seconds, of the inter-token gap histogram buckets: 1, 2 and
+# 5 ms up to 5 s. A final bucket counts the gaps above the last bound.
+GAP_BUCKETS: Tuple[float, ...] = tuple(
+    m * 10.0**e for e in range(-3, 1) for m in (1, 2, 5)
+)
+
+
+@dataclass
+class TurnStats:
+    """Timing of one turn, as ``time.monotonic()`` timestamps.
+
+    Events are timed as the helper receives them, so the figures include
+    network and decoding time, which is what a user of the stream sees.
+    Tokens are ``thinking`` and ``content`` events.
+
+    Attributes:
+        sent: When the message was sent
+        accepted: When the server accepted it (``messages.send_async``
+            returned)
+        first_thinking: When the first ``thinking`` event arrived
+        first_content: When the first ``content`` event arrived
+        completed: When ``complete`` arrived
+        failed: When an ``error`` event arrived
+        error: The error event's message
+        reasoning_duration: Reasoning time reported by the server with
+            ``complete``, in milliseconds
+        tools: Every tool call, in the order they started
+        tokens: Token events received
+        gap_histogram: Counts of gaps between consecutive tokens, per
+            :data:`GAP_BUCKETS` bucket plus one for longer gaps
+        max_gap: Longest gap between consecutive tokens, in seconds
+        total_gap: Sum of the gaps between consecutive tokens, in seconds
+        last_token: When the latest token arrived
+    """
+
+    sent: Optional[float] = None
+    accepted: Optional[float] = None
+    first_thinking: Optional[float] = None
+    first_content: Optional[float] = None
+    completed: Optional[float] = None
+    failed: Optional[float] = None
+    error: Optional[str] = None
+    reasoning_duration: Optional[int] = None
+    tools: List[ToolTiming] = field(default_factory=list)
+    tokens: int = 0
+    gap_histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(GAP_BUCKETS) + 1)
+    )
+    max_gap: float = 0.0
+    total_gap: float = 0.0
+    last_token: Optional[float] = None
+
+    def _since_sent(self, timestamp: Optional[float]) -> Optional[float]:
+        if self.sent is None or timestamp is None:
+            return None
+        return timestamp - self.sent
+
+    @property
+    def time_to_accept(self) -> Optional[float]:
+        """Seconds from sending the message to the server accepting it."""
+        return self._since_sent(self.accepted)
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds from sending the message to its first thinking or content."""
+        firsts = [
+            t for t in (self.first_thinking, self.first_content) if t is not None
+        ]
+        return self._since_sent(min(firsts)) if firsts else None
+
+    @property
+    def time_to_first_content(self) -> Optional[float]:
+        """Seconds from sending the message to its first content."""
+        return self._since_sent(self.first_content)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds from sending the message to ``complete`` or ``error``."""
+        end = self.completed if self.completed is not None else self.failed
+        return self._since_sent(end)
+
+    @property
+    def mean_gap(self) -> Optional[float]:
+        """Mean seconds between consecutive tokens."""
+        gaps = self.tokens - 1
+        return self.total_gap / gaps if gaps > 0 else None
+
+    def gap_percentile(self, percent: float) -> Optional[float]:
+        """Upper bound of the histogram bucket holding the given percentile.
+
+        Returns ``max_gap`` when that bucket is the last, open-ended one.
+        """
+        gaps = self.tokens - 1
+        if gaps <= 0:
+            return None
+        rank = gaps * percent / 100
+        seen = 0
+        for bound, count in zip(GAP_BUCKETS, self.gap_histogram):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max_gap
+
+    def record(self, event_type: str, data: Any) -> None:
+        """Time a turn event as it arrives."""
+        now = time.monotonic()
+        if event_type == "thinking" or event_type == "content":
+            last, self.last_token = self.last_token, now
+            self.tokens += 1
+            if event_type == "content":
+                if self.first_content is None:
+                    self.first_content = now
+            elif self.first_thinking is None:
+                self.first_thinking = now
+            if last is not None:
+                gap = now - last
+                self.gap_histogram[bisect.bisect_left(GAP_BUCKETS, gap)] += 1
+                self.total_gap += gap
+                if gap > self.max_gap:
+                    self.max_gap = gap
+        elif event_type == "tool_execution_start":
+            self.tools.append(
+                ToolTiming(
+                    getattr(data, "tool_call_id", ""),
+                    getattr(data, "tool_name", None),
+                    started=now,
+                )
+            )
+        elif event_type == "tool_execution_complete":
+            call_id = getattr(data, "tool_call_id", "")
+            tool = next((t for t in self.tools if t.tool_call_id == call_id), None)
+            if tool is None:
+                tool = ToolTiming(call_id, getattr(data, "tool_name", None))
+                self.tools.append(tool)
+            tool.completed = now
+            tool.success = getattr(data, "success", None)
+        elif event_type == "complete":
+            self.completed = now
+            self.reasoning_duration = getattr(data, "reasoning_duration", None)
+        elif event_type == "error":
+            self.failed = now
+            self.error = getattr(data, "error", None)
+
+
+async def _send(mix, session_id: str, message: str, stats: Optional[TurnStats]):
+    """Send a message, recording when it was sent and accepted."""
+    if stats is None:
+        return await mix.messages.send_async(id=session_id, text=message)
+    stats.sent = time.monotonic()
+    response = await mix.messages.send_async(id=session_id, text=message)
+    stats.accepted = time.monotonic()
+    return response
+
+
+@dataclass
+class TurnResult:
+    """Outcome of one turn run by :func:`query_many`.
+
+    Attributes:
+        session_id: Session the message was sent to
+        message: Message text that was sent
+        error: Why the turn failed, or None if it completed
+        usage: Tokens and cost the turn added to the session, if known
+        events: Number of events received
+        elapsed: Seconds from starting the turn to its end
+        stats: Timing of the turn's send and events
+    """
+
+    session_id: str
+    message: str
+    error: Optional[BaseException] = None
+    usage: Optional[Usage] = None
+    events: int = 0
+    elapsed: float = 0.0
+    stats: TurnStats = field(default_factory=TurnStats)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the turn completed."""
+        return self.error is None
+
+
+class SessionEvent:
+    """An item yielded by :func:`query_many`.
+
+    Each turn yields its stream events with ``event`` set, then one final item
+    with ``result`` set.
+
+    Attributes:
+        session_id: Session the item belongs to
+        event: A streamed event, or None for the final item
+        result: The turn's outcome on the final item, otherwise None
+    """
+
+    __slots__ = ("session_id", "event", "result")
+
+    def __init__(
+        self,
+        session_id: str,
+        event: Optional[StreamEvent] = None,
+        result: Optional[TurnResult] = None,
+    ):
+        self.session_id = session_id
+        self.event = event
+        self.result = result
+
+    def __repr__(self) -> str:
+        return (
+            f"SessionEvent(session_id={self.session_id!r}, event={self.event!r}, "
+            f"result={self.result!r})"
+        )
+
+
+class QueryMany:
+    """Async iterator returned by :func:`query_many`.
+
+    Attributes:
+        turns: The ``(session_id, message)`` pairs to run
+        usage: Usage summed over the finished turns
+    """
+
+    def __init__(
+        self,
+        mix,
+        turns: Iterable[Tuple[str, str]],
+        *,
+        concurrency: int,
+        timeout: Optional[float],
+        hub: Optional[StreamHub],
+        track_usage: bool,
+        permission_policy: Optional[PermissionPolicy] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.mix = mix
+        self.turns = list(turns)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.hub = hub
+        self.track_usage = track_usage
+        self.permission_policy = permission_policy
+        self.usage = Usage()
+        self._results: List[Optional[TurnResult]] = [None] * len(self.turns)
+        self._iterator: Optional[AsyncIterator[SessionEvent]] = None
+
+    @property
+    def results(self) -> List[TurnResult]:
+        """Outcome of every finished turn, in the order of ``turns``."""
+        return [result for result in self._results if result is not None]
+
+    @property
+    def failed(self) -> List[TurnResult]:
+        """Finished turns that did not complete."""
+        return [result for result in self.results if result.error is not None]
+
+    def __aiter__(self) -> AsyncIterator[SessionEvent]:
+        if self._iterator is None:
+            self._iterator = self._run()
+        return self._iterator
+
+    async def aclose(self) -> None:
+        """Cancel the turns still running."""
+        if self._iterator is not None:
+            await self._iterator.aclose()  # type: ignore[attr-defined]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _run(self) -> AsyncIterator[SessionEvent]:
+        queue: "asyncio.Queue[SessionEvent]" = asyncio.Queue()
+        # A fixed pool of workers takes turns as slots free up, so a large
+        # batch costs one task per slot rather than one per turn.
+        pending = iter(enumerate(self.turns))
+        workers = [
+            asyncio.create_task(self._worker(pending, queue))
+            for _ in range(min(self.concurrency, len(self.turns)))
+        ]
+        try:
+            remaining = len(self.turns)
+            while remaining:
+                item = await queue.get()
+                if item.result is not None:
+                    remaining -= 1
+                yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _worker(
+        self,
+        pending: Iterator[Tuple[int, Tuple[str, str]]],
+        queue: "asyncio.Queue[SessionEvent]",
+    ) -> None:
+        for index, (session_id, message) in pending:
+            await self._turn(index, session_id, message, queue)
+
+    async def _turn(
+        self,
+        index: int,
+        session_id: str,
+        message: str,
+        queue: "asyncio.Queue[SessionEvent]",
+    ) -> None:
+        result = TurnResult(session_id, message)
+        start = time.monotonic()
+        before: Optional[Usage] = None
+        try:
+            if self.track_usage:
+                before = Usage.of(await self.mix.sessions.get_async(id=session_id))
+            await asyncio.wait_for(self._stream(result, queue), self.timeout)
+        except asyncio.TimeoutError:
+            result.error = TimeoutError(
+                f"Turn in session {session_id} did not complete within "
+                f"{self.timeout:g}s"
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            result.error = e
+        if before is not None:
+            try:
+                after = await self.mix.sessions.get_async(id=session_id)
+                result.usage = Usage.of(after) - before
+                self.usage += result.usage
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+        result.elapsed = time.monotonic() - start
+        self._results[index] = result
+        queue.put_nowait(SessionEvent(session_id, result=result))
+
+    async def _stream(
+        self, result: TurnResult, queue: "asyncio.Queue[SessionEvent]"
+    ) -> None:
+        session_id = result.session_id
+        stream = await _open_stream(self.mix, session_id, self.hub)
+        router = EventRouter()
+        received: List[StreamEvent] = []
+        for event_type in _TURN_EVENT_TYPES:
+            router.on(event_type.value, _collector(received, event_type))
+        policy = self.permission_policy
+
+        # Events are read on this task and queued, so permission requests are
+        # answered as they arrive rather than when the caller gets to them.
+        async def consume() -> None:
+            async with stream as event_stream:
+                async for event in event_stream:
+                    if policy is not None:
+                        policy.feed(event)
+                    router.dispatch_sync(event)
+                    if not received:
+                        continue
+                    stream_event = received.pop()
+                    result.events += 1
+                    result.stats.record(stream_event.type, stream_event.data)
+                    queue.put_nowait(SessionEvent(session_id, stream_event))
+                    if stream_event.type is EventType.ERROR:
+                        raise RuntimeError(
+                            getattr(stream_event.data, "error", "Turn failed")
+                        )
+                    if stream_event.type is EventType.COMPLETE:
+                        return
+
+        # Unlike query(), watch the send as well, so a failed send ends the
+        # turn instead of leaving it waiting for events.
+        send = asyncio.create_task(
+            _send(self.mix, session_id, result.message, result.stats)
+        )
+        receive = asyncio.create_task(consume())
+        try:
+            await asyncio.wait((send, receive), return_when=asyncio.FIRST_EXCEPTION)
+            if send.done() and send.exception() is not None:
+                raise send.exception()  # type: ignore[misc]
+            await receive
+            await send
+        finally:
+            for task in (send, receive):
+                task.cancel()
+            await asyncio.gather(send, receive, return_exceptions=True)
+
+
+def query_many(
+    mix,
+    turns: Iterable[Tuple[str, str]],
+    *,
+    concurrency: int = 16,
+    timeout: Optional[float] = None,
+    hub: Optional[StreamHub] = None,
+    track_usage: bool = True,
+    permission_policy: Optional[PermissionPolicy] = None,
+) -> QueryMany:
+    """Send one message to each of many sessions with bounded concurrency.
+
+    At most ``concurrency`` turns run at a time, each with its own stream, so
+    that many streams are open at once. Turns start in order as earlier ones
+    finish, so only the running turns hold tasks and connections. Events from
+    all turns are yielded as they arrive, tagged with their session. A turn
+    that fails, times out or receives an error event ends with an error in its
+    result; the other turns carry on.
+
+    Usage is the difference between the session's token and cost totals before
+    and after the turn, which costs two ``sessions.get`` calls per turn; pass
+    ``track_usage=False`` to skip it.
+
+    Args:
+        mix: Mix SDK client instance
+        turns: ``(session_id, message)`` pairs, at most one per session
+        concurrency: Maximum turns, and therefore streams, in flight
+        timeout: Seconds each turn may take, from connecting to completion
+        hub: Optional StreamHub to reuse the sessions' open connections
+        track_usage: Whether to measure each turn's token and cost usage
+        permission_policy: Optional PermissionPolicy that answers permission
+            requests from every turn as soon as they are read
+
+    Returns:
+        An async iterator of :class:`SessionEvent`; after iterating, its
+        ``results`` and ``usage`` hold every turn's outcome, in the order of
+        ``turns``, and the total usage
+
+    Example:
+        ```python
+        batch = query_many(mix, [(s.id, prompt) for s in sessions], concurrency=32)
+        async for item in batch:
+            if item.result is not None and not item.result.ok:
+                print(f"{item.session_id} failed: {item.result.error}")
+        print(batch.usage.cost)
+        ```
+    """
+    return QueryMany(
+        mix,
+        turns,
+        concurrency=concurrency,
+        timeout=timeout,
+        hub=hub,
+        track_usage=track_usage,
+        permission_policy=permission_policy,
+    )
+
+
+async def _open_stream(mix, session_id: str, hub: Optional[StreamHub]):
+    if hub is None:
+        stream_response = await mix.streaming.stream_events_async(
+            session_id=session_id
+        )
+        event_stream = stream_response.result
+        new_connection = True
+    else:
+        event_stream = await hub.subscribe(session_id).connect()
+        new_connection = event_stream.new_connection
+    if new_connection:
+        await asyncio.sleep(0.5)  # Allow stream connection to establish
+    return event_stream
+
+
+async def _read_ahead(event_stream, policy: PermissionPolicy) -> AsyncIterator[Any]:
+    # Reads the stream on a task up to the end of the turn, feeding the policy
+    # as each event arrives, and hands the events over through a queue.
+    queue: "asyncio.Queue[Any]" = asyncio.Queue()
+    done = object()
+
+    async def read() -> None:
+        try:
+            async for event in event_stream:
+                policy.feed(event)
+                queue.put_nowait(event)
+                if event.event == "complete":
+                    break
+        finally:
+            queue.put_nowait(done)
+
+    reader = asyncio.create_task(read())
+    try:
+        while True:
+            event = await queue.get()
+            if event is done:
+                break
+            yield event
+        await reader  # raises the reader's error, if any
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+
+
+def _policy_first(
+    policy: PermissionPolicy, on_permission: Optional[Callable[[Any], Any]]
+):
+    def handle(event: Any) -> Any:
+        if policy.feed(event) is None and on_permission is not None:
+            return on_permission(event.data)
+        return None
+
+    return handle
+
+
+def _collector(received: List[StreamEvent], event_type: EventType):
+    def collect(event: Any) -> None:
+        received.append(StreamEvent(event_type, event.data))
+
+    return collect
 
 
 class StreamingSession:
@@ -215,6 +890,8 @@ class StreamingSession:
         mix,
         title: str,
         custom_system_prompt: Optional[str] = None,
+        hub: Optional[StreamHub] = None,
+        browser_mode: CreateSessionBrowserMode = "local-browser-service",
     ):
         """Initialize a streaming session.
 
@@ -222,24 +899,35 @@ class StreamingSession:
             mix: Mix SDK client instance
             title: Title for the session
             custom_system_prompt: Optional custom system prompt
+            hub: Optional StreamHub so turns reuse one connection
+            browser_mode: Browser automation mode for the session
         """
         self.mix = mix
         self.title = title
         self.custom_system_prompt = custom_system_prompt
+        self.browser_mode = browser_mode
+        self.hub = hub
         self._session: Optional[SessionData] = None
+        # Subscription keeping a pre-warmed stream open; see SessionPool.
+        self._warm_subscription: Optional[StreamSubscription] = None
 
     async def __aenter__(self):
         """Create the session when entering context."""
-        self._session = self.mix.sessions.create(
-            title=self.title,
-            custom_system_prompt=self.custom_system_prompt,
-        )
+        if self._session is None:
+            self._session = await self.mix.sessions.create_async(
+                browser_mode=self.browser_mode,
+                title=self.title,
+                custom_system_prompt=self.custom_system_prompt,
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Delete the session when exiting context."""
+        if self._warm_subscription is not None:
+            await self._warm_subscription.aclose()
+            self._warm_subscription = None
         if self._session:
-            self.mix.sessions.delete(id=self._session.id)
+            await self.mix.sessions.delete_async(id=self._session.id)
 
     @property
     def id(self) -> str:
@@ -255,51 +943,90 @@ class StreamingSession:
             raise RuntimeError("Session not created. Use 'async with' context manager.")
         return self._session
 
-    async def query(self, message: str) -> AsyncIterator[StreamEvent]:
+    async def query(
+        self,
+        message: str,
+        *,
+        stats: Optional["TurnStats"] = None,
+        permission_policy: Optional[PermissionPolicy] = None,
+    ) -> AsyncIterator[StreamEvent]:
         """Send a message and iterate over events.
 
         Args:
             message: Message text to send
+            stats: Optional TurnStats to record the turn's timing in
+            permission_policy: Optional PermissionPolicy that answers
+                permission requests as soon as they are read
 
         Yields:
             StreamEvent objects
         """
-        async for event in query(self.mix, self.id, message):
+        async for event in query(
+            self.mix,
+            self.id,
+            message,
+            hub=self.hub,
+            stats=stats,
+            permission_policy=permission_policy,
+        ):
             yield event
 
     async def send(
         self,
         message: str,
         *,
-        on_thinking: Optional[Callable[[str], None]] = None,
-        on_content: Optional[Callable[[str], None]] = None,
-        on_tool_execution_start: Optional[Callable[[Any], None]] = None,
-        on_tool_execution_complete: Optional[Callable[[Any], None]] = None,
-        on_error: Optional[Callable[[str], None]] = None,
-        on_permission: Optional[Callable[[Any], None]] = None,
-        on_complete: Optional[Callable[[], None]] = None,
-    ) -> None:
+        on_thinking: Optional[Callable[[str], Any]] = None,
+        on_content: Optional[Callable[[str], Any]] = None,
+        on_tool_use_start: Optional[Callable[[Any], Any]] = None,
+        on_tool_use_parameter_delta: Optional[Callable[[Any], Any]] = None,
+        on_tool_execution_start: Optional[Callable[[Any], Any]] = None,
+        on_tool_execution_complete: Optional[Callable[[Any], Any]] = None,
+        on_error: Optional[Callable[[str], Any]] = None,
+        on_permission: Optional[Callable[[Any], Any]] = None,
+        on_notification: Optional[Callable[[Any], Any]] = None,
+        on_user_message_created: Optional[Callable[[Any], Any]] = None,
+        on_complete: Optional[Callable[[], Any]] = None,
+        router: Optional[EventRouter] = None,
+        permission_policy: Optional[PermissionPolicy] = None,
+    ) -> "TurnStats":
         """Send a message with callback-based event handling.
 
         Args:
             message: Message text to send
             on_thinking: Callback for thinking events
             on_content: Callback for content events
+            on_tool_use_start: Callback when the model starts a tool call
+            on_tool_use_parameter_delta: Callback for streamed tool call arguments
             on_tool_execution_start: Callback for tool execution start events
             on_tool_execution_complete: Callback for tool execution complete events
             on_error: Callback for error events
             on_permission: Callback for permission events
+            on_notification: Callback for notification events
+            on_user_message_created: Callback when the user message is stored
             on_complete: Callback when stream completes
+            router: Optional EventRouter that receives every event
+            permission_policy: Optional PermissionPolicy that answers
+                permission requests before ``on_permission`` is consulted
+
+        Returns:
+            The turn's timing
         """
-        await send_with_callbacks(
+        return await send_with_callbacks(
             self.mix,
             self.id,
             message,
             on_thinking=on_thinking,
             on_content=on_content,
+            on_tool_use_start=on_tool_use_start,
+            on_tool_use_parameter_delta=on_tool_use_parameter_delta,
             on_tool_execution_start=on_tool_execution_start,
             on_tool_execution_complete=on_tool_execution_complete,
             on_error=on_error,
             on_permission=on_permission,
+            on_notification=on_notification,
+            on_user_message_created=on_user_message_created,
             on_complete=on_complete,
+            router=router,
+            hub=self.hub,
+            permission_policy=permission_policy,
         )
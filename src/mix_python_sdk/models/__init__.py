@@ -51,6 +51,8 @@ if TYPE_CHECKING:
         ExportSessionRequestTypedDict,
         ExportSessionResponse,
         ExportSessionResponseTypedDict,
+        ExportSessionStreamResponse,
+        ExportSessionStreamResponseTypedDict,
     )
     from .exporttoolcall import (
         ExportToolCall,
@@ -367,6 +369,8 @@ __all__ = [
     "ExportSessionRequestTypedDict",
     "ExportSessionResponse",
     "ExportSessionResponseTypedDict",
+    "ExportSessionStreamResponse",
+    "ExportSessionStreamResponseTypedDict",
     "ExportSessionTypedDict",
     "ExportToolCall",
     "ExportToolCallTypedDict",
@@ -632,6 +636,8 @@ _dynamic_imports: dict[str, str] = {
     "ExportSessionRequestTypedDict": ".exportsessionop",
     "ExportSessionResponse": ".exportsessionop",
     "ExportSessionResponseTypedDict": ".exportsessionop",
+    "ExportSessionStreamResponse": ".exportsessionop",
+    "ExportSessionStreamResponseTypedDict": ".exportsessionop",
     "ExportToolCall": ".exporttoolcall",
     "ExportToolCallTypedDict": ".exporttoolcall",
     "InputJSON": ".exporttoolcall",
@@ -1,10 +1,12 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 from __future__ import annotations
+from .exportmessage import ExportMessage, ExportMessageTypedDict
 from .exportsession import ExportSession, ExportSessionTypedDict
 from mix_python_sdk.types import BaseModel
-from mix_python_sdk.utils import FieldMetadata, PathParamMetadata
-from typing import Dict, List
+from mix_python_sdk.utils import FieldMetadata, PathParamMetadata, jsonstreaming
+from pydantic import SkipValidation
+from typing import Dict, List, Union
 from typing_extensions import Annotated, TypedDict
 
 
@@ -29,3 +31,22 @@ class ExportSessionResponse(BaseModel):
     headers: Dict[str, List[str]]
 
     result: ExportSession
+
+
+class ExportSessionStreamResponseTypedDict(TypedDict):
+    headers: Dict[str, List[str]]
+    result: Union[
+        jsonstreaming.JSONArrayStream[ExportMessageTypedDict],
+        jsonstreaming.JSONArrayStreamAsync[ExportMessageTypedDict],
+    ]
+
+
+class ExportSessionStreamResponse(BaseModel):
+    headers: Dict[str, List[str]]
+
+    result: SkipValidation[
+        Union[
+            jsonstreaming.JSONArrayStream[ExportMessage],
+            jsonstreaming.JSONArrayStreamAsync[ExportMessage],
+        ]
+    ]
@@ -0,0 +1,327 @@
+"""Answering notifications before they time out.
+
+A ``notification`` event asks the user for an acknowledgement, a choice or
+some text within ``timeout`` seconds of ``created_at``. If nobody answers, the
+agent waits until the timeout runs out. :class:`NotificationScheduler` keeps the
+outstanding notifications in a heap ordered by deadline, applies a default
+response shortly before each one expires, and sends responses in concurrent
+batches.
+
+Example:
+    ```python
+    async with NotificationScheduler(mix, default_choice="skip") as scheduler:
+        router = EventRouter()
+        router.on("notification", scheduler.feed)
+        router.on("notification", lambda e: ui.show(e.data))
+
+        # Later, from the UI:
+        scheduler.respond(notification_id, "choice", "retry")
+    ```
+"""
+
+import asyncio
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mix_python_sdk.models import RespondToNotificationType
+
+Response = Tuple[RespondToNotificationType, Optional[str]]
+
+# Rebuild the heap once this many entries are for answered notifications.
+_COMPACT_AFTER = 256
+
+
+class PendingNotification:
+    """A notification that has not been answered yet.
+
+    Attributes:
+        data: The notification event data
+        expires_at: ``time.time()`` at which the server stops waiting
+        respond_at: ``time.monotonic()`` at which the default is applied
+    """
+
+    __slots__ = ("data", "expires_at", "respond_at")
+
+    def __init__(self, data: Any, expires_at: float, respond_at: float):
+        self.data = data
+        self.expires_at = expires_at
+        self.respond_at = respond_at
+
+    @property
+    def remaining(self) -> float:
+        """Seconds until the notification expires."""
+        return self.expires_at - time.time()
+
+    def __repr__(self) -> str:
+        return (
+            f"PendingNotification(id={self.data.id!r}, "
+            f"remaining={self.remaining:.1f})"
+        )
+
+
+@dataclass
+class NotificationStats:
+    """Counters of a :class:`NotificationScheduler`.
+
+    Attributes:
+        received: Notifications fed to the scheduler
+        answered: Responses given through :meth:`NotificationScheduler.respond`
+        defaulted: Default responses applied before expiry
+        unanswered: Notifications that expired without a default response
+        sent: Responses the server accepted
+        failed: Responses that could not be sent
+        pending: Notifications still waiting for a response
+        queued: Responses waiting to be sent
+    """
+
+    received: int = 0
+    answered: int = 0
+    defaulted: int = 0
+    unanswered: int = 0
+    sent: int = 0
+    failed: int = 0
+    pending: int = 0
+    queued: int = 0
+
+
+class NotificationScheduler:
+    """Tracks notification deadlines and answers them before they expire.
+
+    Default responses are ``acknowledge`` for acknowledgements, the configured
+    choice (or the first offered one) for choices, and ``default_text`` for
+    text. Pass ``default_response`` to decide per notification; returning None
+    lets that notification expire.
+
+    Args:
+        mix: Mix SDK client instance
+        margin: Seconds before expiry at which the default is applied
+        default_choice: Choice to pick when it is among the offered choices
+        default_text: Text to answer text notifications with
+        default_response: Callable returning ``(type, value)`` for a
+            notification's data, or None to leave it unanswered
+        batch_window: Seconds to wait for more responses before sending a batch
+        max_concurrency: Responses sent at once
+    """
+
+    def __init__(
+        self,
+        mix,
+        *,
+        margin: float = 1.0,
+        default_choice: Optional[str] = None,
+        default_text: str = "",
+        default_response: Optional[Callable[[Any], Optional[Response]]] = None,
+        batch_window: float = 0.005,
+        max_concurrency: int = 16,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.mix = mix
+        self.margin = margin
+        self.default_choice = default_choice
+        self.default_text = default_text
+        self.default_response = default_response
+        self.batch_window = batch_window
+        self.max_concurrency = max_concurrency
+        self._stats = NotificationStats()
+        self._pending: Dict[str, PendingNotification] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._outbox: List[Tuple[str, RespondToNotificationType, Optional[str]]] = []
+        self._sending = 0
+        self._timer_wakeup = asyncio.Event()
+        self._outbox_ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._tasks: List["asyncio.Task[None]"] = []
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Notifications waiting for a response."""
+        return len(self._pending)
+
+    @property
+    def stats(self) -> NotificationStats:
+        """A snapshot of the scheduler's counters."""
+        self._stats.pending = len(self._pending)
+        self._stats.queued = len(self._outbox) + self._sending
+        return NotificationStats(**vars(self._stats))
+
+    def pending_for(self, session_id: str) -> int:
+        """Notifications from one session waiting for a response."""
+        return sum(
+            1 for p in self._pending.values() if p.data.session_id == session_id
+        )
+
+    def get(self, notification_id: str) -> Optional[PendingNotification]:
+        """The pending notification with this ID, if it is still pending."""
+        return self._pending.get(notification_id)
+
+    def next_deadline(self) -> Optional[PendingNotification]:
+        """The pending notification whose default is due first."""
+        self._drop_answered()
+        if not self._heap:
+            return None
+        return self._pending[self._heap[0][2]]
+
+    def feed(self, event: Any) -> Optional[PendingNotification]:
+        """Start tracking a ``notification`` event; other events are ignored.
+
+        Must be called from the event loop the responses are sent on.
+        """
+        if getattr(event, "event", None) != "notification" or self._closed:
+            return None
+        data = event.data
+        if data.id in self._pending:
+            return self._pending[data.id]
+        self._start()
+        created_at = data.created_at
+        if created_at > 1e12:  # milliseconds
+            created_at /= 1000
+        expires_at = created_at + data.timeout
+        remaining = expires_at - time.time()
+        respond_at = time.monotonic() + max(remaining - self.margin, remaining / 2, 0)
+        pending = PendingNotification(data, expires_at, respond_at)
+        self._pending[data.id] = pending
+        self._stats.received += 1
+        self._seq += 1
+        heapq.heappush(self._heap, (respond_at, self._seq, data.id))
+        if self._heap[0][2] == data.id:
+            self._timer_wakeup.set()
+        return pending
+
+    def respond(
+        self,
+        notification_id: str,
+        type_: RespondToNotificationType,
+        value: Optional[str] = None,
+    ) -> bool:
+        """Queue a response to a pending notification.
+
+        Returns:
+            False if the notification is unknown, already answered or was
+            answered with its default
+        """
+        if self._pending.pop(notification_id, None) is None:
+            return False
+        self._stats.answered += 1
+        self._queue(notification_id, type_, value)
+        if len(self._heap) > 2 * len(self._pending) + _COMPACT_AFTER:
+            self._heap = [e for e in self._heap if e[2] in self._pending]
+            heapq.heapify(self._heap)
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every queued response has been sent."""
+        await self._idle.wait()
+
+    async def aclose(self) -> None:
+        """Send queued responses and stop; pending notifications are dropped."""
+        if self._tasks:
+            await self.flush()
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run_timers()),
+                asyncio.create_task(self._run_sender()),
+            ]
+
+    def _queue(
+        self,
+        notification_id: str,
+        type_: RespondToNotificationType,
+        value: Optional[str],
+    ) -> None:
+        self._start()
+        self._outbox.append((notification_id, type_, value))
+        self._idle.clear()
+        self._outbox_ready.set()
+
+    def _default_for(self, data: Any) -> Optional[Response]:
+        if self.default_response is not None:
+            return self.default_response(data)
+        if data.response_type == "choice":
+            choices = data.choices or []
+            if self.default_choice is not None and self.default_choice in choices:
+                return "choice", self.default_choice
+            return ("choice", choices[0]) if choices else None
+        if data.response_type == "text":
+            return "text", self.default_text
+        return "acknowledge", None
+
+    def _drop_answered(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2] not in self._pending:
+            heapq.heappop(heap)
+
+    async def _run_timers(self) -> None:
+        heap = self._heap
+        while True:
+            now = time.monotonic()
+            while heap and heap[0][0] <= now:
+                _, _, notification_id = heapq.heappop(heap)
+                pending = self._pending.pop(notification_id, None)
+                if pending is None:
+                    continue
+                response = self._default_for(pending.data)
+                if response is None:
+                    self._stats.unanswered += 1
+                    continue
+                self._stats.defaulted += 1
+                self._queue(notification_id, *response)
+            self._drop_answered()
+            heap = self._heap
+            self._timer_wakeup.clear()
+            timeout = heap[0][0] - time.monotonic() if heap else None
+            try:
+                await asyncio.wait_for(self._timer_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_sender(self) -> None:
+        while True:
+            await self._outbox_ready.wait()
+            if self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+            batch, self._outbox = self._outbox, []
+            self._outbox_ready.clear()
+            self._sending = len(batch)
+            for start in range(0, len(batch), self.max_concurrency):
+                await asyncio.gather(
+                    *(
+                        self._send(*response)
+                        for response in batch[start : start + self.max_concurrency]
+                    )
+                )
+            self._sending = 0
+            if not self._outbox:
+                self._idle.set()
+
+    async def _send(
+        self,
+        notification_id: str,
+        type_: RespondToNotificationType,
+        value: Optional[str],
+    ) -> None:
+        try:
+            await self.mix.notifications.respond_to_notification_async(
+                id=notification_id, type_=type_, value=value
+            )
+            self._stats.sent += 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._stats.failed += 1
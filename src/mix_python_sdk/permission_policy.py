@@ -0,0 +1,295 @@
+"""Answering permission requests from declarative rules.
+
+When an agent needs approval it emits a ``permission`` event and waits until
+``permissions.grant`` or ``permissions.deny`` is called. For headless runs
+where the answer only depends on the tool, action and path, a
+:class:`PermissionPolicy` makes the decision as soon as the event is read and
+sends the answer in the background, without involving a callback.
+
+Example:
+    ```python
+    policy = PermissionPolicy(mix, [
+        PermissionRule("deny", tool="bash", action="execute"),
+        PermissionRule("grant", tool="read"),
+        PermissionRule("grant", tool="write", path="/workspace/*"),
+    ])
+
+    await send_with_callbacks(
+        mix, session.id, "Tidy up the workspace",
+        permission_policy=policy,
+        on_permission=ask_a_human,  # only for requests no rule matched
+    )
+    ```
+"""
+
+import asyncio
+import collections
+import fnmatch
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
+
+Decision = Literal["grant", "deny"]
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class PermissionRule:
+    """Decides permission requests that match all of its patterns.
+
+    Patterns are shell-style globs (``*``, ``?``, ``[...]``); None matches
+    anything, including requests without a path.
+
+    Attributes:
+        decision: ``"grant"`` or ``"deny"``
+        tool: Tool name pattern
+        action: Action pattern, such as ``"execute"`` or ``"write"``
+        path: Path pattern; requests without a path never match one
+    """
+
+    decision: Decision
+    tool: Optional[str] = None
+    action: Optional[str] = None
+    path: Optional[str] = None
+
+    def __post_init__(self):
+        if self.decision not in ("grant", "deny"):
+            raise ValueError(f"Invalid decision {self.decision!r}")
+
+
+@dataclass
+class PermissionAuditEntry:
+    """Record of a permission request the policy saw.
+
+    Attributes:
+        permission_id: ID of the permission request
+        session_id: Session that asked
+        tool_name: Tool the agent wants to use
+        action: Requested action
+        path: Path the action applies to, if any
+        decision: What the policy answered, or None if no rule matched
+        rule: The rule that matched
+        received_at: ``time.time()`` when the event was read
+        answered_in: Seconds from reading the event to the server accepting
+            the answer, once known
+        error: Why sending the answer failed
+    """
+
+    permission_id: str
+    session_id: str
+    tool_name: str
+    action: str
+    path: Optional[str]
+    decision: Optional[Decision]
+    rule: Optional[PermissionRule]
+    received_at: float
+    answered_in: Optional[float] = None
+    error: Optional[BaseException] = None
+
+
+class _CompiledRule:
+    __slots__ = ("rule", "index", "action", "path")
+
+    def __init__(self, rule: PermissionRule, index: int):
+        self.rule = rule
+        self.index = index
+        self.action = _compile(rule.action)
+        self.path = _compile(rule.path)
+
+    def matches(self, action: str, path: Optional[str]) -> bool:
+        if self.action is not None and not self.action(action):
+            return False
+        if self.path is not None and (path is None or not self.path(path)):
+            return False
+        return True
+
+
+class PermissionPolicy:
+    """Grants or denies permission requests by the first matching rule.
+
+    Rules are indexed by tool name, so deciding a request only checks the
+    rules that can apply to its tool. Answers are sent without blocking the
+    caller: as tasks on the running event loop through the client's pooled
+    async connection, or from a small thread pool when there is no loop,
+    such as in a synchronous stream reader.
+
+    Args:
+        mix: Mix SDK client instance
+        rules: Rules in priority order
+        default: Decision for requests no rule matches; None leaves them to
+            the application
+        audit_size: Number of audit entries kept
+    """
+
+    def __init__(
+        self,
+        mix,
+        rules: Iterable[PermissionRule] = (),
+        *,
+        default: Optional[Decision] = None,
+        audit_size: int = 1000,
+    ):
+        self.mix = mix
+        self.default = default
+        self.audit: Deque[PermissionAuditEntry] = collections.deque(
+            maxlen=audit_size
+        )
+        self._rules: List[PermissionRule] = []
+        self._exact: Dict[str, List[_CompiledRule]] = {}
+        self._globs: List[Tuple[Callable[[str], Any], _CompiledRule]] = []
+        self._by_tool: Dict[str, Tuple[_CompiledRule, ...]] = {}
+        self._pending: Set["asyncio.Task[None]"] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._default_rule = PermissionRule(default) if default else None
+        for rule in rules:
+            self.add(rule)
+
+    @property
+    def rules(self) -> Tuple[PermissionRule, ...]:
+        """The rules in priority order."""
+        return tuple(self._rules)
+
+    def add(self, rule: PermissionRule) -> None:
+        """Append a rule, after all existing ones."""
+        compiled = _CompiledRule(rule, len(self._rules))
+        self._rules.append(rule)
+        if rule.tool is None or _GLOB_CHARS.intersection(rule.tool):
+            self._globs.append((_compile(rule.tool) or _any, compiled))
+        else:
+            self._exact.setdefault(rule.tool, []).append(compiled)
+        self._by_tool.clear()
+
+    def grant(self, **patterns: Optional[str]) -> None:
+        """Append a rule granting matching requests."""
+        self.add(PermissionRule("grant", **patterns))
+
+    def deny(self, **patterns: Optional[str]) -> None:
+        """Append a rule denying matching requests."""
+        self.add(PermissionRule("deny", **patterns))
+
+    def decide(
+        self, tool_name: str, action: str, path: Optional[str] = None
+    ) -> Optional[PermissionRule]:
+        """The rule that decides a request, without answering it."""
+        candidates = self._by_tool.get(tool_name)
+        if candidates is None:
+            candidates = self._resolve(tool_name)
+        for compiled in candidates:
+            if compiled.matches(action, path):
+                return compiled.rule
+        return self._default_rule
+
+    def feed(self, event: Any) -> Optional[Decision]:
+        """Answer a ``permission`` event if a rule decides it.
+
+        Other events are ignored, so this can be registered on an
+        :class:`~mix_python_sdk.router.EventRouter` for ``"*"`` or
+        ``"permission"``.
+
+        Returns:
+            The decision being sent, or None if the request was not decided
+        """
+        if getattr(event, "event", None) != "permission":
+            return None
+        data = event.data
+        tool_name = getattr(data.tool_name, "value", data.tool_name)
+        rule = self.decide(tool_name, data.action, data.path)
+        entry = PermissionAuditEntry(
+            permission_id=data.id,
+            session_id=data.session_id,
+            tool_name=tool_name,
+            action=data.action,
+            path=data.path,
+            decision=rule.decision if rule is not None else None,
+            rule=rule,
+            received_at=time.time(),
+        )
+        self.audit.append(entry)
+        if rule is None:
+            return None
+        self._answer(entry, time.monotonic())
+        return rule.decision
+
+    async def drain(self) -> None:
+        """Wait for the answers sent from the event loop so far."""
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def close(self) -> None:
+        """Wait for answers sent from the thread pool and shut it down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _resolve(self, tool_name: str) -> Tuple[_CompiledRule, ...]:
+        candidates = list(self._exact.get(tool_name, ()))
+        candidates.extend(
+            compiled for match, compiled in self._globs if match(tool_name)
+        )
+        candidates.sort(key=lambda compiled: compiled.index)
+        resolved = self._by_tool[tool_name] = tuple(candidates)
+        return resolved
+
+    def _answer(self, entry: PermissionAuditEntry, started: float) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            task = loop.create_task(self._answer_async(entry, started))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="mix-permission"
+            )
+        self._executor.submit(self._answer_sync, entry, started)
+
+    async def _answer_async(self, entry: PermissionAuditEntry, started: float) -> None:
+        permissions = self.mix.permissions
+        call = (
+            permissions.grant_async
+            if entry.decision == "grant"
+            else permissions.deny_async
+        )
+        try:
+            await call(id=entry.permission_id)
+            entry.answered_in = time.monotonic() - started
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            entry.error = e
+
+    def _answer_sync(self, entry: PermissionAuditEntry, started: float) -> None:
+        permissions = self.mix.permissions
+        call = permissions.grant if entry.decision == "grant" else permissions.deny
+        try:
+            call(id=entry.permission_id)
+            entry.answered_in = time.monotonic() - started
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            entry.error = e
+
+
+def _any(_: str) -> bool:
+    return True
+
+
+def _compile(pattern: Optional[str]) -> Optional[Callable[[str], Any]]:
+    if pattern is None:
+        return None
+    if not _GLOB_CHARS.intersection(pattern):
+        return pattern.__eq__
+    return re.compile(fnmatch.translate(pattern)).match
@@ -0,0 +1,216 @@
+"""Dispatch-table routing of SSE events to handlers.
+
+Handlers are registered per SSE event tag (``"content"``, ``"tool_use_start"``,
+...), optionally narrowed to a single subagent or assistant message, and are
+looked up by the event's tag in a single dictionary access instead of testing
+the event against every model class in turn.
+
+Example:
+    ```python
+    router = EventRouter()
+
+    @router.route("content")
+    def print_content(event):
+        print(event.data.content, end="", flush=True)
+
+    @router.route("*", priority=10)
+    async def audit(event):
+        await audit_log.write(event)
+
+    async for event in event_stream:
+        await router.dispatch(event)
+    ```
+"""
+
+import inspect
+import itertools
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+Handler = Callable[[Any], Union[None, Awaitable[None]]]
+
+WILDCARD = "*"
+"""Tag that matches every event type."""
+
+SCOPE_FIELDS = ("parent_tool_call_id", "assistant_message_id")
+"""Event data fields handlers can be scoped to."""
+
+
+class _Route(NamedTuple):
+    # Sorted ascending, so priority is stored negated and ties keep
+    # registration order.
+    order: Tuple[int, int]
+    handler: Handler
+    is_async: bool
+
+
+_RouteKey = Tuple[str, Optional[str], Optional[str]]
+
+
+class EventRouter:
+    """Routes SSE events to sync and async handlers by event type.
+
+    Handlers run in descending ``priority`` order; handlers with equal
+    priority run in registration order. Handlers registered for ``"*"``
+    receive every event, merged into the same ordering as type-specific ones.
+    """
+
+    def __init__(self) -> None:
+        self._routes: Dict[_RouteKey, List[_Route]] = {}
+        # Resolved, sorted handlers per tag for unscoped routes.
+        self._table: Dict[str, Tuple[_Route, ...]] = {}
+        self._scoped: Set[str] = set()
+        self._seq = itertools.count()
+
+    def on(
+        self,
+        event_type: str,
+        handler: Handler,
+        *,
+        priority: int = 0,
+        parent_tool_call_id: Optional[str] = None,
+        assistant_message_id: Optional[str] = None,
+    ) -> Handler:
+        """Register a handler.
+
+        Args:
+            event_type: SSE event tag to handle, or ``"*"`` for all events
+            handler: Callable receiving the SSE event; may be a coroutine function
+            priority: Handlers with higher priority run first
+            parent_tool_call_id: Only handle events from this subagent
+            assistant_message_id: Only handle events for this assistant message
+
+        Returns:
+            The handler, so ``on`` can be used to build decorators
+        """
+        if parent_tool_call_id is not None and assistant_message_id is not None:
+            raise ValueError(
+                "Scope a handler by parent_tool_call_id or assistant_message_id, not both"
+            )
+
+        key: _RouteKey = (event_type, None, None)
+        if parent_tool_call_id is not None:
+            key = (event_type, "parent_tool_call_id", parent_tool_call_id)
+        elif assistant_message_id is not None:
+            key = (event_type, "assistant_message_id", assistant_message_id)
+
+        route = _Route(
+            (-priority, next(self._seq)),
+            handler,
+            inspect.iscoroutinefunction(handler),
+        )
+        routes = self._routes.setdefault(key, [])
+        routes.append(route)
+        routes.sort()
+        if key[1] is not None:
+            self._scoped.add(event_type)
+        self._table.clear()
+        return handler
+
+    def route(
+        self,
+        event_type: str,
+        *,
+        priority: int = 0,
+        parent_tool_call_id: Optional[str] = None,
+        assistant_message_id: Optional[str] = None,
+    ) -> Callable[[Handler], Handler]:
+        """Decorator form of :meth:`on`."""
+
+        def decorator(handler: Handler) -> Handler:
+            return self.on(
+                event_type,
+                handler,
+                priority=priority,
+                parent_tool_call_id=parent_tool_call_id,
+                assistant_message_id=assistant_message_id,
+            )
+
+        return decorator
+
+    def remove(self, handler: Handler) -> bool:
+        """Unregister every route for ``handler``.
+
+        Returns:
+            True if the handler was registered
+        """
+        removed = False
+        for key in list(self._routes):
+            routes = [r for r in self._routes[key] if r.handler is not handler]
+            if len(routes) != len(self._routes[key]):
+                removed = True
+                if routes:
+                    self._routes[key] = routes
+                else:
+                    del self._routes[key]
+        if removed:
+            self._scoped = {k[0] for k in self._routes if k[1] is not None}
+            self._table.clear()
+        return removed
+
+    def _handlers_for(self, event: Any) -> Tuple[_Route, ...]:
+        tag = event.event
+        routes = self._table.get(tag)
+        if routes is None:
+            routes = self._resolve(tag)
+        if self._scoped and (tag in self._scoped or WILDCARD in self._scoped):
+            routes = self._with_scoped(tag, event, routes)
+        return routes
+
+    async def dispatch(self, event: Any) -> None:
+        """Run every handler matching ``event``, awaiting async ones."""
+        for route in self._handlers_for(event):
+            result = route.handler(event)
+            if route.is_async or (result is not None and inspect.isawaitable(result)):
+                await result  # type: ignore[misc]
+
+    def dispatch_sync(self, event: Any) -> None:
+        """Run every handler matching ``event`` without an event loop.
+
+        Raises:
+            TypeError: If a matching handler is asynchronous
+        """
+        for route in self._handlers_for(event):
+            if route.is_async:
+                raise TypeError(
+                    f"Handler {route.handler!r} is async; use dispatch() instead"
+                )
+            result = route.handler(event)
+            if result is not None and inspect.isawaitable(result):
+                if inspect.iscoroutine(result):
+                    result.close()
+                raise TypeError(
+                    f"Handler {route.handler!r} returned an awaitable; use dispatch() instead"
+                )
+
+    def _resolve(self, tag: str) -> Tuple[_Route, ...]:
+        specific = self._routes.get((tag, None, None), [])
+        wildcard = self._routes.get((WILDCARD, None, None), [])
+        routes = tuple(sorted(specific + wildcard)) if wildcard else tuple(specific)
+        self._table[tag] = routes
+        return routes
+
+    def _with_scoped(
+        self, tag: str, event: Any, routes: Tuple[_Route, ...]
+    ) -> Tuple[_Route, ...]:
+        data = getattr(event, "data", None)
+        extra: List[_Route] = []
+        for field in SCOPE_FIELDS:
+            value = getattr(data, field, None)
+            if value is None:
+                continue
+            extra.extend(self._routes.get((tag, field, value), ()))
+            extra.extend(self._routes.get((WILDCARD, field, value), ()))
+        if not extra:
+            return routes
+        return tuple(sorted(routes + tuple(extra)))
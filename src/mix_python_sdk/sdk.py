@@ -1,20 +1,36 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
+import asyncio
 from .basesdk import BaseSDK
 from .httpclient import AsyncHttpClient, ClientOwner, HttpClient, close_clients
+from .threadclient import PerThreadClient
 from .sdkconfiguration import SDKConfiguration
 from .utils.logger import Logger, get_default_logger
 from .utils.retries import RetryConfig
+import functools
 import httpx
 import importlib
+import logging
 from mix_python_sdk._hooks import SDKHooks
 from mix_python_sdk.types import OptionalNullable, UNSET
+import os
 import sys
-from typing import Optional, TYPE_CHECKING, cast
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Union,
+    cast,
+)
 import weakref
 
 if TYPE_CHECKING:
     from mix_python_sdk.authentication import Authentication
+    from mix_python_sdk.endpoints import EndpointRouter
     from mix_python_sdk.files import Files
     from mix_python_sdk.health import Health
     from mix_python_sdk.internal import Internal
@@ -23,6 +39,7 @@ if TYPE_CHECKING:
     from mix_python_sdk.permissions import Permissions
     from mix_python_sdk.preferences import Preferences
     from mix_python_sdk.sessions import Sessions
+    from mix_python_sdk.streamhub import StreamHub
     from mix_python_sdk.streaming import Streaming
     from mix_python_sdk.system import System
     from mix_python_sdk.tools import Tools
@@ -60,26 +77,41 @@ class Mix(BaseSDK):
 
     def __init__(
         self,
-        server_url: str,
+        server_url: Union[str, Sequence[str], "EndpointRouter"],
         client: Optional[HttpClient] = None,
         async_client: Optional[AsyncHttpClient] = None,
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        client_factory: Optional[Callable[[], HttpClient]] = None,
+        async_client_factory: Optional[Callable[[], AsyncHttpClient]] = None,
     ) -> None:
         r"""Instantiates the SDK configuring it with the provided parameters.
 
         :param server_idx: The index of the server to use for all methods
-        :param server_url: The server URL to use for all methods
+        :param server_url: The server URL to use for all methods, or several URLs (or an EndpointRouter) to route requests to the healthiest server
         :param url_params: Parameters to optionally template the server URL with
         :param client: The HTTP client to use for all synchronous methods
         :param async_client: The Async HTTP client to use for all asynchronous methods
         :param retry_config: The retry configuration to use for all supported methods
         :param timeout_ms: Optional request timeout applied to each operation in milliseconds
+        :param client_factory: Creates the HTTP client for synchronous methods, instead of client; it is called again after fork() and when unpickling, so it must be picklable
+        :param async_client_factory: Creates the Async HTTP client, instead of async_client; see client_factory
         """
+        if client is not None and client_factory is not None:
+            raise ValueError("pass either client or client_factory, not both")
+        if async_client is not None and async_client_factory is not None:
+            raise ValueError(
+                "pass either async_client or async_client_factory, not both"
+            )
+        self.__dict__["_client_factory"] = client_factory or _default_client
+        self.__dict__["_async_client_factory"] = (
+            async_client_factory or _default_async_client
+        )
+
         client_supplied = True
         if client is None:
-            client = httpx.Client(follow_redirects=True)
+            client = self._client_factory()
             client_supplied = False
 
         assert issubclass(
@@ -88,7 +120,7 @@ class Mix(BaseSDK):
 
         async_client_supplied = True
         if async_client is None:
-            async_client = httpx.AsyncClient(follow_redirects=True)
+            async_client = self._async_client_factory()
             async_client_supplied = False
 
         if debug_logger is None:
@@ -98,6 +130,23 @@ class Mix(BaseSDK):
             type(async_client), AsyncHttpClient
         ), "The provided async_client must implement the AsyncHttpClient protocol."
 
+        endpoints = None
+        if not isinstance(server_url, str):
+            from mix_python_sdk.endpoints import (
+                AsyncFailoverClient,
+                EndpointRouter,
+                FailoverClient,
+            )
+
+            endpoints = (
+                server_url
+                if isinstance(server_url, EndpointRouter)
+                else EndpointRouter(server_url)
+            )
+            server_url = endpoints.primary
+            client = FailoverClient(client, endpoints)
+            async_client = AsyncFailoverClient(async_client, endpoints)
+
         BaseSDK.__init__(
             self,
             SDKConfiguration(
@@ -120,7 +169,18 @@ class Mix(BaseSDK):
 
         self.sdk_configuration = hooks.sdk_init(self.sdk_configuration)
 
-        weakref.finalize(
+        self.__dict__["_endpoints"] = endpoints
+        if endpoints is not None:
+            endpoints.start(self)
+
+        self._track_clients()
+        _live_clients.add(self)
+
+    def _track_clients(self) -> None:
+        finalizer = self.__dict__.get("_finalizer")
+        if finalizer is not None:
+            finalizer.detach()
+        self.__dict__["_finalizer"] = weakref.finalize(
             self,
             close_clients,
             cast(ClientOwner, self.sdk_configuration),
@@ -130,6 +190,73 @@ class Mix(BaseSDK):
             self.sdk_configuration.async_client_supplied,
         )
 
+    def _after_fork(self) -> None:
+        r"""Replace the connection pools inherited from the parent process.
+
+        The inherited connections are the parent's, so they are dropped without
+        being closed. Clients passed in by the caller are left alone.
+        """
+        config = self.sdk_configuration
+        finalizer = self.__dict__.pop("_finalizer", None)
+        if finalizer is not None:
+            finalizer.detach()
+        self.__dict__.pop("_stream_hub", None)
+        endpoints = self.endpoints
+        client: Any = None
+        async_client: Any = None
+        if config.client is not None and not config.client_supplied:
+            client = self._client_factory()
+        if config.async_client is not None and not config.async_client_supplied:
+            async_client = self._async_client_factory()
+        if endpoints is not None:
+            from mix_python_sdk.endpoints import AsyncFailoverClient, FailoverClient
+
+            # pylint: disable-next=protected-access
+            endpoints._after_fork()
+            if client is not None:
+                client = FailoverClient(client, endpoints)
+            if async_client is not None:
+                async_client = AsyncFailoverClient(async_client, endpoints)
+            endpoints.start(self)
+        if client is not None:
+            config.client = client
+        if async_client is not None:
+            config.async_client = async_client
+        self._track_clients()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        r"""Reduce the client to its configuration, for sending it to another process.
+
+        Open connections, streams and registered hooks are not carried over.
+        Client factories are pickled as they are, and a supplied PerThreadClient
+        is recreated from the options it was created with. TypeError is raised
+        for any other supplied client; pass a client factory instead.
+        """
+        config = self.sdk_configuration
+        state: Dict[str, Any] = {
+            "server_url": self.endpoints or config.server_url,
+            "timeout_ms": config.timeout_ms,
+        }
+        # UNSET is compared by identity, so it must not be copied.
+        if config.retry_config is not UNSET:
+            state["retry_config"] = config.retry_config
+        if isinstance(config.debug_logger, logging.Logger):
+            state["debug_logger"] = config.debug_logger
+        if config.client_supplied:
+            state["client_factory"] = _factory_for(config.client)
+        elif self._client_factory is not _default_client:
+            state["client_factory"] = self._client_factory
+        if config.async_client_supplied:
+            state["async_client_factory"] = _factory_for(config.async_client)
+        elif self._async_client_factory is not _default_async_client:
+            state["async_client_factory"] = self._async_client_factory
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # The clients are built from factories here, so they are closed with
+        # the SDK and rebuilt after fork().
+        self.__init__(**state)  # pylint: disable=unnecessary-dunder-call
+
     def dynamic_import(self, modname, retries=3):
         for attempt in range(retries):
             try:
@@ -145,10 +272,15 @@ class Mix(BaseSDK):
         if name in self._sub_sdk_map:
             module_path, class_name = self._sub_sdk_map[name]
             try:
-                module = self.dynamic_import(module_path)
-                klass = getattr(module, class_name)
-                instance = klass(self.sdk_configuration, parent_ref=self)
-                setattr(self, name, instance)
+                # Threads racing on first access must all get the same instance.
+                with _lazy_lock:
+                    instance = self.__dict__.get(name)
+                    if instance is not None:
+                        return instance
+                    module = self.dynamic_import(module_path)
+                    klass = getattr(module, class_name)
+                    instance = klass(self.sdk_configuration, parent_ref=self)
+                    setattr(self, name, instance)
                 return instance
             except ImportError as e:
                 raise AttributeError(
@@ -163,6 +295,21 @@ class Mix(BaseSDK):
             f"'{type(self).__name__}' object has no attribute '{name}'"
         )
 
+    @property
+    def stream_hub(self) -> "StreamHub":
+        r"""Shared per-session event streams for this client, created on first use."""
+        hub = self.__dict__.get("_stream_hub")
+        if hub is None:
+            from mix_python_sdk.streamhub import StreamHub
+
+            hub = self.__dict__["_stream_hub"] = StreamHub(self)
+        return hub
+
+    @property
+    def endpoints(self) -> Optional["EndpointRouter"]:
+        r"""The router across servers when several server URLs were given."""
+        return self.__dict__.get("_endpoints")
+
     def __dir__(self):
         default_attrs = list(super().__dir__())
         lazy_attrs = list(self._sub_sdk_map.keys())
@@ -175,6 +322,8 @@ class Mix(BaseSDK):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.endpoints is not None:
+            self.endpoints.stop()
         if (
             self.sdk_configuration.client is not None
             and not self.sdk_configuration.client_supplied
@@ -183,9 +332,58 @@ class Mix(BaseSDK):
         self.sdk_configuration.client = None
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        hub = self.__dict__.pop("_stream_hub", None)
+        if hub is not None:
+            await hub.aclose()
+        if self.endpoints is not None:
+            await asyncio.to_thread(self.endpoints.stop)
         if (
             self.sdk_configuration.async_client is not None
             and not self.sdk_configuration.async_client_supplied
         ):
             await self.sdk_configuration.async_client.aclose()
         self.sdk_configuration.async_client = None
+
+
+def _default_client() -> httpx.Client:
+    return httpx.Client(follow_redirects=True)
+
+
+def _default_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(follow_redirects=True)
+
+
+def _factory_for(client: Any) -> Callable[[], Any]:
+    inner = getattr(client, "client", None)
+    if isinstance(inner, (httpx.Client, httpx.AsyncClient, PerThreadClient)):
+        client = inner  # unwrap a FailoverClient
+    if isinstance(client, PerThreadClient):
+        return functools.partial(
+            PerThreadClient,
+            client.max_connections,
+            connections_per_thread=client.connections_per_thread,
+            **client.client_options,
+        )
+    # httpx keeps transport settings such as limits, TLS and proxies only in
+    # the transports it builds, so a client made elsewhere cannot be rebuilt
+    # faithfully.
+    raise TypeError(
+        f"Cannot pickle Mix with a supplied {type(client).__name__}; "
+        "pass client_factory= instead, such as "
+        "functools.partial(httpx.Client, ...)"
+    )
+
+
+_live_clients: "weakref.WeakSet[Mix]" = weakref.WeakSet()
+_lazy_lock = threading.RLock()
+
+
+def _after_fork_in_child() -> None:
+    global _lazy_lock  # pylint: disable=global-statement
+    _lazy_lock = threading.RLock()
+    for mix in list(_live_clients):
+        mix._after_fork()  # pylint: disable=protected-access
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,177 @@
+"""Pre-created sessions with their streams already connected.
+
+Creating a session and opening its stream costs a few round trips plus the
+wait for the stream to settle, all before the first message can be sent. A
+:class:`SessionPool` does that work ahead of time: it keeps ``size`` sessions
+created and connected through a :class:`~mix_python_sdk.streamhub.StreamHub`,
+hands them out as :class:`~mix_python_sdk.helpers.StreamingSession` objects,
+and creates replacements in the background.
+
+Example:
+    ```python
+    async with Mix(server_url="http://localhost:8088") as mix:
+        async with SessionPool(mix, title="Support", size=8) as pool:
+
+            async def handle(request):
+                async with await pool.acquire() as session:
+                    await session.send(request.text, on_content=...)
+    ```
+"""
+
+import asyncio
+import collections
+from typing import Deque, Optional
+
+from mix_python_sdk.helpers import StreamingSession
+from mix_python_sdk.models import CreateSessionBrowserMode
+from mix_python_sdk.streamhub import StreamHub
+
+# Backoff between failed refill attempts, in seconds.
+_RETRY_MIN = 1.0
+_RETRY_MAX = 30.0
+
+
+class SessionPool:
+    """Keeps ``size`` sessions created and connected, ready to hand out.
+
+    Sessions are single use: each one acquired is deleted when its ``async
+    with`` block exits, and the pool creates a replacement in the background.
+    If the pool is empty, :meth:`acquire` creates a session on the spot, so
+    errors from the server reach the caller instead of leaving it waiting.
+    Failed background refills are retried with exponential backoff.
+
+    Args:
+        mix: Mix SDK client instance
+        title: Title for every pooled session
+        size: Number of sessions to keep ready
+        custom_system_prompt: Optional custom system prompt for every session
+        browser_mode: Browser automation mode for every session
+        hub: StreamHub that holds the connections; defaults to
+            ``mix.stream_hub``
+    """
+
+    def __init__(
+        self,
+        mix,
+        title: str,
+        *,
+        size: int = 4,
+        custom_system_prompt: Optional[str] = None,
+        browser_mode: CreateSessionBrowserMode = "local-browser-service",
+        hub: Optional[StreamHub] = None,
+    ):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.mix = mix
+        self.title = title
+        self.size = size
+        self.custom_system_prompt = custom_system_prompt
+        self.browser_mode = browser_mode
+        self.hub = hub if hub is not None else mix.stream_hub
+        self._ready: Deque[StreamingSession] = collections.deque()
+        self._wakeup = asyncio.Event()
+        self._refill_task: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+
+    @property
+    def available(self) -> int:
+        """Sessions ready to be acquired without waiting."""
+        return len(self._ready)
+
+    async def start(self) -> None:
+        """Fill the pool and start refilling it in the background."""
+        if self._closed:
+            raise RuntimeError("SessionPool is closed")
+        if self._refill_task is not None:
+            return
+        missing = self.size - len(self._ready)
+        results = await asyncio.gather(
+            *(self._warm() for _ in range(missing)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, StreamingSession):
+                self._ready.append(result)
+        self._refill_task = asyncio.create_task(self._refill())
+        if len(self._ready) < self.size:
+            self._wakeup.set()
+
+    async def acquire(self) -> StreamingSession:
+        """Take a ready session, or create one if none is ready.
+
+        Returns:
+            A StreamingSession whose session already exists; use it as an
+            async context manager so it is deleted afterwards
+        """
+        if self._closed:
+            raise RuntimeError("SessionPool is closed")
+        if self._refill_task is None:
+            self._refill_task = asyncio.create_task(self._refill())
+        self._wakeup.set()
+        if self._ready:
+            return self._ready.popleft()
+        return await self._warm()
+
+    async def aclose(self) -> None:
+        """Stop refilling and delete the sessions that were never acquired."""
+        self._closed = True
+        task, self._refill_task = self._refill_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        idle = list(self._ready)
+        self._ready.clear()
+        await asyncio.gather(
+            *(session.__aexit__(None, None, None) for session in idle),
+            return_exceptions=True,
+        )
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _refill(self) -> None:
+        delay = _RETRY_MIN
+        while not self._closed:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while not self._closed and len(self._ready) < self.size:
+                try:
+                    session = await self._warm()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:  # pylint: disable=broad-exception-caught
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, _RETRY_MAX)
+                    continue
+                delay = _RETRY_MIN
+                self._ready.append(session)
+
+    async def _warm(self) -> StreamingSession:
+        session = StreamingSession(
+            self.mix,
+            title=self.title,
+            custom_system_prompt=self.custom_system_prompt,
+            hub=self.hub,
+            browser_mode=self.browser_mode,
+        )
+        await session.__aenter__()
+        try:
+            # Never read: the subscription only keeps the hub's connection
+            # open. Once its one-event buffer overflows it stops receiving
+            # events, but the connection stays open until it is closed.
+            subscription = self.hub.subscribe(session.id, queue_size=1)
+            # pylint: disable-next=protected-access
+            session._warm_subscription = subscription
+            await subscription.connect()
+            if subscription.new_connection:
+                await asyncio.sleep(0.5)  # Allow stream connection to establish
+        except BaseException:
+            await session.__aexit__(None, None, None)
+            raise
+        return session
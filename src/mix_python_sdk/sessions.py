@@ -4,6 +4,7 @@ from .basesdk import BaseSDK
 from mix_python_sdk import errors, models, utils
 from mix_python_sdk._hooks import HookContext
 from mix_python_sdk.types import OptionalNullable, UNSET
+from mix_python_sdk.utils import jsonstreaming
 from mix_python_sdk.utils.unmarshal_json_response import unmarshal_json_response
 from typing import Any, List, Mapping, Optional, Union
 
@@ -1187,6 +1188,226 @@ class Sessions(BaseSDK):
 
         raise errors.MixDefaultError("Unexpected response received", http_res)
 
+    def export_session_stream(
+        self,
+        *,
+        id: str,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> models.ExportSessionStreamResponse:
+        r"""Export session transcript incrementally
+
+        Export the session transcript like `export_session`, but decode the response body as it arrives and yield each message once it has been validated. Session-level fields are collected into `result.metadata` as they are read, so memory stays bounded by the largest single message instead of the whole transcript. Unlike the messages, they are plain decoded JSON values keyed by their JSON names, not validated models.
+
+        :param id: Session ID to export
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        base_url = None
+        url_variables = None
+        if timeout_ms is None:
+            timeout_ms = self.sdk_configuration.timeout_ms
+
+        if server_url is not None:
+            base_url = server_url
+        else:
+            base_url = self._get_url(base_url, url_variables)
+
+        request = models.ExportSessionRequest(
+            id=id,
+        )
+
+        req = self._build_request(
+            method="GET",
+            path="/api/sessions/{id}/export",
+            base_url=base_url,
+            url_variables=url_variables,
+            request=request,
+            request_body_required=False,
+            request_has_path_params=True,
+            request_has_query_params=False,
+            user_agent_header="user-agent",
+            accept_header_value="application/json",
+            http_headers=http_headers,
+            allow_empty_value=None,
+            timeout_ms=timeout_ms,
+        )
+
+        if retries == UNSET:
+            if self.sdk_configuration.retry_config is not UNSET:
+                retries = self.sdk_configuration.retry_config
+            else:
+                retries = utils.RetryConfig(
+                    "backoff", utils.BackoffStrategy(500, 60000, 1.5, 600000), True
+                )
+
+        retry_config = None
+        if isinstance(retries, utils.RetryConfig):
+            retry_config = (retries, ["5XX", "408", "429"])
+
+        http_res = self.do_request(
+            hook_ctx=HookContext(
+                config=self.sdk_configuration,
+                base_url=base_url or "",
+                operation_id="exportSession",
+                oauth2_scopes=None,
+                security_source=None,
+            ),
+            request=req,
+            error_status_codes=["404", "4XX", "500", "5XX"],
+            stream=True,
+            retry_config=retry_config,
+        )
+
+        response_data: Any = None
+        if utils.match_response(http_res, "200", "application/json"):
+            return models.ExportSessionStreamResponse(
+                result=jsonstreaming.JSONArrayStream(
+                    http_res,
+                    lambda raw: utils.unmarshal_json(raw, models.ExportMessage),
+                    "messages",
+                    client_ref=self,
+                ),
+                headers=utils.get_response_headers(http_res.headers),
+            )
+        if utils.match_response(http_res, "404", "application/json"):
+            http_res_text = utils.stream_to_text(http_res)
+            response_data = unmarshal_json_response(
+                errors.ErrorResponseData, http_res, http_res_text
+            )
+            raise errors.ErrorResponse(response_data, http_res, http_res_text)
+        if utils.match_response(http_res, "500", "application/json"):
+            http_res_text = utils.stream_to_text(http_res)
+            response_data = unmarshal_json_response(
+                errors.ErrorResponseData, http_res, http_res_text
+            )
+            raise errors.ErrorResponse(response_data, http_res, http_res_text)
+        if utils.match_response(http_res, "4XX", "*"):
+            http_res_text = utils.stream_to_text(http_res)
+            raise errors.MixDefaultError("API error occurred", http_res, http_res_text)
+        if utils.match_response(http_res, "5XX", "*"):
+            http_res_text = utils.stream_to_text(http_res)
+            raise errors.MixDefaultError("API error occurred", http_res, http_res_text)
+
+        http_res_text = utils.stream_to_text(http_res)
+        raise errors.MixDefaultError(
+            "Unexpected response received", http_res, http_res_text
+        )
+
+    async def export_session_stream_async(
+        self,
+        *,
+        id: str,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> models.ExportSessionStreamResponse:
+        r"""Export session transcript incrementally
+
+        Export the session transcript like `export_session`, but decode the response body as it arrives and yield each message once it has been validated. Session-level fields are collected into `result.metadata` as they are read, so memory stays bounded by the largest single message instead of the whole transcript. Unlike the messages, they are plain decoded JSON values keyed by their JSON names, not validated models.
+
+        :param id: Session ID to export
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        base_url = None
+        url_variables = None
+        if timeout_ms is None:
+            timeout_ms = self.sdk_configuration.timeout_ms
+
+        if server_url is not None:
+            base_url = server_url
+        else:
+            base_url = self._get_url(base_url, url_variables)
+
+        request = models.ExportSessionRequest(
+            id=id,
+        )
+
+        req = self._build_request_async(
+            method="GET",
+            path="/api/sessions/{id}/export",
+            base_url=base_url,
+            url_variables=url_variables,
+            request=request,
+            request_body_required=False,
+            request_has_path_params=True,
+            request_has_query_params=False,
+            user_agent_header="user-agent",
+            accept_header_value="application/json",
+            http_headers=http_headers,
+            allow_empty_value=None,
+            timeout_ms=timeout_ms,
+        )
+
+        if retries == UNSET:
+            if self.sdk_configuration.retry_config is not UNSET:
+                retries = self.sdk_configuration.retry_config
+            else:
+                retries = utils.RetryConfig(
+                    "backoff", utils.BackoffStrategy(500, 60000, 1.5, 600000), True
+                )
+
+        retry_config = None
+        if isinstance(retries, utils.RetryConfig):
+            retry_config = (retries, ["5XX", "408", "429"])
+
+        http_res = await self.do_request_async(
+            hook_ctx=HookContext(
+                config=self.sdk_configuration,
+                base_url=base_url or "",
+                operation_id="exportSession",
+                oauth2_scopes=None,
+                security_source=None,
+            ),
+            request=req,
+            error_status_codes=["404", "4XX", "500", "5XX"],
+            stream=True,
+            retry_config=retry_config,
+        )
+
+        response_data: Any = None
+        if utils.match_response(http_res, "200", "application/json"):
+            return models.ExportSessionStreamResponse(
+                result=jsonstreaming.JSONArrayStreamAsync(
+                    http_res,
+                    lambda raw: utils.unmarshal_json(raw, models.ExportMessage),
+                    "messages",
+                    client_ref=self,
+                ),
+                headers=utils.get_response_headers(http_res.headers),
+            )
+        if utils.match_response(http_res, "404", "application/json"):
+            http_res_text = await utils.stream_to_text_async(http_res)
+            response_data = unmarshal_json_response(
+                errors.ErrorResponseData, http_res, http_res_text
+            )
+            raise errors.ErrorResponse(response_data, http_res, http_res_text)
+        if utils.match_response(http_res, "500", "application/json"):
+            http_res_text = await utils.stream_to_text_async(http_res)
+            response_data = unmarshal_json_response(
+                errors.ErrorResponseData, http_res, http_res_text
+            )
+            raise errors.ErrorResponse(response_data, http_res, http_res_text)
+        if utils.match_response(http_res, "4XX", "*"):
+            http_res_text = await utils.stream_to_text_async(http_res)
+            raise errors.MixDefaultError("API error occurred", http_res, http_res_text)
+        if utils.match_response(http_res, "5XX", "*"):
+            http_res_text = await utils.stream_to_text_async(http_res)
+            raise errors.MixDefaultError("API error occurred", http_res, http_res_text)
+
+        http_res_text = await utils.stream_to_text_async(http_res)
+        raise errors.MixDefaultError(
+            "Unexpected response received", http_res, http_res_text
+        )
+
     def rewind_session(
         self,
         *,
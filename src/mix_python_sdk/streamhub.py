@@ -0,0 +1,294 @@
+"""Shared SSE connections for sessions with several consumers.
+
+A :class:`StreamHub` keeps at most one ``/stream`` connection open per session
+and fans every event out to all of that session's subscribers. Each subscriber
+reads from its own bounded buffer, so a slow consumer cannot hold up the
+others; one that falls more than ``queue_size`` events behind is disconnected
+with :class:`~mix_python_sdk.errors.StreamOverflowError`.
+
+Example:
+    ```python
+    async with Mix(server_url="http://localhost:8088") as mix:
+        async with mix.stream_hub.subscribe(session.id) as events:
+            async for event in events:
+                ...
+    ```
+"""
+
+import asyncio
+import collections
+from typing import Any, Deque, Dict, Optional, Set
+
+from mix_python_sdk.errors import StreamOverflowError
+
+# Events that describe the connection rather than the session; they are not
+# kept for replay.
+_CONNECTION_EVENTS = frozenset(("connected", "heartbeat"))
+
+
+class StreamSubscription:
+    """One consumer of a session stream shared through a :class:`StreamHub`.
+
+    Use as an async context manager and iterate it for SSE events. Iteration
+    ends when the connection closes; errors from the connection, or a
+    :class:`~mix_python_sdk.errors.StreamOverflowError` if this subscriber
+    fell behind, are raised once the events buffered before them are consumed.
+    """
+
+    session_id: str
+    replay: int
+    queue_size: int
+    new_connection: bool
+    """True if subscribing opened the connection rather than joining one."""
+
+    def __init__(self, hub: "StreamHub", session_id: str, replay: int, queue_size: int):
+        self.session_id = session_id
+        self.replay = replay
+        self.queue_size = queue_size
+        self.new_connection = False
+        self._hub = hub
+        self._channel: Optional[_Channel] = None
+        self._buffer: Deque[Any] = collections.deque()
+        self._ready = asyncio.Event()
+        self._done = False
+        self._error: Optional[BaseException] = None
+
+    async def connect(self) -> "StreamSubscription":
+        """Attach to the session stream, opening the connection if needed."""
+        if self._channel is None and not self._done:
+            await self._hub._attach(self)  # pylint: disable=protected-access
+        return self
+
+    async def aclose(self) -> None:
+        """Stop receiving events and release this subscriber's reference."""
+        self._finish(None)
+        channel, self._channel = self._channel, None
+        if channel is not None:
+            await self._hub._detach(self, channel)  # pylint: disable=protected-access
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._buffer:
+            if self._done:
+                if self._error is not None:
+                    error, self._error = self._error, None
+                    raise error
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        return self._buffer.popleft()
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _deliver(self, event: Any) -> bool:
+        if self._done:
+            return False
+        if len(self._buffer) >= self.queue_size:
+            self._finish(
+                StreamOverflowError(
+                    f"Subscriber to session {self.session_id} fell more than "
+                    f"{self.queue_size} events behind"
+                )
+            )
+            return False
+        self._buffer.append(event)
+        self._ready.set()
+        return True
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        if self._done:
+            return
+        self._done = True
+        self._error = error
+        self._ready.set()
+
+
+class _Channel:
+    __slots__ = ("session_id", "subscribers", "history", "task", "connected", "idle")
+
+    def __init__(self, session_id: str, replay_size: int):
+        self.session_id = session_id
+        self.subscribers: Set[StreamSubscription] = set()
+        self.history: Deque[Any] = collections.deque(maxlen=replay_size)
+        self.task: Optional["asyncio.Task[None]"] = None
+        self.connected: "asyncio.Future[None]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.idle: Optional[asyncio.TimerHandle] = None
+
+    def publish(self, event: Any) -> None:
+        if getattr(event, "event", None) not in _CONNECTION_EVENTS:
+            self.history.append(event)
+        dropped = [s for s in self.subscribers if not s._deliver(event)]  # pylint: disable=protected-access
+        for subscriber in dropped:
+            self.subscribers.discard(subscriber)
+
+
+class StreamHub:
+    """Shares one SSE connection per session between any number of consumers.
+
+    Connections are reference counted by subscriber. When the last subscriber
+    leaves, the connection is kept for ``idle_timeout`` seconds so the next
+    turn can reuse it, then closed.
+
+    Args:
+        mix: Mix SDK client instance used to open session streams
+        queue_size: Events buffered per subscriber before it is disconnected
+        replay_size: Recent session events kept for late joiners
+        idle_timeout: Seconds to keep an unused connection open; 0 closes it
+            as soon as the last subscriber leaves
+    """
+
+    def __init__(
+        self,
+        mix,
+        *,
+        queue_size: int = 1024,
+        replay_size: int = 256,
+        idle_timeout: float = 30.0,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.mix = mix
+        self.queue_size = queue_size
+        self.replay_size = replay_size
+        self.idle_timeout = idle_timeout
+        self._channels: Dict[str, _Channel] = {}
+
+    def subscribe(
+        self,
+        session_id: str,
+        *,
+        replay: int = 0,
+        queue_size: Optional[int] = None,
+    ) -> StreamSubscription:
+        """Create a subscription to a session's events.
+
+        The connection is opened or joined when the subscription is entered
+        (or :meth:`StreamSubscription.connect` is awaited).
+
+        Args:
+            session_id: Session to receive events for
+            replay: Number of recent events to deliver first, up to
+                ``replay_size``; connection heartbeats are not replayed
+            queue_size: Override the hub's per-subscriber buffer size
+        """
+        return StreamSubscription(
+            self,
+            session_id,
+            min(replay, self.replay_size),
+            queue_size if queue_size is not None else self.queue_size,
+        )
+
+    def subscriber_count(self, session_id: str) -> int:
+        """Number of active subscribers for a session."""
+        channel = self._channels.get(session_id)
+        return len(channel.subscribers) if channel is not None else 0
+
+    def is_connected(self, session_id: str) -> bool:
+        """Whether a connection to the session's stream is open."""
+        channel = self._channels.get(session_id)
+        # Channels whose connection failed are removed straight away.
+        return channel is not None and channel.connected.done()
+
+    async def aclose(self) -> None:
+        """Close every connection and end all subscriptions."""
+        channels = list(self._channels.values())
+        self._channels.clear()
+        for channel in channels:
+            await self._close_channel(channel)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _attach(self, subscriber: StreamSubscription) -> None:
+        channel = self._channels.get(subscriber.session_id)
+        if channel is None:
+            channel = _Channel(subscriber.session_id, self.replay_size)
+            self._channels[subscriber.session_id] = channel
+            channel.task = asyncio.create_task(self._read(channel))
+            subscriber.new_connection = True
+        if channel.idle is not None:
+            channel.idle.cancel()
+            channel.idle = None
+
+        if subscriber.replay:
+            for event in list(channel.history)[-subscriber.replay :]:
+                subscriber._deliver(event)  # pylint: disable=protected-access
+        channel.subscribers.add(subscriber)
+        subscriber._channel = channel  # pylint: disable=protected-access
+
+        try:
+            await asyncio.shield(channel.connected)
+        except BaseException:
+            await subscriber.aclose()
+            raise
+
+    async def _detach(self, subscriber: StreamSubscription, channel: _Channel) -> None:
+        channel.subscribers.discard(subscriber)
+        if channel.subscribers or self._channels.get(channel.session_id) is not channel:
+            return
+        if self.idle_timeout > 0 and channel.connected.done():
+            channel.idle = asyncio.get_running_loop().call_later(
+                self.idle_timeout, self._expire, channel
+            )
+            return
+        self._channels.pop(channel.session_id, None)
+        await self._close_channel(channel)
+
+    def _expire(self, channel: _Channel) -> None:
+        channel.idle = None
+        if channel.subscribers or self._channels.get(channel.session_id) is not channel:
+            return
+        del self._channels[channel.session_id]
+        if channel.task is not None:
+            channel.task.cancel()
+
+    async def _close_channel(self, channel: _Channel) -> None:
+        if channel.idle is not None:
+            channel.idle.cancel()
+            channel.idle = None
+        task = channel.task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _read(self, channel: _Channel) -> None:
+        error: Optional[BaseException] = None
+        try:
+            response = await self.mix.streaming.stream_events_async(
+                session_id=channel.session_id
+            )
+            channel.connected.set_result(None)
+            async with response.result as event_stream:
+                async for event in event_stream:
+                    channel.publish(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            error = e
+        finally:
+            if self._channels.get(channel.session_id) is channel:
+                del self._channels[channel.session_id]
+            if not channel.connected.done():
+                if error is None:
+                    channel.connected.cancel()
+                else:
+                    channel.connected.set_exception(error)
+                    # Raised to the subscribers awaiting the connection.
+                    channel.connected.exception()
+            for subscriber in channel.subscribers:
+                subscriber._finish(error)  # pylint: disable=protected-access
+            channel.subscribers.clear()
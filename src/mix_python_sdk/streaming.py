@@ -5,7 +5,9 @@ from mix_python_sdk import errors, models, utils
 from mix_python_sdk._hooks import HookContext
 from mix_python_sdk.types import OptionalNullable, UNSET
 from mix_python_sdk.utils import eventstreaming
+from mix_python_sdk.utils.ssecapture import PathLike
 from mix_python_sdk.utils.unmarshal_json_response import unmarshal_json_response
+import httpx
 from typing import Any, Mapping, Optional
 
 
@@ -19,6 +21,7 @@ class Streaming(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        capture: Optional[PathLike] = None,
     ) -> models.StreamEventsResponse:
         r"""Server-Sent Events stream for real-time updates
 
@@ -30,6 +33,7 @@ class Streaming(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param capture: Record the raw response body with arrival times to this file for replay
         """
         base_url = None
         url_variables = None
@@ -90,12 +94,27 @@ class Streaming(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "text/event-stream"):
+
+            def reconnect(last_event_id: Optional[str]) -> httpx.Response:
+                return self.stream_events(
+                    session_id=session_id,
+                    last_event_id=last_event_id,
+                    retries=retries,
+                    server_url=server_url,
+                    timeout_ms=timeout_ms,
+                    http_headers=http_headers,
+                ).result.response
+
+            result = eventstreaming.EventStream(
+                http_res,
+                lambda raw: utils.unmarshal_json(raw, models.SSEEventStream),
+                client_ref=self,
+                reconnect=reconnect,
+            )
+            if capture is not None:
+                result.capture(capture)
             return models.StreamEventsResponse(
-                result=eventstreaming.EventStream(
-                    http_res,
-                    lambda raw: utils.unmarshal_json(raw, models.SSEEventStream),
-                    client_ref=self,
-                ),
+                result=result,
                 headers=utils.get_response_headers(http_res.headers),
             )
         if utils.match_response(http_res, "404", "application/json"):
@@ -131,6 +150,7 @@ class Streaming(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        capture: Optional[PathLike] = None,
     ) -> models.StreamEventsResponse:
         r"""Server-Sent Events stream for real-time updates
 
@@ -142,6 +162,7 @@ class Streaming(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param capture: Record the raw response body with arrival times to this file for replay
         """
         base_url = None
         url_variables = None
@@ -202,12 +223,28 @@ class Streaming(BaseSDK):
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "text/event-stream"):
+
+            async def reconnect_async(last_event_id: Optional[str]) -> httpx.Response:
+                res = await self.stream_events_async(
+                    session_id=session_id,
+                    last_event_id=last_event_id,
+                    retries=retries,
+                    server_url=server_url,
+                    timeout_ms=timeout_ms,
+                    http_headers=http_headers,
+                )
+                return res.result.response
+
+            result = eventstreaming.EventStreamAsync(
+                http_res,
+                lambda raw: utils.unmarshal_json(raw, models.SSEEventStream),
+                client_ref=self,
+                reconnect=reconnect_async,
+            )
+            if capture is not None:
+                result.capture(capture)
             return models.StreamEventsResponse(
-                result=eventstreaming.EventStreamAsync(
-                    http_res,
-                    lambda raw: utils.unmarshal_json(raw, models.SSEEventStream),
-                    client_ref=self,
-                ),
+                result=result,
                 headers=utils.get_response_headers(http_res.headers),
             )
         if utils.match_response(http_res, "404", "application/json"):
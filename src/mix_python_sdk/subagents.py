@@ -0,0 +1,270 @@
+"""Demultiplexing a session stream by subagent.
+
+Subagents started through the ``task`` tool stream their events on the same
+connection as the main agent, tagged with the ``parent_tool_call_id`` of the
+tool call that started them. :class:`SubagentDemux` builds the tree of agents
+and tool calls as events arrive and hands each event to the iterators
+subscribed to its subtree.
+
+Example:
+    ```python
+    demux = SubagentDemux()
+
+    async def follow(tool_call_id):
+        async for event in demux.subscribe(tool_call_id):
+            ...
+
+    @router.route("tool_use_start")
+    def on_tool(event):
+        if event.data.name == "task":
+            asyncio.create_task(follow(event.data.id))
+
+    router.on("*", demux.feed, priority=100)
+    ```
+"""
+
+import asyncio
+import collections
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+_FREED_HISTORY = 1024
+
+
+class AgentNode:
+    """An agent or tool call in the session's call tree.
+
+    The root node stands for the main agent and has no ``tool_call_id``.
+
+    Attributes:
+        tool_call_id: ID of the tool call this node represents
+        tool_name: Name of the tool, once its ``tool_use_start`` was seen
+        parent: Node that made the tool call
+        children: Tool calls made by this node, by ID
+        started: Whether tool execution has started
+        complete: Whether the agent reported completion
+        success: Result of tool execution, once it finished
+    """
+
+    __slots__ = (
+        "tool_call_id",
+        "tool_name",
+        "parent",
+        "children",
+        "started",
+        "complete",
+        "success",
+        "_subscribers",
+        "_listeners",
+        "_version",
+    )
+
+    def __init__(self, tool_call_id: Optional[str], parent: Optional["AgentNode"]):
+        self.tool_call_id = tool_call_id
+        self.tool_name: Optional[str] = None
+        self.parent = parent
+        self.children: Dict[str, AgentNode] = {}
+        self.started = False
+        self.complete = False
+        self.success: Optional[bool] = None
+        self._subscribers: List[SubtreeIterator] = []
+        self._listeners: Tuple[SubtreeIterator, ...] = ()
+        self._version = -1
+
+    @property
+    def depth(self) -> int:
+        """Nesting level; 0 for the main agent."""
+        depth = 0
+        node = self.parent
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
+
+    def __repr__(self) -> str:
+        return (
+            f"AgentNode(tool_call_id={self.tool_call_id!r}, "
+            f"tool_name={self.tool_name!r}, children={len(self.children)})"
+        )
+
+
+class SubtreeIterator:
+    """Async iterator over the events of one agent and its descendants.
+
+    Iteration ends once the subtree's tool call has finished executing or the
+    demultiplexer is closed.
+    """
+
+    def __init__(self, demux: "SubagentDemux", node: AgentNode):
+        self.node = node
+        self._demux = demux
+        self._buffer: Deque[Any] = collections.deque()
+        self._ready = asyncio.Event()
+        self._done = False
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._buffer:
+            if self._done:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        return self._buffer.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        if not self._done:
+            self._done = True
+            self._ready.set()
+            self._demux._unsubscribe(self)  # pylint: disable=protected-access
+
+    def _deliver(self, event: Any) -> None:
+        self._buffer.append(event)
+        self._ready.set()
+
+
+class SubagentDemux:
+    """Builds the agent/tool call tree of a stream and routes events by subtree.
+
+    Each event is attributed to the agent named by its
+    ``parent_tool_call_id``, or to the main agent when it has none, with one
+    dictionary lookup. Subtrees are freed once their tool call finishes
+    executing; events that arrive for a freed subtree afterwards are attributed
+    to the main agent.
+    """
+
+    root: AgentNode
+
+    def __init__(self) -> None:
+        self.root = AgentNode(None, None)
+        self._nodes: Dict[str, AgentNode] = {}
+        # Recently freed tool calls, so late events don't resurrect them.
+        self._freed: "collections.OrderedDict[str, None]" = collections.OrderedDict()
+        # Bumped whenever subscriptions or the tree change, invalidating each
+        # node's cached listeners.
+        self._version = 0
+        self._closed = False
+
+    def feed(self, event: Any) -> AgentNode:
+        """Route an SSE event and update the tree.
+
+        Returns:
+            The node the event was attributed to
+        """
+        data = getattr(event, "data", None)
+        parent_id = getattr(data, "parent_tool_call_id", None)
+        if parent_id is None or parent_id in self._freed:
+            node = self.root
+        else:
+            node = self._node(parent_id)
+
+        tag = getattr(event, "event", None)
+        if tag == "tool_use_start":
+            child = self._node(data.id)
+            child.tool_name = getattr(data.name, "value", data.name)
+            self._adopt(node, child)
+        elif tag == "tool_execution_start" and data.tool_call_id not in self._freed:
+            self._node(data.tool_call_id).started = True
+        elif tag == "complete" and parent_id is not None:
+            node.complete = True
+
+        for listener in self._listeners(node):
+            listener._deliver(event)  # pylint: disable=protected-access
+
+        if tag == "tool_execution_complete":
+            finished = self._nodes.get(data.tool_call_id)
+            if finished is not None:
+                finished.success = data.success
+                self._free(finished)
+        return node
+
+    def subscribe(self, tool_call_id: Optional[str] = None) -> SubtreeIterator:
+        """Iterate the events of an agent's subtree.
+
+        Args:
+            tool_call_id: Tool call that started the subagent; None for the
+                whole stream. May be subscribed before its events arrive;
+                subscribing to a finished tool call yields nothing.
+        """
+        if self._closed or tool_call_id in self._freed:
+            iterator = SubtreeIterator(self, self.root)
+            iterator._done = True  # pylint: disable=protected-access
+            return iterator
+        node = self.root if tool_call_id is None else self._node(tool_call_id)
+        iterator = SubtreeIterator(self, node)
+        node._subscribers.append(iterator)  # pylint: disable=protected-access
+        self._version += 1
+        return iterator
+
+    def get(self, tool_call_id: str) -> Optional[AgentNode]:
+        """The live node for a tool call, if any."""
+        return self._nodes.get(tool_call_id)
+
+    async def run(self, event_stream: Any) -> None:
+        """Feed every event of ``event_stream``, then close."""
+        try:
+            async for event in event_stream:
+                self.feed(event)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """End every subscription."""
+        self._closed = True
+        for node in [self.root, *self._nodes.values()]:
+            for iterator in list(node._subscribers):  # pylint: disable=protected-access
+                iterator.close()
+
+    def _node(self, tool_call_id: str) -> AgentNode:
+        node = self._nodes.get(tool_call_id)
+        if node is None:
+            # Not started yet, or started before we joined the stream.
+            node = self._nodes[tool_call_id] = AgentNode(tool_call_id, self.root)
+            self.root.children[tool_call_id] = node
+            self._version += 1
+        return node
+
+    def _adopt(self, parent: AgentNode, child: AgentNode) -> None:
+        if child.parent is parent:
+            return
+        if child.parent is not None:
+            child.parent.children.pop(child.tool_call_id, None)  # type: ignore[arg-type]
+        child.parent = parent
+        parent.children[child.tool_call_id] = child  # type: ignore[index]
+        self._version += 1
+
+    def _listeners(self, node: AgentNode) -> Tuple[SubtreeIterator, ...]:
+        # pylint: disable=protected-access
+        if node._version != self._version:
+            inherited = self._listeners(node.parent) if node.parent else ()
+            node._listeners = tuple(node._subscribers) + inherited
+            node._version = self._version
+        return node._listeners
+
+    def _free(self, node: AgentNode) -> None:
+        if node.parent is not None:
+            node.parent.children.pop(node.tool_call_id, None)  # type: ignore[arg-type]
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            stack.extend(current.children.values())
+            self._nodes.pop(current.tool_call_id, None)  # type: ignore[arg-type]
+            self._freed[current.tool_call_id] = None  # type: ignore[index]
+            for iterator in list(current._subscribers):  # pylint: disable=protected-access
+                iterator.close()
+        while len(self._freed) > _FREED_HISTORY:
+            self._freed.popitem(last=False)
+        self._version += 1
+
+    def _unsubscribe(self, iterator: SubtreeIterator) -> None:
+        subscribers = iterator.node._subscribers  # pylint: disable=protected-access
+        if iterator in subscribers:
+            subscribers.remove(iterator)
+            self._version += 1
@@ -0,0 +1,225 @@
+"""A synchronous HTTP client with one connection pool per thread.
+
+A single ``httpx.Client`` is safe to share between threads, but every request
+goes through the same connection pool and its lock. With many threads sending
+at once, as with a ``ThreadPoolExecutor`` fanning out requests, they queue on
+that lock. :class:`PerThreadClient` gives each thread its own ``httpx.Client``,
+so threads never wait on each other's pool, and bounds the connections in use
+across all threads with one shared limit.
+
+Example:
+    ```python
+    from mix_python_sdk import Mix
+    from mix_python_sdk.threadclient import PerThreadClient
+
+    mix = Mix(
+        server_url="http://localhost:8088",
+        client=PerThreadClient(max_connections=64, timeout=30),
+    )
+    with ThreadPoolExecutor(64) as pool:
+        sessions = list(pool.map(lambda i: mix.sessions.get(id=i), ids))
+    ```
+"""
+
+import collections
+import os
+import ssl
+import threading
+import weakref
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+from mix_python_sdk.httpclient import HttpClient
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Frees a connection slot once a streamed response is closed."""
+
+    def __init__(self, stream: Any, release):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+class _Slots:
+    """A counting semaphore that serves waiters in arrival order.
+
+    ``threading.Semaphore`` lets a thread that just released a slot take it
+    straight back, which starves the others under load; here a released slot
+    is handed to the longest-waiting thread instead.
+    """
+
+    def __init__(self, count: int):
+        self._free = count
+        self._lock = threading.Lock()
+        self._waiters: Deque[threading.Lock] = collections.deque()
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return
+            waiter = threading.Lock()
+            waiter.acquire()
+            self._waiters.append(waiter)
+        waiter.acquire()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft().release()
+            else:
+                self._free += 1
+
+
+class PerThreadClient(HttpClient):
+    """Sends each request with an ``httpx.Client`` owned by the calling thread.
+
+    Each thread's client is created on its first request and closed once the
+    thread has exited and another thread creates a client, or on
+    :meth:`close`. A connection slot is held from sending a request until its
+    response is read, or closed if it is streamed, so at most
+    ``max_connections`` requests are in flight across all threads; further
+    requests wait for a free slot, in the order they arrived. After ``fork()``
+    the child process starts with no clients and all slots free.
+
+    Args:
+        max_connections: Requests in flight at once across all threads
+        connections_per_thread: Connection pool size of each thread's client
+        **client_options: Passed to every ``httpx.Client``; redirects are
+            followed unless ``follow_redirects=False`` is given
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        *,
+        connections_per_thread: int = 4,
+        **client_options: Any,
+    ):
+        if max_connections < 1 or connections_per_thread < 1:
+            raise ValueError("connection limits must be at least 1")
+        if "limits" in client_options:
+            raise ValueError(
+                "use max_connections and connections_per_thread instead of limits"
+            )
+        self.max_connections = max_connections
+        self.connections_per_thread = connections_per_thread
+        self.client_options = client_options
+        # Loading the CA bundle takes tens of milliseconds of CPU, so it is
+        # done once and the context shared by every thread's client.
+        verify = client_options.get("verify", True)
+        if not isinstance(verify, ssl.SSLContext):
+            verify = httpx.create_ssl_context(
+                verify=verify, trust_env=client_options.get("trust_env", True)
+            )
+        self._ssl_context = verify
+        # Builds requests with the configured headers, params and timeout.
+        self._build_client = httpx.Client(**self._options())
+        self._reset()
+
+    def _options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {"follow_redirects": True}
+        options.update(self.client_options)
+        options["verify"] = self._ssl_context
+        return options
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._slots = _Slots(self.max_connections)
+        self._clients: List[Tuple[weakref.ref, httpx.Client]] = []
+        self._closed = False
+
+    @property
+    def clients(self) -> int:
+        """Per-thread clients currently open."""
+        return len(self._clients)
+
+    def client(self) -> httpx.Client:
+        """The calling thread's client, created on first use."""
+        if self._pid != os.getpid():
+            # Inherited clients share sockets with the parent: drop them.
+            self._reset()
+        if self._closed:
+            raise RuntimeError("PerThreadClient is closed")
+        client: Optional[httpx.Client] = getattr(self._local, "client", None)
+        if client is not None:
+            return client
+        client = httpx.Client(
+            **self._options(),
+            limits=httpx.Limits(
+                max_connections=self.connections_per_thread,
+                max_keepalive_connections=self.connections_per_thread,
+            ),
+        )
+        finished: List[httpx.Client] = []
+        with self._lock:
+            running = []
+            for thread_ref, other in self._clients:
+                thread = thread_ref()
+                if thread is not None and thread.is_alive():
+                    running.append((thread_ref, other))
+                else:
+                    finished.append(other)
+            running.append((weakref.ref(threading.current_thread()), client))
+            self._clients = running
+        for other in finished:
+            other.close()
+        self._local.client = client
+        return client
+
+    def send(self, request: httpx.Request, *, stream: bool = False, **kwargs):
+        client = self.client()
+        self._slots.acquire()
+        try:
+            response = client.send(request, stream=stream, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        if stream:
+            response.stream = _ReleasingStream(response.stream, self._slots.release)
+        else:
+            self._slots.release()
+        return response
+
+    def build_request(self, *args, **kwargs) -> httpx.Request:
+        # Requests are plain data; any client builds them the same way.
+        return self._build_client.build_request(*args, **kwargs)
+
+    def close(self) -> None:
+        """Close every thread's client."""
+        with self._lock:
+            self._closed = True
+            clients, self._clients = self._clients, []
+        for _, client in clients:
+            client.close()
+        self._build_client.close()
+
+    def __reduce__(self):
+        return (
+            _restore,
+            (self.max_connections, self.connections_per_thread, self.client_options),
+        )
+
+
+def _restore(
+    max_connections: int, connections_per_thread: int, client_options: Dict[str, Any]
+) -> PerThreadClient:
+    return PerThreadClient(
+        max_connections,
+        connections_per_thread=connections_per_thread,
+        **client_options,
+    )
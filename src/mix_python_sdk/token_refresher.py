@@ -0,0 +1,266 @@
+"""Refreshing OAuth tokens before they expire.
+
+The server refreshes provider tokens on its own schedule, so a token can run
+out between two passes and the requests made in that window fail.
+:class:`TokenRefresher` reads token expiry from the OAuth health endpoint and
+calls ``refresh_o_auth_tokens`` shortly before the earliest expiry. Concurrent
+refresh triggers share one call, and requests made through the client wait
+only while that call is in flight.
+
+Example:
+    ```python
+    with Mix(server_url="http://localhost:8088") as mix:
+        with TokenRefresher(mix, lead_time=120):
+            run_agent(mix)
+    ```
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Optional
+
+import httpx
+
+from mix_python_sdk._hooks import BeforeRequestContext, BeforeRequestHook
+from mix_python_sdk.models import RefreshOAuthTokensResponse
+
+# Requests the refresher makes itself; they are never paused.
+_OWN_OPERATIONS = frozenset({"getOAuthHealth", "refreshOAuthTokens"})
+
+
+@dataclass
+class TokenRefreshStats:
+    """Counters of a :class:`TokenRefresher`.
+
+    Attributes:
+        refreshes: Refresh calls the server accepted
+        failed: Refresh calls that raised
+        joined: Refresh triggers that waited for a call already in flight
+        paused: Requests that waited for a refresh to finish
+        last_refresh: ``time.time()`` of the last successful refresh
+        next_refresh: ``time.time()`` of the next scheduled refresh check
+        last_error: What the last failed health check or refresh raised
+    """
+
+    refreshes: int = 0
+    failed: int = 0
+    joined: int = 0
+    paused: int = 0
+    last_refresh: Optional[float] = None
+    next_refresh: Optional[float] = None
+    last_error: Optional[BaseException] = None
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[RefreshOAuthTokensResponse] = None
+        self.error: Optional[BaseException] = None
+
+
+class TokenRefresher(BeforeRequestHook):
+    """Refreshes OAuth tokens ahead of expiry on a background thread.
+
+    The refresh is scheduled ``lead_time`` seconds before the earliest
+    ``expires_at`` among active tokens, minus a random delay of up to
+    ``jitter`` seconds so that many clients do not refresh at once. Expired
+    tokens are refreshed right away. Expiry is re-read at least every
+    ``poll_interval`` seconds to pick up new logins.
+
+    While started, the refresher is registered as a before-request hook on the
+    client. The hook returns immediately unless a refresh is in flight, in
+    which case the request waits for it, up to ``max_pause`` seconds.
+
+    Args:
+        mix: Mix SDK client instance
+        lead_time: Seconds before expiry at which to refresh
+        jitter: Upper bound of the random delay subtracted from the schedule
+        poll_interval: Longest time between expiry checks
+        retry_interval: Seconds to wait after a failed check or refresh
+        max_pause: Longest time a request waits for a refresh
+    """
+
+    def __init__(
+        self,
+        mix,
+        *,
+        lead_time: float = 300.0,
+        jitter: float = 30.0,
+        poll_interval: float = 600.0,
+        retry_interval: float = 30.0,
+        max_pause: float = 30.0,
+    ):
+        if lead_time < 0 or jitter < 0:
+            raise ValueError("lead_time and jitter must not be negative")
+        if poll_interval <= 0 or retry_interval <= 0:
+            raise ValueError("poll_interval and retry_interval must be positive")
+        self.mix = mix
+        self.lead_time = lead_time
+        self.jitter = jitter
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self.max_pause = max_pause
+        self._stats = TokenRefreshStats()
+        self._lock = threading.Lock()
+        self._flight: Optional[_Flight] = None
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def refreshing(self) -> bool:
+        """Whether a refresh call is in flight."""
+        return self._flight is not None
+
+    @property
+    def stats(self) -> TokenRefreshStats:
+        """A snapshot of the refresher's counters."""
+        return TokenRefreshStats(**vars(self._stats))
+
+    def start(self) -> None:
+        """Register the request hook and start the background thread."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        hooks = self.mix.sdk_configuration.__dict__["_hooks"]
+        if self not in hooks.before_request_hooks:
+            hooks.register_before_request_hook(self)
+        self._thread = threading.Thread(
+            target=self._run, name="mix-token-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and unregister the request hook."""
+        thread, self._thread = self._thread, None
+        self._stopped.set()
+        self._wakeup.set()
+        if thread is not None:
+            thread.join(self.max_pause)
+        hooks = self.mix.sdk_configuration.__dict__["_hooks"]
+        if self in hooks.before_request_hooks:
+            hooks.before_request_hooks.remove(self)
+
+    def refresh(self) -> RefreshOAuthTokensResponse:
+        """Refresh the tokens now, or wait for the refresh already in flight.
+
+        Returns:
+            The server's response to the shared refresh call
+
+        Raises:
+            Whatever the shared refresh call raised
+        """
+        with self._lock:
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = self._flight = _Flight()
+            else:
+                self._stats.joined += 1
+        if leader:
+            self._fly(flight)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        assert flight.result is not None
+        return flight.result
+
+    async def refresh_async(self) -> RefreshOAuthTokensResponse:
+        """:meth:`refresh` without blocking the event loop."""
+        return await asyncio.to_thread(self.refresh)
+
+    def before_request(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> httpx.Request:
+        flight = self._flight
+        if (
+            flight is None
+            or hook_ctx.operation_id in _OWN_OPERATIONS
+            or getattr(self._local, "refreshing", False)
+        ):
+            return request
+        self._stats.paused += 1
+        flight.done.wait(self.max_pause)
+        return request
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await asyncio.to_thread(self.stop)
+
+    def _fly(self, flight: _Flight) -> None:
+        self._local.refreshing = True
+        try:
+            flight.result = self.mix.authentication.refresh_o_auth_tokens()
+            self._stats.refreshes += 1
+            self._stats.last_refresh = time.time()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            flight.error = e
+            self._stats.failed += 1
+            self._stats.last_error = e
+        finally:
+            self._local.refreshing = False
+            with self._lock:
+                self._flight = None
+            flight.done.set()
+
+    def _next_delay(self) -> float:
+        """Seconds until the tokens should be refreshed."""
+        health = self.mix.authentication.get_o_auth_health()
+        earliest: Optional[float] = None
+        for provider in health.providers.values():
+            if provider.status == "expired":
+                return 0.0
+            if provider.status != "active" or provider.expires_at is None:
+                continue
+            expires_at = provider.expires_at
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            timestamp = expires_at.timestamp()
+            if earliest is None or timestamp < earliest:
+                earliest = timestamp
+        if earliest is None:
+            return self.poll_interval
+        delay = earliest - time.time() - self.lead_time
+        delay -= random.uniform(0, self.jitter)
+        return min(max(delay, 0.0), self.poll_interval)
+
+    def _run(self) -> None:
+        stopped = self._stopped
+        last_attempt: Optional[float] = None
+        while not stopped.is_set():
+            self._wakeup.clear()
+            try:
+                delay = self._next_delay()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._stats.last_error = e
+                delay = self.retry_interval
+            if delay <= 0 and last_attempt is not None:
+                # A refresh that did not move the expiry is not retried at once.
+                delay = last_attempt + self.retry_interval - time.monotonic()
+            if delay <= 0:
+                last_attempt = time.monotonic()
+                try:
+                    self.refresh()
+                except Exception:  # pylint: disable=broad-exception-caught
+                    pass
+                continue
+            self._stats.next_refresh = time.time() + delay
+            self._wakeup.wait(delay)
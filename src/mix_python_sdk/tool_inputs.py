@@ -0,0 +1,174 @@
+"""Live assembly of streamed tool call arguments.
+
+While the model writes a tool call, the server streams its JSON arguments as
+``tool_use_parameter_delta`` fragments. :class:`ToolInputAssembler` parses each
+fragment incrementally per tool call, so a preview of the arguments is
+available after every delta without re-parsing the text received so far. When
+``tool_use_parameter_streaming_complete`` arrives the arguments are validated
+against the tool's parameter model from :mod:`mix_python_sdk.tool_models`.
+
+Example:
+    ```python
+    assembler = ToolInputAssembler()
+
+    async for event in event_stream:
+        tool_input = assembler.feed(event)
+        if tool_input is None:
+            continue
+        if tool_input.complete:
+            print(tool_input.name, tool_input.params)
+        else:
+            print(tool_input.value.get("command", ""))
+    ```
+"""
+
+import json
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from mix_python_sdk.tool_models import TOOL_PARAMS
+from mix_python_sdk.utils.partialjson import PartialJSONParser
+
+
+class ToolInput:
+    """Arguments of one tool call, as far as they have been received.
+
+    Attributes:
+        tool_call_id: ID of the tool call
+        name: Tool name, once known from ``tool_use_start`` or completion
+        complete: Whether the arguments have finished streaming
+        arguments: The final parsed arguments once complete
+        params: The arguments validated against the tool's parameter model,
+            or None for tools without one or when validation failed
+        error: Why parsing or validation of the final arguments failed
+    """
+
+    __slots__ = (
+        "tool_call_id",
+        "name",
+        "complete",
+        "arguments",
+        "params",
+        "error",
+        "_parser",
+    )
+
+    tool_call_id: str
+    name: Optional[str]
+    complete: bool
+    arguments: Any
+    params: Optional[BaseModel]
+    error: Optional[Exception]
+
+    def __init__(self, tool_call_id: str, name: Optional[str] = None):
+        self.tool_call_id = tool_call_id
+        self.name = name
+        self.complete = False
+        self.arguments = None
+        self.params = None
+        self.error = None
+        self._parser = PartialJSONParser()
+
+    @property
+    def value(self) -> Any:
+        """Best-effort arguments: the partial object while streaming."""
+        if self.complete:
+            return self.arguments
+        value = self._parser.value
+        return {} if value is None else value
+
+    def __repr__(self) -> str:
+        return (
+            f"ToolInput(tool_call_id={self.tool_call_id!r}, name={self.name!r}, "
+            f"complete={self.complete}, value={self.value!r})"
+        )
+
+
+class ToolInputAssembler:
+    """Tracks streamed arguments for every tool call on a stream.
+
+    Feed it every SSE event; events other than ``tool_use_start``,
+    ``tool_use_parameter_delta`` and ``tool_use_parameter_streaming_complete``
+    are ignored. Completed calls are kept until :meth:`discard` is called.
+
+    Args:
+        params: Parameter models by tool name, for tools beyond the built-in
+            ones or to override them
+    """
+
+    def __init__(self, params: Optional[Dict[str, Type[BaseModel]]] = None):
+        self.params_models: Dict[str, Type[BaseModel]] = dict(TOOL_PARAMS)
+        if params:
+            self.params_models.update(params)
+        self._calls: Dict[str, ToolInput] = {}
+
+    def feed(self, event: Any) -> Optional[ToolInput]:
+        """Process an SSE event.
+
+        Returns:
+            The tool call the event belongs to, or None for unrelated events
+        """
+        tag = getattr(event, "event", None)
+        if tag == "tool_use_parameter_delta":
+            data = event.data
+            tool_input = self._call(data.tool_call_id)
+            if not tool_input.complete:
+                tool_input._parser.feed(data.input)  # pylint: disable=protected-access
+            return tool_input
+        if tag == "tool_use_start":
+            data = event.data
+            tool_input = self._call(data.id)
+            tool_input.name = _tool_name(data.name)
+            return tool_input
+        if tag == "tool_use_parameter_streaming_complete":
+            data = event.data
+            tool_input = self._call(data.id)
+            tool_input.name = _tool_name(data.name)
+            self._finish(tool_input, data.input)
+            return tool_input
+        return None
+
+    def get(self, tool_call_id: str) -> Optional[ToolInput]:
+        """The tool call with this ID, if any of its events were seen."""
+        return self._calls.get(tool_call_id)
+
+    def partial(self, tool_call_id: str) -> Any:
+        """Best-effort arguments of a tool call, or None if unknown."""
+        tool_input = self._calls.get(tool_call_id)
+        return tool_input.value if tool_input is not None else None
+
+    def discard(self, tool_call_id: str) -> Optional[ToolInput]:
+        """Stop tracking a tool call and return it."""
+        return self._calls.pop(tool_call_id, None)
+
+    def _call(self, tool_call_id: str) -> ToolInput:
+        tool_input = self._calls.get(tool_call_id)
+        if tool_input is None:
+            tool_input = self._calls[tool_call_id] = ToolInput(tool_call_id)
+        return tool_input
+
+    def _finish(self, tool_input: ToolInput, raw_input: str) -> None:
+        tool_input.complete = True
+        # The completion event carries the whole input, which is authoritative
+        # even if deltas were missed.
+        try:
+            tool_input.arguments = json.loads(raw_input) if raw_input else {}
+        except json.JSONDecodeError as e:
+            tool_input.arguments = tool_input._parser.value  # pylint: disable=protected-access
+            tool_input.error = e
+            return
+        finally:
+            tool_input._parser = None  # type: ignore[assignment]  # pylint: disable=protected-access
+
+        model = self.params_models.get(tool_input.name or "")
+        if model is None:
+            return
+        try:
+            tool_input.params = model.model_validate(tool_input.arguments)
+        except ValidationError as e:
+            tool_input.error = e
+
+
+def _tool_name(name: Any) -> str:
+    return getattr(name, "value", name)
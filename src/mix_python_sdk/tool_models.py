@@ -15,8 +15,13 @@ Example:
 """
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Type
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _ToolModel(BaseModel):
+    # Schemas are built on first validation rather than at import.
+    model_config = ConfigDict(defer_build=True)
 
 
 # ===== Core Tool Names =====
@@ -54,7 +59,7 @@ class MediaType(str, Enum):
     CSV = "csv"
 
 
-class MediaOutput(BaseModel):
+class MediaOutput(_ToolModel):
     """Single media output for show_media tool.
 
     Attributes:
@@ -79,7 +84,7 @@ class MediaOutput(BaseModel):
         populate_by_name = True  # Allow both snake_case and camelCase
 
 
-class MediaShowcaseParams(BaseModel):
+class MediaShowcaseParams(_ToolModel):
     """Parameters for show_media tool.
 
     Attributes:
@@ -101,7 +106,7 @@ class MediaAnalysisType(str, Enum):
     PDF = "pdf"
 
 
-class ReadMediaParams(BaseModel):
+class ReadMediaParams(_ToolModel):
     """Parameters for ReadMedia tool.
 
     Attributes:
@@ -119,7 +124,7 @@ class ReadMediaParams(BaseModel):
     video_interval: Optional[str] = None
 
 
-class ReadMediaResult(BaseModel):
+class ReadMediaResult(_ToolModel):
     """Single result from ReadMedia tool.
 
     Attributes:
@@ -135,7 +140,7 @@ class ReadMediaResult(BaseModel):
     error: Optional[str] = None
 
 
-class ReadMediaResponse(BaseModel):
+class ReadMediaResponse(_ToolModel):
     """Response from ReadMedia tool.
 
     Attributes:
@@ -166,7 +171,7 @@ class TodoPriority(str, Enum):
     HIGH = "high"
 
 
-class Todo(BaseModel):
+class Todo(_ToolModel):
     """Single todo item.
     Attributes:
         id: Unique identifier for the todo item
@@ -181,7 +186,7 @@ class Todo(BaseModel):
     priority: TodoPriority
 
 
-class TodoWriteParams(BaseModel):
+class TodoWriteParams(_ToolModel):
     """Parameters for TodoWrite tool.
 
     Attributes:
@@ -194,7 +199,7 @@ class TodoWriteParams(BaseModel):
 # ===== Bash Tool =====
 
 
-class BashParams(BaseModel):
+class BashParams(_ToolModel):
     """Parameters for bash tool.
 
     Attributes:
@@ -209,7 +214,7 @@ class BashParams(BaseModel):
 # ===== ReadText Tool =====
 
 
-class ReadTextParams(BaseModel):
+class ReadTextParams(_ToolModel):
     """Parameters for ReadText tool.
 
     Attributes:
@@ -226,7 +231,7 @@ class ReadTextParams(BaseModel):
 # ===== Glob Tool =====
 
 
-class GlobParams(BaseModel):
+class GlobParams(_ToolModel):
     """Parameters for glob tool.
 
     Attributes:
@@ -241,7 +246,7 @@ class GlobParams(BaseModel):
 # ===== Grep Tool =====
 
 
-class GrepParams(BaseModel):
+class GrepParams(_ToolModel):
     """Parameters for grep tool.
 
     Attributes:
@@ -260,7 +265,7 @@ class GrepParams(BaseModel):
 # ===== Write Tool =====
 
 
-class WriteParams(BaseModel):
+class WriteParams(_ToolModel):
     """Parameters for write tool.
 
     Attributes:
@@ -275,7 +280,7 @@ class WriteParams(BaseModel):
 # ===== Edit Tool =====
 
 
-class EditParams(BaseModel):
+class EditParams(_ToolModel):
     """Parameters for edit tool.
 
     Attributes:
@@ -292,7 +297,7 @@ class EditParams(BaseModel):
 # ===== ExitPlanMode Tool =====
 
 
-class ExitPlanModeParams(BaseModel):
+class ExitPlanModeParams(_ToolModel):
     """Parameters for exit_plan_mode tool.
 
     Attributes:
@@ -321,7 +326,7 @@ class Safesearch(str, Enum):
     OFF = "off"
 
 
-class SearchParams(BaseModel):
+class SearchParams(_ToolModel):
     """Parameters for search (web_search) tool.
 
     Attributes:
@@ -341,7 +346,7 @@ class SearchParams(BaseModel):
     spellcheck: Optional[bool] = True
 
 
-class SearchResult(BaseModel):
+class SearchResult(_ToolModel):
     """Single web search result.
 
     Attributes:
@@ -355,7 +360,7 @@ class SearchResult(BaseModel):
     description: str
 
 
-class WebResults(BaseModel):
+class WebResults(_ToolModel):
     """Web search results container.
 
     Attributes:
@@ -367,7 +372,7 @@ class WebResults(BaseModel):
     results: List[SearchResult]
 
 
-class BraveSearchResponse(BaseModel):
+class BraveSearchResponse(_ToolModel):
     """Response from Brave web search.
 
     Attributes:
@@ -379,7 +384,7 @@ class BraveSearchResponse(BaseModel):
     web: WebResults
 
 
-class ImageResultThumbnail(BaseModel):
+class ImageResultThumbnail(_ToolModel):
     """Thumbnail information for image search results.
 
     Attributes:
@@ -389,7 +394,7 @@ class ImageResultThumbnail(BaseModel):
     src: str
 
 
-class ImageResultProperties(BaseModel):
+class ImageResultProperties(_ToolModel):
     """Properties for image search results.
 
     Attributes:
@@ -401,7 +406,7 @@ class ImageResultProperties(BaseModel):
     placeholder: str
 
 
-class ImageResultMetaURL(BaseModel):
+class ImageResultMetaURL(_ToolModel):
     """Metadata about the source URL.
 
     Attributes:
@@ -419,7 +424,7 @@ class ImageResultMetaURL(BaseModel):
     path: str
 
 
-class ImageResult(BaseModel):
+class ImageResult(_ToolModel):
     """Single image search result.
 
     Attributes:
@@ -445,7 +450,7 @@ class ImageResult(BaseModel):
     confidence: str
 
 
-class ImageSearchResponse(BaseModel):
+class ImageSearchResponse(_ToolModel):
     """Response from image search.
 
     Attributes:
@@ -457,7 +462,7 @@ class ImageSearchResponse(BaseModel):
     results: List[ImageResult]
 
 
-class VideoResultThumbnail(BaseModel):
+class VideoResultThumbnail(_ToolModel):
     """Thumbnail information for video search results.
 
     Attributes:
@@ -467,7 +472,7 @@ class VideoResultThumbnail(BaseModel):
     src: str
 
 
-class VideoResultProperties(BaseModel):
+class VideoResultProperties(_ToolModel):
     """Properties for video search results.
 
     Attributes:
@@ -485,7 +490,7 @@ class VideoResultProperties(BaseModel):
     placeholder: str
 
 
-class VideoResultMetaURL(BaseModel):
+class VideoResultMetaURL(_ToolModel):
     """Metadata about the source URL.
 
     Attributes:
@@ -503,7 +508,7 @@ class VideoResultMetaURL(BaseModel):
     path: str
 
 
-class VideoResult(BaseModel):
+class VideoResult(_ToolModel):
     """Single video search result.
 
     Attributes:
@@ -529,7 +534,7 @@ class VideoResult(BaseModel):
     confidence: str
 
 
-class VideoSearchResponse(BaseModel):
+class VideoSearchResponse(_ToolModel):
     """Response from video search.
 
     Attributes:
@@ -550,7 +555,7 @@ class SubagentType(str, Enum):
     GENERAL_PURPOSE = "general-purpose"
 
 
-class TaskParams(BaseModel):
+class TaskParams(_ToolModel):
     """Parameters for task tool.
 
     Attributes:
@@ -567,7 +572,7 @@ class TaskParams(BaseModel):
 # ===== PythonExecution Tool =====
 
 
-class PythonExecutionParams(BaseModel):
+class PythonExecutionParams(_ToolModel):
     """Parameters for python_execution tool.
 
     Attributes:
@@ -577,7 +582,7 @@ class PythonExecutionParams(BaseModel):
     code: str
 
 
-class PythonExecutionResult(BaseModel):
+class PythonExecutionResult(_ToolModel):
     """Response from python_execution tool.
 
     Attributes:
@@ -596,7 +601,7 @@ class PythonExecutionResult(BaseModel):
 # ===== Tool Response Metadata Types =====
 
 
-class BashResponseMetadata(BaseModel):
+class BashResponseMetadata(_ToolModel):
     """Metadata for bash tool responses.
 
     Attributes:
@@ -608,7 +613,7 @@ class BashResponseMetadata(BaseModel):
     end_time: int
 
 
-class ReadTextResponseMetadata(BaseModel):
+class ReadTextResponseMetadata(_ToolModel):
     """Metadata for ReadText tool responses.
 
     Attributes:
@@ -620,7 +625,7 @@ class ReadTextResponseMetadata(BaseModel):
     content: str
 
 
-class GlobResponseMetadata(BaseModel):
+class GlobResponseMetadata(_ToolModel):
     """Metadata for glob tool responses.
 
     Attributes:
@@ -632,7 +637,7 @@ class GlobResponseMetadata(BaseModel):
     truncated: bool
 
 
-class GrepResponseMetadata(BaseModel):
+class GrepResponseMetadata(_ToolModel):
     """Metadata for grep tool responses.
 
     Attributes:
@@ -644,7 +649,7 @@ class GrepResponseMetadata(BaseModel):
     truncated: bool
 
 
-class WriteResponseMetadata(BaseModel):
+class WriteResponseMetadata(_ToolModel):
     """Metadata for write tool responses.
 
     Attributes:
@@ -658,7 +663,7 @@ class WriteResponseMetadata(BaseModel):
     removals: int
 
 
-class EditResponseMetadata(BaseModel):
+class EditResponseMetadata(_ToolModel):
     """Metadata for edit tool responses.
 
     Attributes:
@@ -670,3 +675,24 @@ class EditResponseMetadata(BaseModel):
     diff: str
     additions: int
     removals: int
+
+
+# ===== Tool Parameter Lookup =====
+
+
+TOOL_PARAMS: Dict[str, Type[BaseModel]] = {
+    CoreToolName.BASH.value: BashParams,
+    CoreToolName.READ_TEXT.value: ReadTextParams,
+    CoreToolName.GLOB.value: GlobParams,
+    CoreToolName.READ_MEDIA.value: ReadMediaParams,
+    CoreToolName.GREP.value: GrepParams,
+    CoreToolName.WRITE.value: WriteParams,
+    CoreToolName.EDIT.value: EditParams,
+    CoreToolName.PYTHON_EXECUTION.value: PythonExecutionParams,
+    CoreToolName.SEARCH.value: SearchParams,
+    CoreToolName.TODO_WRITE.value: TodoWriteParams,
+    CoreToolName.EXIT_PLAN_MODE.value: ExitPlanModeParams,
+    CoreToolName.SHOW_MEDIA.value: MediaShowcaseParams,
+    CoreToolName.TASK.value: TaskParams,
+}
+"""Parameter model for each core tool, keyed by tool name."""
@@ -8,8 +8,13 @@ from typing_extensions import TypeAliasType, TypeAlias
 
 
 class BaseModel(PydanticBaseModel):
+    # Schemas are built on first validation rather than at import, which keeps
+    # importing the large generated model modules cheap.
     model_config = ConfigDict(
-        populate_by_name=True, arbitrary_types_allowed=True, protected_namespaces=()
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        protected_namespaces=(),
+        defer_build=True,
     )
 
 
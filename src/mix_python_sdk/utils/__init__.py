@@ -52,6 +52,7 @@ if TYPE_CHECKING:
         validate_int,
     )
     from .url import generate_url, template_url, remove_suffix
+    from .warmup import warm_up
     from .values import (
         get_global_from_env,
         match_content_type,
@@ -59,7 +60,12 @@ if TYPE_CHECKING:
         match_response,
         cast_partial,
     )
-    from .logger import Logger, get_body_content, get_default_logger
+    from .logger import (
+        Logger,
+        get_body_content,
+        get_default_logger,
+        get_response_body_content,
+    )
 
 __all__ = [
     "BackoffStrategy",
@@ -75,6 +81,7 @@ __all__ = [
     "get_headers",
     "get_pydantic_model",
     "get_query_params",
+    "get_response_body_content",
     "get_response_headers",
     "get_security",
     "HeaderMetadata",
@@ -111,6 +118,7 @@ __all__ = [
     "validate_float",
     "validate_int",
     "cast_partial",
+    "warm_up",
 ]
 
 _dynamic_imports: dict[str, str] = {
@@ -127,6 +135,7 @@ _dynamic_imports: dict[str, str] = {
     "get_headers": ".headers",
     "get_pydantic_model": ".serializers",
     "get_query_params": ".queryparams",
+    "get_response_body_content": ".logger",
     "get_response_headers": ".headers",
     "get_security": ".security",
     "HeaderMetadata": ".metadata",
@@ -158,6 +167,7 @@ _dynamic_imports: dict[str, str] = {
     "template_url": ".url",
     "unmarshal": ".serializers",
     "unmarshal_json": ".serializers",
+    "warm_up": ".warmup",
     "validate_decimal": ".serializers",
     "validate_const": ".serializers",
     "validate_float": ".serializers",
@@ -0,0 +1,229 @@
+"""Bounded buffering between an SSE connection and a slow consumer.
+
+:class:`BufferedEventStreamAsync` reads the wrapped stream in a background task
+so the socket keeps draining while the consumer is busy. The buffer holds at
+most ``max_size`` events; what happens when it is full is set by the overflow
+policy:
+
+- ``"block"``: stop reading until the consumer catches up, which pushes back on
+  the server exactly like reading the stream directly.
+- ``"drop_heartbeats"``: discard heartbeats, queued or incoming, to make room,
+  then block.
+- ``"merge_content"``: as ``"drop_heartbeats"``, and also fold an incoming
+  content or thinking delta into the previous one when they belong to the same
+  message, then block.
+- ``"fail"``: end the stream with
+  :class:`~mix_python_sdk.errors.StreamOverflowError` and close the connection.
+"""
+
+import asyncio
+import collections
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Generic, Literal, Optional, TypeVar
+
+from mix_python_sdk.errors import StreamOverflowError
+
+T = TypeVar("T")
+
+OverflowPolicy = Literal["block", "drop_heartbeats", "merge_content", "fail"]
+
+_HEARTBEAT = "heartbeat"
+_DELTA_EVENTS = frozenset(("content", "thinking"))
+_OVERFLOW_POLICIES = frozenset(("block", "drop_heartbeats", "merge_content", "fail"))
+
+
+@dataclass
+class BufferStats:
+    """Counters for a :class:`BufferedEventStreamAsync`."""
+
+    received: int = 0
+    """Events read from the connection."""
+    delivered: int = 0
+    """Events handed to the consumer."""
+    dropped_heartbeats: int = 0
+    """Heartbeats discarded to make room."""
+    merged_deltas: int = 0
+    """Content or thinking deltas folded into the previous event."""
+    high_water_mark: int = 0
+    """Largest number of events buffered at once."""
+    blocked_seconds: float = 0.0
+    """Time the reader spent waiting for the consumer."""
+
+
+class BufferedEventStreamAsync(Generic[T]):
+    """Decouples reading an event stream from consuming it.
+
+    Args:
+        stream: Event stream to read, such as the ``result`` of
+            ``mix.streaming.stream_events_async``
+        max_size: Maximum number of buffered events
+        overflow: What to do when the buffer is full
+
+    Example:
+        ```python
+        res = await mix.streaming.stream_events_async(session_id=session.id)
+        async with BufferedEventStreamAsync(
+            res.result, max_size=256, overflow="merge_content"
+        ) as events:
+            async for event in events:
+                await websocket.send_json(event.model_dump())
+        ```
+    """
+
+    stream: Any
+    max_size: int
+    overflow: OverflowPolicy
+    stats: BufferStats
+
+    def __init__(
+        self,
+        stream: Any,
+        *,
+        max_size: int = 1024,
+        overflow: OverflowPolicy = "block",
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self.stream = stream
+        self.max_size = max_size
+        self.overflow = overflow
+        self.stats = BufferStats()
+        self._queue: Deque[T] = collections.deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._reader: Optional["asyncio.Task[None]"] = None
+        self._done = False
+        self._error: Optional[BaseException] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events currently buffered."""
+        return len(self._queue)
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        self._start()
+        queue = self._queue
+        while not queue:
+            if self._done:
+                if self._error is not None:
+                    error, self._error = self._error, None
+                    raise error
+                raise StopAsyncIteration
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        event = queue.popleft()
+        self.stats.delivered += 1
+        self._not_full.set()
+        return event
+
+    async def __aenter__(self):
+        self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop the reader and close the underlying stream.
+
+        Events already buffered can still be iterated afterwards.
+        """
+        reader = self._reader
+        if reader is not None and not reader.done():
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
+        self._done = True
+        await self.stream.__aexit__(None, None, None)
+
+    def _start(self) -> None:
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read())
+
+    async def _read(self) -> None:
+        try:
+            async for event in self.stream:
+                self.stats.received += 1
+                await self._put(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._error = e
+        finally:
+            self._done = True
+            self._not_empty.set()
+
+    async def _put(self, event: T) -> None:
+        queue = self._queue
+        while len(queue) >= self.max_size:
+            if self._make_room(event):
+                return
+            if self.overflow == "fail":
+                queue.clear()
+                await self.stream.__aexit__(None, None, None)
+                raise StreamOverflowError(
+                    f"Event buffer of {self.max_size} events overflowed"
+                )
+            self._not_full.clear()
+            start = time.perf_counter()
+            await self._not_full.wait()
+            self.stats.blocked_seconds += time.perf_counter() - start
+
+        queue.append(event)
+        if len(queue) > self.stats.high_water_mark:
+            self.stats.high_water_mark = len(queue)
+        self._not_empty.set()
+
+    def _make_room(self, event: T) -> bool:
+        """Apply the overflow policy to a full buffer.
+
+        Returns:
+            True if ``event`` was absorbed and must not be queued
+        """
+        if self.overflow not in ("drop_heartbeats", "merge_content"):
+            return False
+
+        tag = getattr(event, "event", None)
+        if tag == _HEARTBEAT:
+            self.stats.dropped_heartbeats += 1
+            return True
+
+        queue = self._queue
+        if self.overflow == "merge_content" and tag in _DELTA_EVENTS:
+            tail = queue[-1]
+            if _same_delta_stream(tail, event):
+                queue[-1] = _merge_delta(tail, event)
+                self.stats.merged_deltas += 1
+                return True
+
+        for i, queued in enumerate(queue):
+            if getattr(queued, "event", None) == _HEARTBEAT:
+                del queue[i]
+                self.stats.dropped_heartbeats += 1
+                break
+        return False
+
+
+def _same_delta_stream(a: Any, b: Any) -> bool:
+    if getattr(a, "event", None) != b.event:
+        return False
+    a_data, b_data = a.data, b.data
+    return getattr(a_data, "assistant_message_id", None) == getattr(
+        b_data, "assistant_message_id", None
+    ) and getattr(a_data, "parent_tool_call_id", None) == getattr(
+        b_data, "parent_tool_call_id", None
+    )
+
+
+def _merge_delta(a: Any, b: Any) -> Any:
+    # Keep the newer event's id so Last-Event-ID resumption stays correct.
+    data = b.data.model_copy(update={"content": a.data.content + b.data.content})
+    return b.model_copy(update={"data": data})
@@ -5,8 +5,11 @@ import json
 from dataclasses import dataclass, asdict
 from typing import (
     Any,
+    AsyncIterable,
+    Awaitable,
     Callable,
     Generic,
+    Iterable,
     TypeVar,
     Optional,
     Generator,
@@ -15,6 +18,17 @@ from typing import (
 )
 import httpx
 
+from mix_python_sdk.errors import StreamStalledError
+from .liveness import (
+    StallPolicy,
+    StreamLiveness,
+    interrupt_read,
+    watch_chunks,
+    watch_chunks_async,
+)
+from .prefetching import Prefetcher
+from .ssecapture import CaptureWriter, PathLike, capture_response
+
 T = TypeVar("T")
 
 
@@ -24,6 +38,7 @@ class EventStream(Generic[T]):
     client_ref: Optional[object]
     response: httpx.Response
     generator: Generator[T, None, None]
+    liveness: Optional[StreamLiveness]
     _closed: bool
 
     def __init__(
@@ -32,26 +47,146 @@ class EventStream(Generic[T]):
         decoder: Callable[[str], T],
         sentinel: Optional[str] = None,
         client_ref: Optional[object] = None,
+        reconnect: Optional[Callable[[Optional[str]], httpx.Response]] = None,
     ):
         self.response = response
         self.generator = stream_events(response, decoder, sentinel)
         self.client_ref = client_ref
+        self.liveness = None
+        self._decoder = decoder
+        self._sentinel = sentinel
+        self._reconnect = reconnect
+        self._prefetch_size = 0
+        self._prefetcher: Optional[Prefetcher[T]] = None
+        self._capture: Optional[CaptureWriter] = None
         self._closed = False
 
+    def monitor(
+        self,
+        heartbeat_interval: float,
+        *,
+        max_missed_heartbeats: int = 3,
+        on_stall: StallPolicy = "raise",
+        max_reconnects: int = 3,
+    ) -> "EventStream[T]":
+        """Detect dead connections from missing heartbeats.
+
+        Must be called before iterating. If nothing, heartbeats included, is
+        received for ``max_missed_heartbeats`` heartbeat intervals, iteration
+        raises :class:`~mix_python_sdk.errors.StreamStalledError`, or with
+        ``on_stall="reconnect"`` resumes from the last event ID on a new
+        connection, up to ``max_reconnects`` times in a row. Metrics are kept
+        in :attr:`liveness`.
+        """
+        if on_stall == "reconnect" and self._reconnect is None:
+            raise ValueError("This stream does not support reconnecting")
+        self.liveness = StreamLiveness(
+            heartbeat_interval,
+            max_missed_heartbeats=max_missed_heartbeats,
+            on_stall=on_stall,
+            max_reconnects=max_reconnects,
+        )
+        self.generator = stream_events(
+            self.response,
+            self._decoder,
+            self._sentinel,
+            chunks=watch_chunks(self.response, self.liveness),
+        )
+        return self
+
+    def capture(self, path: PathLike) -> "EventStream[T]":
+        """Record the raw response body with arrival times to ``path``.
+
+        Must be called before iterating. Connections opened by a reconnect
+        are appended to the same file, which is closed when the stream ends
+        or the ``with`` block exits. Replay the file with
+        :func:`mix_python_sdk.utils.ssecapture.replay_transport`.
+        """
+        response = self.response
+        self._capture = CaptureWriter(path, response.status_code, response.headers)
+        capture_response(response, self._capture)
+        return self
+
+    def prefetch(self, max_events: int = 64) -> "EventStream[T]":
+        """Read and decode events on a background thread ahead of the consumer.
+
+        Must be called before iterating. Up to ``max_events`` decoded events
+        are buffered; errors raised while reading are re-raised from
+        ``next()``, and leaving the ``with`` block stops the thread.
+        """
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        self._prefetch_size = max_events
+        return self
+
     def __iter__(self):
         return self
 
     def __next__(self):
         if self._closed:
             raise StopIteration
-        return next(self.generator)
+        if self._capture is None:
+            return self._next()
+        try:
+            return self._next()
+        except BaseException:
+            # Iteration is over, so the capture is complete.
+            self._capture.close()
+            raise
+
+    def _next(self) -> T:
+        if self._prefetch_size:
+            if self._prefetcher is None:
+                self._prefetcher = Prefetcher(
+                    self._next_event,
+                    self._prefetch_size,
+                    lambda: interrupt_read(self.response),
+                )
+            return self._prefetcher.get()
+        return self._next_event()
+
+    def _next_event(self) -> T:
+        if self.liveness is None:
+            return next(self.generator)
+        return self._next_monitored(self.liveness)
+
+    def _next_monitored(self, liveness: StreamLiveness) -> T:
+        while True:
+            try:
+                event = next(self.generator)
+            except StreamStalledError:
+                self.response.close()
+                if (
+                    liveness.on_stall != "reconnect"
+                    or self._reconnect is None
+                    or liveness.failed_reconnects >= liveness.max_reconnects
+                ):
+                    raise
+                liveness.reconnects += 1
+                liveness.failed_reconnects += 1
+                self.response = self._reconnect(liveness.last_event_id)
+                if self._capture is not None:
+                    capture_response(self.response, self._capture)
+                self.generator = stream_events(
+                    self.response,
+                    self._decoder,
+                    self._sentinel,
+                    chunks=watch_chunks(self.response, liveness),
+                )
+                continue
+            liveness.record_event(event)
+            return event
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._closed = True
+        if self._prefetcher is not None:
+            self._prefetcher.close()
         self.response.close()
+        if self._capture is not None:
+            self._capture.close()
 
 
 class EventStreamAsync(Generic[T]):
@@ -60,6 +195,7 @@ class EventStreamAsync(Generic[T]):
     client_ref: Optional[object]
     response: httpx.Response
     generator: AsyncGenerator[T, None]
+    liveness: Optional[StreamLiveness]
     _closed: bool
 
     def __init__(
@@ -68,19 +204,104 @@ class EventStreamAsync(Generic[T]):
         decoder: Callable[[str], T],
         sentinel: Optional[str] = None,
         client_ref: Optional[object] = None,
+        reconnect: Optional[
+            Callable[[Optional[str]], Awaitable[httpx.Response]]
+        ] = None,
     ):
         self.response = response
         self.generator = stream_events_async(response, decoder, sentinel)
         self.client_ref = client_ref
+        self.liveness = None
+        self._decoder = decoder
+        self._sentinel = sentinel
+        self._reconnect = reconnect
+        self._capture: Optional[CaptureWriter] = None
         self._closed = False
 
+    def monitor(
+        self,
+        heartbeat_interval: float,
+        *,
+        max_missed_heartbeats: int = 3,
+        on_stall: StallPolicy = "raise",
+        max_reconnects: int = 3,
+    ) -> "EventStreamAsync[T]":
+        """Detect dead connections from missing heartbeats.
+
+        See :meth:`EventStream.monitor`.
+        """
+        if on_stall == "reconnect" and self._reconnect is None:
+            raise ValueError("This stream does not support reconnecting")
+        self.liveness = StreamLiveness(
+            heartbeat_interval,
+            max_missed_heartbeats=max_missed_heartbeats,
+            on_stall=on_stall,
+            max_reconnects=max_reconnects,
+        )
+        self.generator = stream_events_async(
+            self.response,
+            self._decoder,
+            self._sentinel,
+            chunks=watch_chunks_async(self.response, self.liveness),
+        )
+        return self
+
+    def capture(self, path: PathLike) -> "EventStreamAsync[T]":
+        """Record the raw response body with arrival times to ``path``.
+
+        See :meth:`EventStream.capture`.
+        """
+        response = self.response
+        self._capture = CaptureWriter(path, response.status_code, response.headers)
+        capture_response(response, self._capture)
+        return self
+
     def __aiter__(self):
         return self
 
     async def __anext__(self):
         if self._closed:
             raise StopAsyncIteration
-        return await self.generator.__anext__()
+        if self._capture is None:
+            return await self._next()
+        try:
+            return await self._next()
+        except BaseException:
+            # Iteration is over, so the capture is complete.
+            self._capture.close()
+            raise
+
+    async def _next(self) -> T:
+        if self.liveness is None:
+            return await self.generator.__anext__()
+        return await self._next_monitored(self.liveness)
+
+    async def _next_monitored(self, liveness: StreamLiveness) -> T:
+        while True:
+            try:
+                event = await self.generator.__anext__()
+            except StreamStalledError:
+                await self.response.aclose()
+                if (
+                    liveness.on_stall != "reconnect"
+                    or self._reconnect is None
+                    or liveness.failed_reconnects >= liveness.max_reconnects
+                ):
+                    raise
+                liveness.reconnects += 1
+                liveness.failed_reconnects += 1
+                self.response = await self._reconnect(liveness.last_event_id)
+                if self._capture is not None:
+                    capture_response(self.response, self._capture)
+                self.generator = stream_events_async(
+                    self.response,
+                    self._decoder,
+                    self._sentinel,
+                    chunks=watch_chunks_async(self.response, liveness),
+                )
+                continue
+            liveness.record_event(event)
+            return event
 
     async def __aenter__(self):
         return self
@@ -88,6 +309,8 @@ class EventStreamAsync(Generic[T]):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         self._closed = True
         await self.response.aclose()
+        if self._capture is not None:
+            self._capture.close()
 
 
 @dataclass
@@ -116,11 +339,14 @@ async def stream_events_async(
     response: httpx.Response,
     decoder: Callable[[str], T],
     sentinel: Optional[str] = None,
+    chunks: Optional[AsyncIterable[bytes]] = None,
 ) -> AsyncGenerator[T, None]:
     buffer = bytearray()
     position = 0
     event_id: Optional[str] = None
-    async for chunk in response.aiter_bytes():
+    if chunks is None:
+        chunks = response.aiter_bytes()
+    async for chunk in chunks:
         if len(buffer) == 0 and chunk.startswith(UTF8_BOM):
             chunk = chunk[len(UTF8_BOM) :]
         buffer += chunk
@@ -161,11 +387,14 @@ def stream_events(
     response: httpx.Response,
     decoder: Callable[[str], T],
     sentinel: Optional[str] = None,
+    chunks: Optional[Iterable[bytes]] = None,
 ) -> Generator[T, None, None]:
     buffer = bytearray()
     position = 0
     event_id: Optional[str] = None
-    for chunk in response.iter_bytes():
+    if chunks is None:
+        chunks = response.iter_bytes()
+    for chunk in chunks:
         if len(buffer) == 0 and chunk.startswith(UTF8_BOM):
             chunk = chunk[len(UTF8_BOM) :]
         buffer += chunk
@@ -0,0 +1,288 @@
+"""Incremental decoding of large JSON documents that wrap a single array.
+
+The scanner only ever holds the bytes of the value currently being read, so
+memory stays bounded by the largest array item rather than the whole body.
+"""
+
+import json
+import re
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import httpx
+
+T = TypeVar("T")
+
+_STRUCTURAL = re.compile(rb'["{}\[\],:]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class JSONArrayStream(Generic[T]):
+    """Iterates the items of ``array_key`` in a top-level JSON object.
+
+    Every other top-level member is collected into ``metadata`` as soon as it
+    has been read, so fields sent before the array are available up front and
+    the remaining ones once iteration finishes. Unlike the items, which go
+    through ``decoder``, these are plain ``json.loads`` values keyed by their
+    JSON names and are not validated.
+    """
+
+    # Holds a reference to the SDK client to avoid it being garbage collected
+    # and cause termination of the underlying httpx client.
+    client_ref: Optional[object]
+    response: httpx.Response
+    generator: Generator[T, None, None]
+    metadata: Dict[str, Any]
+    _closed: bool
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        decoder: Callable[[bytes], T],
+        array_key: str,
+        client_ref: Optional[object] = None,
+    ):
+        self.response = response
+        self.metadata = {}
+        self.generator = stream_array_items(
+            response, decoder, array_key, self.metadata
+        )
+        self.client_ref = client_ref
+        self._closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._closed:
+            raise StopIteration
+        return next(self.generator)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._closed = True
+        self.response.close()
+
+
+class JSONArrayStreamAsync(Generic[T]):
+    """Async counterpart of :class:`JSONArrayStream`."""
+
+    # Holds a reference to the SDK client to avoid it being garbage collected
+    # and cause termination of the underlying httpx client.
+    client_ref: Optional[object]
+    response: httpx.Response
+    generator: AsyncGenerator[T, None]
+    metadata: Dict[str, Any]
+    _closed: bool
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        decoder: Callable[[bytes], T],
+        array_key: str,
+        client_ref: Optional[object] = None,
+    ):
+        self.response = response
+        self.metadata = {}
+        self.generator = stream_array_items_async(
+            response, decoder, array_key, self.metadata
+        )
+        self.client_ref = client_ref
+        self._closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._closed:
+            raise StopAsyncIteration
+        return await self.generator.__anext__()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._closed = True
+        await self.response.aclose()
+
+
+def stream_array_items(
+    response: httpx.Response,
+    decoder: Callable[[bytes], T],
+    array_key: str,
+    metadata: Dict[str, Any],
+) -> Generator[T, None, None]:
+    scanner = JSONArrayScanner(array_key)
+    for chunk in response.iter_bytes():
+        for key, raw in scanner.feed(chunk):
+            if key is None:
+                yield decoder(raw)
+            else:
+                metadata[key] = json.loads(raw)
+    scanner.close()
+
+
+async def stream_array_items_async(
+    response: httpx.Response,
+    decoder: Callable[[bytes], T],
+    array_key: str,
+    metadata: Dict[str, Any],
+) -> AsyncGenerator[T, None]:
+    scanner = JSONArrayScanner(array_key)
+    async for chunk in response.aiter_bytes():
+        for key, raw in scanner.feed(chunk):
+            if key is None:
+                yield decoder(raw)
+            else:
+                metadata[key] = json.loads(raw)
+    scanner.close()
+
+
+class JSONArrayScanner:
+    """Splits a JSON object into raw top-level members and array items.
+
+    ``feed`` returns ``(key, raw)`` pairs as they complete: ``key`` is ``None``
+    for items of ``array_key`` and the member name for everything else. Only
+    structural characters are inspected; values are handed back undecoded.
+    """
+
+    def __init__(self, array_key: str):
+        self.array_key = array_key
+        self._buf = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._done = False
+        # Start offset of the member value or array item being captured.
+        self._value_start: Optional[int] = None
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._in_array = False
+
+    def feed(self, chunk: bytes) -> List[Tuple[Optional[str], bytes]]:
+        if not self._started and not self._buf and chunk.startswith(UTF8_BOM):
+            chunk = chunk[len(UTF8_BOM) :]
+        self._buf += chunk
+        out: List[Tuple[Optional[str], bytes]] = []
+        self._scan(out)
+        self._compact()
+        return out
+
+    def close(self) -> None:
+        if not self._done:
+            raise ValueError("Unexpected end of JSON document")
+
+    def _scan(self, out: List[Tuple[Optional[str], bytes]]) -> None:
+        buf = self._buf
+        pos = self._pos
+        while not self._done:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                i = match.start()
+                if buf[i] == 0x5C:  # backslash
+                    if i + 1 >= len(buf):
+                        pos = i
+                        break
+                    pos = i + 2
+                    continue
+                self._in_string = False
+                pos = i + 1
+                if self._key_start is not None:
+                    self._key = json.loads(bytes(buf[self._key_start : pos]))
+                    self._key_start = None
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            i = match.start()
+            c = buf[i]
+            pos = i + 1
+
+            if c == 0x22:  # "
+                self._in_string = True
+                if self._depth == 1 and self._value_start is None:
+                    self._key_start = i
+            elif c in (0x7B, 0x5B):  # { [
+                if self._depth == 0:
+                    if c != 0x7B:
+                        raise ValueError("Expected a JSON object")
+                    self._started = True
+                elif (
+                    self._depth == 1
+                    and c == 0x5B
+                    and self._key == self.array_key
+                    and not buf[self._value_start : i].strip()
+                ):
+                    self._in_array = True
+                    self._value_start = pos
+                self._depth += 1
+            elif c in (0x7D, 0x5D):  # } ]
+                self._depth -= 1
+                if self._in_array and self._depth == 1:
+                    self._emit_item(buf, i, out)
+                    self._in_array = False
+                    self._key = None
+                    self._value_start = None
+                elif self._depth == 0:
+                    self._emit_member(buf, i, out)
+                    self._done = True
+            elif c == 0x3A:  # :
+                if self._depth == 1 and self._value_start is None:
+                    self._value_start = pos
+            elif c == 0x2C:  # ,
+                if self._in_array and self._depth == 2:
+                    self._emit_item(buf, i, out)
+                    self._value_start = pos
+                elif self._depth == 1:
+                    self._emit_member(buf, i, out)
+        self._pos = pos
+
+    def _emit_item(
+        self, buf: bytearray, end: int, out: List[Tuple[Optional[str], bytes]]
+    ) -> None:
+        raw = bytes(buf[self._value_start : end]).strip()
+        if raw:
+            out.append((None, raw))
+
+    def _emit_member(
+        self, buf: bytearray, end: int, out: List[Tuple[Optional[str], bytes]]
+    ) -> None:
+        if self._key is not None and self._value_start is not None:
+            out.append((self._key, bytes(buf[self._value_start : end]).strip()))
+        self._key = None
+        self._value_start = None
+
+    def _compact(self) -> None:
+        # Drop everything before the earliest offset that is still needed.
+        keep = self._pos
+        for start in (self._value_start, self._key_start):
+            if start is not None and start < keep:
+                keep = start
+        if keep == 0:
+            return
+        del self._buf[:keep]
+        self._pos -= keep
+        if self._value_start is not None:
+            self._value_start -= keep
+        if self._key_start is not None:
+            self._key_start -= keep
@@ -0,0 +1,167 @@
+"""Stall detection for server-sent event streams.
+
+The server sends heartbeat events while a session is idle, so a connection
+that delivers nothing at all, heartbeats included, for several heartbeat
+intervals is dead even if the socket still looks open. Monitored streams time
+every read and raise :class:`~mix_python_sdk.errors.StreamStalledError` once
+one has waited longer than ``heartbeat_interval * max_missed_heartbeats``.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterator, Literal, Optional
+
+import httpx
+
+from mix_python_sdk.errors import StreamStalledError
+
+StallPolicy = Literal["raise", "reconnect"]
+
+_HEARTBEAT = "heartbeat"
+
+
+@dataclass
+class StreamLiveness:
+    """Liveness settings and metrics of a monitored event stream.
+
+    Timestamps are ``time.monotonic()`` values.
+    """
+
+    heartbeat_interval: float
+    max_missed_heartbeats: int = 3
+    on_stall: StallPolicy = "raise"
+    max_reconnects: int = 3
+    last_byte_at: float = field(default_factory=time.monotonic)
+    last_heartbeat_at: Optional[float] = None
+    last_event_id: Optional[str] = None
+    heartbeats: int = 0
+    stalls: int = 0
+    reconnects: int = 0
+    # Reconnects since an event was last received.
+    failed_reconnects: int = 0
+
+    @property
+    def stall_after(self) -> float:
+        """Seconds without data after which the stream counts as stalled."""
+        return self.heartbeat_interval * self.max_missed_heartbeats
+
+    def seconds_since_last_byte(self) -> float:
+        return time.monotonic() - self.last_byte_at
+
+    def seconds_since_last_heartbeat(self) -> Optional[float]:
+        if self.last_heartbeat_at is None:
+            return None
+        return time.monotonic() - self.last_heartbeat_at
+
+    def record_event(self, event: object) -> None:
+        self.failed_reconnects = 0
+        event_id = getattr(event, "id", None)
+        if event_id is not None:
+            self.last_event_id = event_id
+        if getattr(event, "event", None) == _HEARTBEAT:
+            self.heartbeats += 1
+            self.last_heartbeat_at = time.monotonic()
+
+    def stalled_error(self) -> StreamStalledError:
+        self.stalls += 1
+        return StreamStalledError(
+            f"No data received for {self.stall_after:g}s "
+            f"({self.max_missed_heartbeats} heartbeat intervals of "
+            f"{self.heartbeat_interval:g}s)"
+        )
+
+
+def watch_chunks(response: httpx.Response, liveness: StreamLiveness) -> Iterator[bytes]:
+    """Yield the response body, raising StreamStalledError if it goes silent.
+
+    Only time spent waiting on the socket counts, so a consumer that is slow to
+    ask for the next event is never mistaken for a dead connection. A blocking
+    read cannot be interrupted from the reading thread, so a watchdog thread
+    shuts the socket down once a read has stalled.
+    """
+    watchdog = _Watchdog(response, liveness)
+    watchdog.start()
+    chunks = response.iter_bytes()
+    try:
+        while True:
+            watchdog.reading_since = time.monotonic()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                break
+            watchdog.reading_since = None
+            liveness.last_byte_at = time.monotonic()
+            yield chunk
+    except (httpx.HTTPError, httpx.StreamError):
+        if watchdog.stalled.is_set():
+            raise liveness.stalled_error() from None
+        raise
+    finally:
+        watchdog.stop()
+    if watchdog.stalled.is_set():
+        raise liveness.stalled_error()
+
+
+async def watch_chunks_async(
+    response: httpx.Response, liveness: StreamLiveness
+) -> AsyncIterator[bytes]:
+    """Async counterpart of :func:`watch_chunks`, using a per-read timeout."""
+    chunks = response.aiter_bytes().__aiter__()
+    while True:
+        try:
+            chunk = await asyncio.wait_for(chunks.__anext__(), liveness.stall_after)
+        except StopAsyncIteration:
+            return
+        except asyncio.TimeoutError:
+            raise liveness.stalled_error() from None
+        liveness.last_byte_at = time.monotonic()
+        yield chunk
+
+
+class _Watchdog:
+    def __init__(self, response: httpx.Response, liveness: StreamLiveness):
+        self.response = response
+        self.liveness = liveness
+        # Monotonic time the pending read started, or None between reads.
+        self.reading_since: Optional[float] = None
+        self.stalled = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="mix-stream-watchdog", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _run(self) -> None:
+        stall_after = self.liveness.stall_after
+        while True:
+            reading_since = self.reading_since
+            remaining = stall_after
+            if reading_since is not None:
+                remaining -= time.monotonic() - reading_since
+                if remaining <= 0:
+                    break
+            if self._stopped.wait(remaining):
+                return
+        self.stalled.set()
+        interrupt_read(self.response)
+
+
+def interrupt_read(response: httpx.Response) -> None:
+    """Make a read blocked on ``response`` in another thread fail promptly."""
+    stream = response.extensions.get("network_stream")
+    sock = stream.get_extra_info("socket") if stream is not None else None
+    try:
+        if isinstance(sock, socket.socket):
+            sock.shutdown(socket.SHUT_RDWR)
+        else:
+            response.close()
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
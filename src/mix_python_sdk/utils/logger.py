@@ -20,6 +20,22 @@ def get_body_content(req: httpx.Request) -> str:
     return "<streaming body>" if not hasattr(req, "_content") else str(req.content)
 
 
+class _ResponseBody:
+    """Defers decoding a response body until a log record is formatted."""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: httpx.Response):
+        self.response = response
+
+    def __str__(self) -> str:
+        return self.response.text
+
+
+def get_response_body_content(res: httpx.Response, stream: bool) -> Any:
+    return "<streaming response>" if stream else _ResponseBody(res)
+
+
 def get_default_logger() -> Logger:
     if os.getenv("MIX_DEBUG"):
         logging.basicConfig(level=logging.DEBUG)
@@ -0,0 +1,283 @@
+"""Incremental parsing of JSON that arrives in fragments.
+
+:class:`PartialJSONParser` keeps its tokenizer state between calls to
+``feed``, so each fragment is scanned once and the cost of a call depends only
+on the fragment's length. The value built so far can be read at any point:
+containers are filled in as their members complete, and a string that is still
+arriving shows the text received so far. Numbers and literals only appear once
+they are terminated, since ``1`` might still become ``12``.
+"""
+
+import json
+import re
+from typing import Any, List, Optional, Tuple, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_SPECIAL = re.compile(r'["\\]')
+_LITERAL = re.compile(r"[^,\]} \t\n\r]*")
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+_MISSING: Any = object()
+
+# What a container frame expects next.
+_VALUE = 0
+_KEY = 1
+_COLON = 2
+_COMMA = 3
+
+_Container = Union[dict, list]
+
+
+class PartialJSONParser:
+    """Resumable JSON parser exposing a best-effort value after every fragment.
+
+    Example:
+        ```python
+        parser = PartialJSONParser()
+        parser.feed('{"command": "ls -')
+        parser.value  # {"command": "ls -"}
+        parser.feed('la", "timeout": 5}')
+        parser.close()  # {"command": "ls -la", "timeout": 5}
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._root: Any = _MISSING
+        # Open containers, innermost last, each with its pending object key.
+        self._stack: List[List[Any]] = []
+        self._expect = _VALUE
+        # String being read: decoded pieces, and where the value is stored.
+        self._pieces: Optional[List[str]] = None
+        self._string_is_key = False
+        self._slot: Optional[Tuple[_Container, Any]] = None
+        self._escape = ""
+        self._high_surrogate = ""
+        self._literal: Optional[List[str]] = None
+        self._done = False
+        self._error: Optional[str] = None
+
+    @property
+    def value(self) -> Any:
+        """The value parsed so far, or ``None`` before anything is known."""
+        if self._slot is not None and self._pieces is not None:
+            container, key = self._slot
+            container[key] = "".join(self._pieces) + self._high_surrogate
+        if self._root is _MISSING:
+            if self._pieces is not None and not self._string_is_key:
+                return "".join(self._pieces)
+            return None
+        return self._root
+
+    @property
+    def complete(self) -> bool:
+        """Whether a whole JSON value has been read."""
+        return self._done
+
+    @property
+    def error(self) -> Optional[str]:
+        """Why parsing stopped, if the input is not valid JSON."""
+        return self._error
+
+    def feed(self, text: str) -> None:
+        """Consume the next fragment of the document."""
+        if self._error is not None:
+            return
+        try:
+            self._scan(text)
+        except ValueError as e:
+            self._error = str(e)
+
+    def close(self) -> Any:
+        """Finish parsing and return the complete value.
+
+        Raises:
+            ValueError: If the input was not a single complete JSON value
+        """
+        if self._error is None and self._literal is not None and not self._stack:
+            self._end_literal()
+        if self._error is not None:
+            raise ValueError(self._error)
+        if not self._done:
+            raise ValueError("Incomplete JSON document")
+        return self._root
+
+    def _scan(self, text: str) -> None:
+        pos = 0
+        end = len(text)
+        while pos < end:
+            if self._pieces is not None:
+                pos = self._scan_string(text, pos)
+                continue
+            if self._literal is not None:
+                match = _LITERAL.match(text, pos)
+                self._literal.append(match.group())
+                pos = match.end()
+                if pos < end:
+                    self._end_literal()
+                continue
+
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos >= end:
+                break
+            if self._done:
+                raise ValueError(f"Unexpected data after JSON value: {text[pos]!r}")
+            c = text[pos]
+            pos += 1
+            expect = self._expect
+
+            if expect == _KEY:
+                if c == '"':
+                    self._start_string(is_key=True)
+                elif c == "}" and not self._stack[-1][0]:
+                    self._close_container()
+                else:
+                    raise ValueError(f"Expected an object key, got {c!r}")
+            elif expect == _COLON:
+                if c != ":":
+                    raise ValueError(f"Expected ':', got {c!r}")
+                self._expect = _VALUE
+            elif expect == _COMMA:
+                container = self._stack[-1][0]
+                if c == ",":
+                    self._expect = _KEY if isinstance(container, dict) else _VALUE
+                elif c == ("}" if isinstance(container, dict) else "]"):
+                    self._close_container()
+                else:
+                    raise ValueError(f"Expected ',' or closing bracket, got {c!r}")
+            elif c == '"':
+                self._start_string(is_key=False)
+            elif c == "{" or c == "[":
+                container: _Container = {} if c == "{" else []
+                self._place(container)
+                self._stack.append([container, None])
+                self._expect = _KEY if c == "{" else _VALUE
+            elif c == "]" and self._stack and isinstance(self._stack[-1][0], list):
+                if self._stack[-1][0]:
+                    raise ValueError("Expected a value, got ']'")
+                self._close_container()
+            elif c in "-0123456789tfn":
+                self._literal = [c]
+            else:
+                raise ValueError(f"Unexpected character {c!r}")
+
+    def _scan_string(self, text: str, pos: int) -> int:
+        if self._escape:
+            return self._scan_escape(text, pos)
+        match = _STRING_SPECIAL.search(text, pos)
+        if match is None:
+            self._add_text(text[pos:])
+            return len(text)
+        i = match.start()
+        if i > pos:
+            self._add_text(text[pos:i])
+        if text[i] == "\\":
+            self._escape = "\\"
+            return self._scan_escape(text, i + 1)
+        self._end_string()
+        return i + 1
+
+    def _scan_escape(self, text: str, pos: int) -> int:
+        escape = self._escape
+        while pos < len(text):
+            escape += text[pos]
+            pos += 1
+            if len(escape) == 2 and escape[1] != "u":
+                decoded = _ESCAPES.get(escape[1])
+                if decoded is None:
+                    raise ValueError(f"Invalid escape {escape!r}")
+                self._escape = ""
+                self._add_text(decoded)
+                return pos
+            if len(escape) == 6:
+                self._escape = ""
+                self._add_code_unit(int(escape[2:], 16))
+                return pos
+        self._escape = escape
+        return pos
+
+    def _add_code_unit(self, code: int) -> None:
+        if 0xD800 <= code <= 0xDBFF:
+            self._flush_surrogate()
+            self._high_surrogate = chr(code)
+        elif 0xDC00 <= code <= 0xDFFF and self._high_surrogate:
+            high = ord(self._high_surrogate)
+            self._high_surrogate = ""
+            self._pieces.append(  # type: ignore[union-attr]
+                chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00))
+            )
+        else:
+            self._add_text(chr(code))
+
+    def _add_text(self, text: str) -> None:
+        self._flush_surrogate()
+        self._pieces.append(text)  # type: ignore[union-attr]
+
+    def _flush_surrogate(self) -> None:
+        if self._high_surrogate:
+            self._pieces.append(self._high_surrogate)  # type: ignore[union-attr]
+            self._high_surrogate = ""
+
+    def _start_string(self, is_key: bool) -> None:
+        self._pieces = []
+        self._string_is_key = is_key
+        if not is_key and self._stack:
+            self._slot = self._place("")
+
+    def _end_string(self) -> None:
+        self._flush_surrogate()
+        text = "".join(self._pieces)  # type: ignore[arg-type]
+        self._pieces = None
+        if self._string_is_key:
+            self._stack[-1][1] = text
+            self._expect = _COLON
+            return
+        slot, self._slot = self._slot, None
+        if slot is None:
+            self._root = text
+            self._done = True
+        else:
+            slot[0][slot[1]] = text
+            self._expect = _COMMA
+
+    def _end_literal(self) -> None:
+        raw = "".join(self._literal)  # type: ignore[arg-type]
+        self._literal = None
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid literal {raw!r}") from None
+        self._place(value)
+
+    def _place(self, value: Any) -> Optional[Tuple[_Container, Any]]:
+        """Store a value in its parent; returns the slot it was stored in."""
+        if not self._stack:
+            self._root = value
+            if not isinstance(value, (dict, list, str)):
+                self._done = True
+            return None
+        frame = self._stack[-1]
+        container = frame[0]
+        self._expect = _COMMA
+        if isinstance(container, list):
+            container.append(value)
+            return container, len(container) - 1
+        key = frame[1]
+        container[key] = value
+        return container, key
+
+    def _close_container(self) -> None:
+        self._stack.pop()
+        if self._stack:
+            self._expect = _COMMA
+        else:
+            self._done = True
@@ -0,0 +1,105 @@
+"""Reading a synchronous event stream ahead of its consumer.
+
+A plain :class:`~mix_python_sdk.utils.eventstreaming.EventStream` only reads
+from the socket while the caller is inside ``next()``, so a consumer that does
+slow work per event leaves the connection idle and lets the server buffer up.
+:class:`Prefetcher` moves reading and decoding to a daemon thread that stays up
+to ``max_events`` events ahead, overlapping network I/O and parsing with the
+consumer's work.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+_END: Any = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class Prefetcher(Generic[T]):
+    """Runs ``pull`` on a background thread, buffering up to ``max_events``.
+
+    Args:
+        pull: Returns the next event, raising StopIteration at the end
+        max_events: How many events may wait for the consumer
+        interrupt: Makes a ``pull`` blocked on the network fail, for closing
+    """
+
+    def __init__(
+        self,
+        pull: Callable[[], T],
+        max_events: int,
+        interrupt: Callable[[], None],
+    ):
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        self._pull = pull
+        self._interrupt = interrupt
+        self._queue: "queue.Queue[Any]" = queue.Queue(max_events)
+        self._stopped = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._run, name="mix-stream-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def buffered(self) -> int:
+        """Events read but not yet taken by the consumer."""
+        return self._queue.qsize()
+
+    def get(self) -> T:
+        """The next event, re-raising whatever the reader thread raised.
+
+        Raises:
+            StopIteration: At the end of the stream or once closed
+        """
+        if self._finished:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self._finished = True
+            raise item.error
+        return item
+
+    def close(self) -> None:
+        """Stop the reader thread and wait for it to exit."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._finished = True
+        self._interrupt()
+        # Make room for a reader blocked on a full queue.
+        while self._thread.is_alive():
+            try:
+                while True:
+                    self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._thread.join(0.05)
+
+    def _run(self) -> None:
+        stopped = self._stopped
+        put = self._queue.put
+        while not stopped.is_set():
+            try:
+                item = self._pull()
+            except StopIteration:
+                put(_END)
+                return
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                if not stopped.is_set():
+                    put(_Failure(e))
+                return
+            put(item)
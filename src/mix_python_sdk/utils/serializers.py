@@ -121,13 +121,7 @@ def unmarshal_json(raw, typ: Any) -> Any:
 
 
 def unmarshal(val, typ: Any) -> Any:
-    unmarshaller = create_model(
-        "Unmarshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
-
-    m = unmarshaller(body=val)
+    m = _wrapper_model("Unmarshaller", typ)(body=val)
 
     # pyright: ignore[reportAttributeAccessIssue]
     return m.body  # type: ignore
@@ -137,13 +131,7 @@ def marshal_json(val, typ):
     if is_nullable(typ) and val is None:
         return "null"
 
-    marshaller = create_model(
-        "Marshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
-
-    m = marshaller(body=val)
+    m = _wrapper_model("Marshaller", typ)(body=val)
 
     d = m.model_dump(by_alias=True, mode="json", exclude_none=True)
 
@@ -153,6 +141,26 @@ def marshal_json(val, typ):
     return json.dumps(d[next(iter(d))], separators=(",", ":"))
 
 
+def _wrapper_model(name: str, typ: Any) -> Any:
+    # Building the wrapper compiles the schema of ``typ``, which takes
+    # milliseconds for large unions, so it happens once per type.
+    try:
+        return _cached_wrapper_model(name, typ)
+    except TypeError:  # unhashable annotation
+        return _create_wrapper_model(name, typ)
+
+
+def _create_wrapper_model(name: str, typ: Any) -> Any:
+    return create_model(
+        name,
+        body=(typ, ...),
+        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
+    )
+
+
+_cached_wrapper_model = functools.lru_cache(maxsize=None)(_create_wrapper_model)
+
+
 def is_nullable(field):
     origin = get_origin(field)
     if origin is Nullable or origin is OptionalNullable:
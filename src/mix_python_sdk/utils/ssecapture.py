@@ -0,0 +1,276 @@
+"""Recording raw SSE responses and replaying them through the SDK.
+
+A capture file holds the response status and headers followed by every body
+chunk exactly as it came off the connection, each with its arrival time:
+
+    magic   b"MIXSSE\\x01"
+    header  uint32 length + JSON {"status": int, "headers": [[name, value], ...]}
+    chunk   uint64 nanoseconds since the response started + uint32 length + bytes
+    ...
+
+Chunks are written by a background thread, so capturing adds only a queue put
+to the read path. :func:`replay_transport` serves a capture back to
+``Streaming.stream_events``/``stream_events_async`` through an
+``httpx.MockTransport``, either as fast as possible or with the original
+timing, which makes parser and decoder measurements repeatable across SDK
+versions.
+"""
+
+import asyncio
+import json
+import os
+import queue
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+
+MAGIC = b"MIXSSE\x01"
+
+_LENGTH = struct.Struct("<I")
+_RECORD = struct.Struct("<QI")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class CaptureWriter:
+    """Appends timestamped chunks to a capture file from a background thread."""
+
+    def __init__(
+        self,
+        path: PathLike,
+        status_code: int = 200,
+        headers: Optional[httpx.Headers] = None,
+    ):
+        self.path = path
+        self._file: BinaryIO = open(path, "wb")  # pylint: disable=consider-using-with
+        header = json.dumps(
+            {
+                "status": status_code,
+                "headers": list((headers or httpx.Headers()).multi_items()),
+            }
+        ).encode()
+        self._file.write(MAGIC + _LENGTH.pack(len(header)) + header)
+        self._queue: "queue.SimpleQueue[Optional[Tuple[int, bytes]]]" = (
+            queue.SimpleQueue()
+        )
+        self._start = time.perf_counter_ns()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="mix-sse-capture", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, chunk: bytes) -> None:
+        """Record a chunk with its arrival time."""
+        if not self._closed:
+            self._queue.put((time.perf_counter_ns() - self._start, chunk))
+
+    def close(self) -> None:
+        """Flush pending chunks and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        write = self._file.write
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                offset, chunk = item
+                write(_RECORD.pack(offset, len(chunk)))
+                write(chunk)
+        finally:
+            self._file.close()
+
+
+class CapturingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body stream that copies every chunk to a capture.
+
+    The capture is closed with the stream unless ``close_writer`` is False.
+    """
+
+    def __init__(self, inner, writer: CaptureWriter, close_writer: bool = True):
+        self._inner = inner
+        self._writer = writer
+        self._close_writer = close_writer
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._inner:
+            self._writer.write(chunk)
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._inner:
+            self._writer.write(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._inner.close()
+        finally:
+            if self._close_writer:
+                self._writer.close()
+
+    async def aclose(self) -> None:
+        try:
+            await self._inner.aclose()
+        finally:
+            if self._close_writer:
+                self._writer.close()
+
+
+def capture_response(
+    response: httpx.Response, capture: Union[PathLike, CaptureWriter]
+) -> CaptureWriter:
+    """Record the body of a streaming response that has not been read yet.
+
+    Args:
+        response: Response whose body is still unread
+        capture: Path of a new capture file, closed with the response, or an
+            open :class:`CaptureWriter` to append to, such as the one of an
+            earlier connection to the same stream; it is left open
+    """
+    if isinstance(capture, CaptureWriter):
+        response.stream = CapturingStream(response.stream, capture, False)
+        return capture
+    writer = CaptureWriter(capture, response.status_code, response.headers)
+    response.stream = CapturingStream(response.stream, writer)
+    return writer
+
+
+@dataclass
+class Capture:
+    """A capture file loaded into memory.
+
+    Attributes:
+        status_code: Status of the recorded response
+        headers: Headers of the recorded response
+        chunks: ``(nanoseconds since start, bytes)`` for every chunk
+    """
+
+    status_code: int = 200
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+    chunks: List[Tuple[int, bytes]] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        """Total body size in bytes."""
+        return sum(len(chunk) for _, chunk in self.chunks)
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the start of the response and the last chunk."""
+        return self.chunks[-1][0] / 1e9 if self.chunks else 0.0
+
+
+def load_capture(path: PathLike) -> Capture:
+    """Read a capture file.
+
+    Raises:
+        ValueError: If the file is not a capture or is truncated
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not an SSE capture file")
+    pos = len(MAGIC)
+    (header_len,) = _LENGTH.unpack_from(data, pos)
+    pos += _LENGTH.size
+    header = json.loads(data[pos : pos + header_len])
+    pos += header_len
+
+    capture = Capture(header["status"], [tuple(h) for h in header["headers"]])
+    while pos < len(data):
+        if pos + _RECORD.size > len(data):
+            raise ValueError(f"{path} is truncated")
+        offset, length = _RECORD.unpack_from(data, pos)
+        pos += _RECORD.size
+        if pos + length > len(data):
+            raise ValueError(f"{path} is truncated")
+        capture.chunks.append((offset, data[pos : pos + length]))
+        pos += length
+    return capture
+
+
+class ReplayStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Serves a capture's chunks, optionally with their original timing."""
+
+    def __init__(self, capture: Capture, realtime: bool = False):
+        self.capture = capture
+        self.realtime = realtime
+
+    def __iter__(self) -> Iterator[bytes]:
+        if not self.realtime:
+            for _, chunk in self.capture.chunks:
+                yield chunk
+            return
+        start = time.perf_counter_ns()
+        for offset, chunk in self.capture.chunks:
+            delay = (offset - (time.perf_counter_ns() - start)) / 1e9
+            if delay > 0:
+                time.sleep(delay)
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if not self.realtime:
+            for _, chunk in self.capture.chunks:
+                yield chunk
+            return
+        start = time.perf_counter_ns()
+        for offset, chunk in self.capture.chunks:
+            delay = (offset - (time.perf_counter_ns() - start)) / 1e9
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield chunk
+
+
+def replay_transport(
+    capture: Union[Capture, PathLike], *, realtime: bool = False
+) -> httpx.MockTransport:
+    """Transport answering every request with a recorded response.
+
+    Example:
+        ```python
+        transport = replay_transport("stream.mixsse")
+        mix = Mix(
+            server_url="http://replay.local",
+            client=httpx.Client(transport=transport),
+            async_client=httpx.AsyncClient(transport=transport),
+        )
+        for event in mix.streaming.stream_events(session_id="replay").result:
+            ...
+        ```
+
+    Args:
+        capture: A loaded capture or the path of a capture file
+        realtime: Reproduce the original chunk timing instead of replaying as
+            fast as possible
+    """
+    if not isinstance(capture, Capture):
+        capture = load_capture(capture)
+    loaded = capture
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            loaded.status_code,
+            headers=loaded.headers,
+            stream=ReplayStream(loaded, realtime),
+        )
+
+    return httpx.MockTransport(handler)
@@ -1,6 +1,6 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
-from typing import Any, Optional, Type, TypeVar, overload
+from typing import Any, Optional, Type, TypeVar, Union, overload
 
 import httpx
 
@@ -12,21 +12,23 @@ T = TypeVar("T")
 
 @overload
 def unmarshal_json_response(
-    typ: Type[T], http_res: httpx.Response, body: Optional[str] = None
+    typ: Type[T], http_res: httpx.Response, body: Optional[Union[str, bytes]] = None
 ) -> T: ...
 
 
 @overload
 def unmarshal_json_response(
-    typ: Any, http_res: httpx.Response, body: Optional[str] = None
+    typ: Any, http_res: httpx.Response, body: Optional[Union[str, bytes]] = None
 ) -> Any: ...
 
 
 def unmarshal_json_response(
-    typ: Any, http_res: httpx.Response, body: Optional[str] = None
+    typ: Any, http_res: httpx.Response, body: Optional[Union[str, bytes]] = None
 ) -> Any:
     if body is None:
-        body = http_res.text
+        # JSON is parsed straight from the raw bytes; decoding to text is left
+        # to error reporting.
+        body = http_res.content
     try:
         return unmarshal_json(body, typ)
     except Exception as e:
@@ -0,0 +1,58 @@
+"""Building validators ahead of first use.
+
+Model schemas are built on first validation rather than at import, so the
+first response or event of each type pays for it: a few milliseconds for most
+types, and tens of milliseconds for the event stream union. :func:`warm_up`
+does that work up front, optionally on a background thread that overlaps with
+the rest of start-up.
+"""
+
+import threading
+from typing import Any, Iterable, List, Optional
+
+from .serializers import _wrapper_model
+
+
+def default_types() -> List[Any]:
+    """The types warmed when none are given: events, sessions and messages."""
+    # pylint: disable=import-outside-toplevel
+    from mix_python_sdk import errors, models
+
+    return [
+        models.SSEEventStream,
+        models.SessionData,
+        List[models.SessionData],
+        List[models.BackendMessage],
+        models.SendMessageResponse,
+        errors.ErrorResponseData,
+    ]
+
+
+def warm_up(
+    types: Optional[Iterable[Any]] = None,
+    *,
+    background: bool = False,
+) -> Optional[threading.Thread]:
+    """Build the validators used to decode ``types``.
+
+    Args:
+        types: Response models or type annotations, as passed to
+            ``unmarshal_json``; defaults to :func:`default_types`
+        background: Build on a daemon thread and return it instead of blocking
+
+    Returns:
+        The thread doing the work when ``background`` is set, otherwise None
+    """
+    if not background:
+        _build(types)
+        return None
+    thread = threading.Thread(
+        target=_build, args=(types,), name="mix-warm-up", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def _build(types: Optional[Iterable[Any]]) -> None:
+    for typ in default_types() if types is None else types:
+        _wrapper_model("Unmarshaller", typ)
@@ -0,0 +1,23 @@
+import pytest
+
+from mix_python_sdk.fakeserver import FakeMixServer
+
+
+@pytest.fixture
+def fake():
+    """A fake server whose turns stream their events without delay."""
+    with FakeMixServer(
+        first_token_latency=0, tokens_per_second=0, response_tokens=5, seed=1
+    ) as server:
+        yield server
+
+
+@pytest.fixture
+def mix(fake):
+    with fake.mix() as client:
+        yield client
+
+
+@pytest.fixture
+def session(mix):
+    return mix.sessions.create(browser_mode="local-browser-service", title="test")
@@ -0,0 +1,188 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mix_python_sdk import Mix, errors
+from mix_python_sdk.endpoints import EndpointRouter
+from mix_python_sdk.fakeserver import FakeMixServer
+
+_GET_SESSION = "GET /api/sessions/{id}"
+
+
+@pytest.fixture
+def servers():
+    # The router prefers the faster server, so lookups try ``a`` first.
+    with FakeMixServer() as a, FakeMixServer(latency=0.02) as b:
+        yield {"a": a, "b": b}
+
+
+def _mix(servers, *urls, owned=None, missed=None):
+    """A Mix routed across ``servers`` by host.
+
+    ``owned`` maps a host to the permission and notification IDs it knows; when
+    given, the other hosts answer those requests with 404 and append the host
+    and path to ``missed``.
+    """
+    handlers = {host: fake.transport().handler for host, fake in servers.items()}
+
+    def handle(request):
+        handler = handlers.get(request.url.host)
+        if handler is None:
+            raise httpx.ConnectError("connection refused", request=request)
+        parts = request.url.path.split("/")
+        if (
+            owned is not None
+            and parts[2] in ("permissions", "notifications")
+            and parts[3] not in owned.get(request.url.host, ())
+        ):
+            missed.append((request.url.host, request.url.path))
+            error = {"code": 404, "message": "not found", "type": "not_found"}
+            return httpx.Response(404, json={"error": error})
+        return handler(request)
+
+    transport = httpx.MockTransport(handle)
+    mix = Mix(
+        server_url=EndpointRouter(urls, probe_interval=3600),
+        client=httpx.Client(transport=transport),
+        async_client=httpx.AsyncClient(transport=transport),
+    )
+    # Measure every server before the first request, not in the background.
+    mix.endpoints.probe(mix)
+    return mix
+
+
+def _create(mix):
+    return mix.sessions.create(browser_mode="local-browser-service", title="test")
+
+
+def test_requests_fail_over_when_a_server_is_unreachable(servers):
+    with _mix(servers, "http://down", "http://a") as mix:
+        session = _create(mix)
+
+        assert mix.endpoints.endpoint_for(session.id) == "http://a"
+        assert mix.sessions.get(id=session.id).id == session.id
+        assert not mix.endpoints.stats()[0].healthy
+
+
+def test_sessions_stay_on_the_server_that_created_them(servers):
+    with _mix(servers, "http://a", "http://b") as mix:
+        session = _create(mix)
+        for _ in range(3):
+            mix.sessions.get(id=session.id)
+        mix.messages.send(id=session.id, text="hello")
+        pinned = mix.endpoints.endpoint_for(session.id)
+
+    assert pinned in ("http://a", "http://b")
+    owner = servers[pinned[len("http://") :]]
+    other = servers["b" if owner is servers["a"] else "a"]
+    assert owner.stats().requests[_GET_SESSION] == 3
+    assert _GET_SESSION not in other.stats().requests
+
+
+def test_unknown_sessions_are_searched_past_404_and_pinned(servers):
+    with servers["b"].mix() as direct:
+        session = _create(direct)
+
+    with _mix(servers, "http://a", "http://b") as mix:
+        for _ in range(3):
+            assert mix.sessions.get(id=session.id).id == session.id
+        pinned = mix.endpoints.endpoint_for(session.id)
+
+    assert pinned == "http://b"
+    assert servers["a"].stats().requests[_GET_SESSION] == 1
+    assert servers["b"].stats().requests[_GET_SESSION] == 3
+
+
+def test_unknown_sessions_are_searched_past_404_async(servers):
+    with servers["b"].mix() as direct:
+        session = _create(direct)
+
+    async def run():
+        async with _mix(servers, "http://a", "http://b") as mix:
+            found = await mix.sessions.get_async(id=session.id)
+            return found, mix.endpoints.endpoint_for(session.id)
+
+    found, pinned = asyncio.run(run())
+
+    assert found.id == session.id
+    assert pinned == "http://b"
+
+
+def test_sessions_missing_everywhere_raise_and_stay_unpinned(servers):
+    with _mix(servers, "http://a", "http://b") as mix:
+        with pytest.raises(errors.ErrorResponse) as raised:
+            mix.sessions.get(id="missing")
+        pinned = mix.endpoints.endpoint_for("missing")
+
+    assert raised.value.status_code == 404
+    assert pinned is None
+    assert servers["a"].stats().requests[_GET_SESSION] == 1
+    assert servers["b"].stats().requests[_GET_SESSION] == 1
+
+
+def _answers(fake):
+    requests = fake.stats().requests
+    return {key: n for key, n in requests.items() if "/{id}/" in key}
+
+
+def test_permission_answers_find_the_server_that_asked(servers):
+    with servers["b"].mix() as direct:
+        session = _create(direct)
+
+    missed = []
+    owned = {"b": {"perm-1"}}
+    with _mix(servers, "http://a", "http://b", owned=owned, missed=missed) as mix:
+        mix.endpoints.pin(session.id, "http://b")
+        mix.permissions.grant(id="perm-1")
+        mix.permissions.deny(id="perm-1")
+        mix.notifications.respond_to_notification(id="perm-1", type_="acknowledge")
+        assert mix.endpoints.endpoint_for("perm-1") is None
+        with pytest.raises(errors.ErrorResponse) as raised:
+            mix.permissions.grant(id="perm-2")
+
+    assert raised.value.status_code == 404
+    # The faster server is asked first, answers 404, and is passed over.
+    assert missed == [
+        ("a", "/api/permissions/perm-1/grant"),
+        ("a", "/api/permissions/perm-1/deny"),
+        ("a", "/api/notifications/perm-1/respond"),
+        ("a", "/api/permissions/perm-2/grant"),
+        ("b", "/api/permissions/perm-2/grant"),
+    ]
+    expected = {
+        "POST /api/permissions/{id}/grant": 1,
+        "POST /api/permissions/{id}/deny": 1,
+        "POST /api/notifications/{id}/respond": 1,
+    }
+    assert _answers(servers["a"]) == {}
+    assert _answers(servers["b"]) == expected
+
+
+def test_permission_answers_find_the_server_that_asked_async(servers):
+    missed = []
+    owned = {"b": {"perm-1"}}
+
+    async def run():
+        mix = _mix(servers, "http://a", "http://b", owned=owned, missed=missed)
+        async with mix:
+            return await mix.permissions.grant_async(id="perm-1")
+
+    asyncio.run(run())
+
+    assert missed == [("a", "/api/permissions/perm-1/grant")]
+    assert _answers(servers["b"]) == {"POST /api/permissions/{id}/grant": 1}
+
+
+def test_token_refreshes_reach_every_server(servers):
+    refresh = "POST /internal/auth/refresh-tokens"
+    with _mix(servers, "http://a", "http://down", "http://b") as mix:
+        mix.authentication.refresh_o_auth_tokens()
+
+        async def run():
+            await mix.authentication.refresh_o_auth_tokens_async()
+
+        asyncio.run(run())
+
+    assert servers["a"].stats().requests[refresh] == 2
+    assert servers["b"].stats().requests[refresh] == 2
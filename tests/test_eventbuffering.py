@@ -0,0 +1,174 @@
+import asyncio
+
+import pytest
+
+from mix_python_sdk.errors import StreamOverflowError
+from mix_python_sdk.models import SSEContentEvent, SSEHeartbeatEvent
+from mix_python_sdk.utils.eventbuffering import BufferedEventStreamAsync
+
+
+def _content(event_id, text, message="msg-1"):
+    return SSEContentEvent.model_validate(
+        {
+            "event": "content",
+            "id": str(event_id),
+            "data": {"content": text, "type": "content", "assistantMessageId": message},
+        }
+    )
+
+
+def _heartbeat(event_id):
+    return SSEHeartbeatEvent.model_validate(
+        {"event": "heartbeat", "id": str(event_id), "data": {"type": "heartbeat"}}
+    )
+
+
+class _Source:
+    """An event stream that records how far it was read and whether it closed."""
+
+    def __init__(self, events, error=None):
+        self.events = events
+        self.error = error
+        self.read = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        for event in self.events:
+            self.read += 1
+            yield event
+        if self.error is not None:
+            raise self.error
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.closed = True
+
+
+async def _fill(buffered, source):
+    # Let the reader run until it stops making progress.
+    read = -1
+    while read != source.read:
+        read = source.read
+        await asyncio.sleep(0.01)
+
+
+async def _drain(buffered):
+    return [event async for event in buffered]
+
+
+def test_block_holds_reading_until_the_consumer_catches_up():
+    source = _Source([_content(i, str(i)) for i in range(5)])
+
+    async def run():
+        async with BufferedEventStreamAsync(source, max_size=2) as buffered:
+            await _fill(buffered, source)
+            depth, read = buffered.queue_depth, source.read
+            return depth, read, await _drain(buffered), buffered.stats
+
+    depth, read, events, stats = asyncio.run(run())
+
+    assert depth == 2 and read == 3
+    assert [event.data.content for event in events] == ["0", "1", "2", "3", "4"]
+    assert stats.high_water_mark == 2
+    assert stats.received == stats.delivered == 5
+    assert stats.blocked_seconds > 0
+    assert source.closed
+
+
+def test_drop_heartbeats_makes_room_for_other_events():
+    source = _Source(
+        [_heartbeat(1), _content(2, "a"), _heartbeat(3), _content(4, "b")]
+    )
+
+    async def run():
+        async with BufferedEventStreamAsync(
+            source, max_size=2, overflow="drop_heartbeats"
+        ) as buffered:
+            await _fill(buffered, source)
+            return await _drain(buffered), buffered.stats
+
+    events, stats = asyncio.run(run())
+
+    assert [event.id for event in events] == ["2", "4"]
+    assert stats.dropped_heartbeats == 2
+
+
+def test_merge_content_folds_deltas_of_the_same_message():
+    source = _Source(
+        [
+            _content(1, "Hel"),
+            _content(2, "lo"),
+            _content(3, "!"),
+            _content(4, "other", message="msg-2"),
+        ]
+    )
+
+    async def run():
+        async with BufferedEventStreamAsync(
+            source, max_size=1, overflow="merge_content"
+        ) as buffered:
+            await _fill(buffered, source)
+            return await _drain(buffered), buffered.stats
+
+    events, stats = asyncio.run(run())
+
+    assert [(event.id, event.data.content) for event in events] == [
+        ("3", "Hello!"),
+        ("4", "other"),
+    ]
+    assert stats.merged_deltas == 2
+
+
+def test_fail_ends_the_stream_and_closes_the_connection():
+    source = _Source([_content(i, str(i)) for i in range(3)])
+
+    async def run():
+        async with BufferedEventStreamAsync(
+            source, max_size=1, overflow="fail"
+        ) as buffered:
+            await _fill(buffered, source)
+            closed_before_reading = source.closed
+            with pytest.raises(StreamOverflowError):
+                await _drain(buffered)
+            return closed_before_reading
+
+    assert asyncio.run(run())
+
+
+def test_buffered_events_are_delivered_before_the_end_or_error():
+    source = _Source([_content(1, "a"), _content(2, "b")], ConnectionError("lost"))
+
+    async def run():
+        async with BufferedEventStreamAsync(source, max_size=8) as buffered:
+            await _fill(buffered, source)
+            events = [await buffered.__anext__(), await buffered.__anext__()]
+            with pytest.raises(ConnectionError):
+                await buffered.__anext__()
+            with pytest.raises(StopAsyncIteration):
+                await buffered.__anext__()
+            return events
+
+    assert [event.id for event in asyncio.run(run())] == ["1", "2"]
+
+
+def test_aclose_stops_a_blocked_reader_and_keeps_what_was_read():
+    source = _Source([_content(i, str(i)) for i in range(10)])
+
+    async def run():
+        buffered = BufferedEventStreamAsync(source, max_size=2)
+        async with buffered:
+            await _fill(buffered, source)
+            reader = buffered._reader  # pylint: disable=protected-access
+        return reader, await _drain(buffered)
+
+    reader, events = asyncio.run(run())
+
+    assert reader.cancelled()
+    assert source.closed and source.read == 3
+    assert [event.id for event in events] == ["0", "1"]
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError):
+        BufferedEventStreamAsync(_Source([]), max_size=0)
+    with pytest.raises(ValueError):
+        BufferedEventStreamAsync(_Source([]), overflow="spill")
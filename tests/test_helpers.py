@@ -0,0 +1,213 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+
+from mix_python_sdk import Mix
+from mix_python_sdk.helpers import EventType, StreamEvent, query, query_many
+from mix_python_sdk.permission_policy import PermissionPolicy, PermissionRule
+
+
+def test_event_types_format_as_their_values():
+    assert str(EventType.CONTENT) == "content"
+    assert f"{EventType.CONTENT}" == "content"
+    assert "{:>8}".format(EventType.CONTENT) == " content"
+
+
+def test_known_event_types_become_members():
+    event = StreamEvent("content", SimpleNamespace(content="hi"))
+
+    assert event.type is EventType.CONTENT
+    assert event.content == "hi"
+
+
+def test_unknown_event_types_are_kept_as_strings():
+    event = StreamEvent("future_event", SimpleNamespace())
+
+    assert event.type == "future_event"
+    assert not isinstance(event.type, EventType)
+    assert repr(event).startswith("StreamEvent(type='future_event'")
+
+
+def _sse(event_id, name, data):
+    return f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class _PermissionStream(httpx.AsyncByteStream):
+    """Asks for a permission and only completes the turn once it is granted."""
+
+    def __init__(self, granted):
+        self.granted = granted
+
+    async def __aiter__(self):
+        request = {
+            "id": "perm-1",
+            "sessionId": "s1",
+            "toolName": "bash",
+            "action": "execute",
+            "description": "run",
+            "type": "permission",
+        }
+        yield _sse(1, "permission", request)
+        await asyncio.wait_for(self.granted.wait(), 5)
+        yield _sse(2, "complete", {"done": True, "type": "complete"})
+        await asyncio.sleep(30)
+
+
+def _permission_mix():
+    granted = asyncio.Event()
+
+    def handle(request):
+        path = request.url.path
+        if path == "/stream":
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                stream=_PermissionStream(granted),
+            )
+        if path.endswith("/grant"):
+            granted.set()
+            return httpx.Response(200, json={})
+        if path.endswith("/messages"):
+            return httpx.Response(202, json={"sessionId": "s1", "status": "ok"})
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handle)
+    mix = Mix(
+        server_url="http://mix.fake",
+        async_client=httpx.AsyncClient(transport=transport),
+    )
+    return mix, granted
+
+
+def test_query_answers_permissions_while_the_consumer_is_busy():
+    async def run():
+        mix, granted = _permission_mix()
+        policy = PermissionPolicy(mix, [PermissionRule("grant", tool="bash")])
+        types = []
+        answered_early = False
+        async for event in query(mix, "s1", "hi", permission_policy=policy):
+            types.append(str(event.type))
+            if event.type == "permission":
+                await asyncio.sleep(0.2)
+                answered_early = granted.is_set()
+        return types, answered_early, policy
+
+    types, answered_early, policy = asyncio.run(run())
+
+    assert types == ["permission", "complete"]
+    assert answered_early
+    assert policy.audit[-1].decision == "grant"
+
+
+def test_query_many_answers_permissions_while_the_consumer_is_busy():
+    async def run():
+        mix, granted = _permission_mix()
+        policy = PermissionPolicy(mix, [PermissionRule("grant", tool="bash")])
+        batch = query_many(
+            mix, [("s1", "hi")], permission_policy=policy, track_usage=False
+        )
+        answered_early = False
+        async for item in batch:
+            if item.event is not None and item.event.type == "permission":
+                await asyncio.sleep(0.2)
+                answered_early = granted.is_set()
+        return batch.results[0], answered_early
+
+    result, answered_early = asyncio.run(run())
+
+    assert result.ok
+    assert answered_early
+
+
+def test_query_with_a_policy_stops_reading_when_closed_early():
+    async def run():
+        mix, _ = _permission_mix()
+        policy = PermissionPolicy(mix, [PermissionRule("grant", tool="bash")])
+        events = query(mix, "s1", "hi", permission_policy=policy)
+        async for _ in events:
+            break
+        await events.aclose()
+        current = asyncio.current_task()
+        return [task for task in asyncio.all_tasks() if task is not current]
+
+    assert asyncio.run(run()) == []
+
+
+def _slowed(fake, slow_session_id):
+    """A Mix client whose sends to ``slow_session_id`` never get an answer."""
+    handler = fake.transport().handler
+
+    async def handle(request):
+        if request.url.path == f"/api/sessions/{slow_session_id}/messages":
+            await asyncio.sleep(30)
+        return handler(request)
+
+    transport = httpx.MockTransport(handle)
+    return Mix(
+        server_url="http://mix.fake",
+        async_client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def test_query_many_keeps_going_when_turns_fail(fake, mix):
+    sessions = [
+        mix.sessions.create(browser_mode="local-browser-service", title=str(i))
+        for i in range(4)
+    ]
+    slow, first, second, third = [s.id for s in sessions]
+    turns = [
+        (slow, "never answered"),
+        (first, "one"),
+        ("missing", "nobody home"),
+        (second, "one two"),
+        (third, "one two three"),
+    ]
+
+    async def run():
+        batch = query_many(_slowed(fake, slow), turns, concurrency=5, timeout=2)
+        finished = [item.session_id async for item in batch if item.result]
+        return batch, finished
+
+    batch, finished = asyncio.run(run())
+
+    # The slow turn times out last, but results keep the order of the turns.
+    assert finished[-1] == slow
+    assert [(r.session_id, r.message) for r in batch.results] == turns
+    assert [r.ok for r in batch.results] == [False, True, False, True, True]
+    assert batch.failed == [batch.results[0], batch.results[2]]
+    assert isinstance(batch.results[0].error, TimeoutError)
+
+    # Usage is what sessions.get reports before and after each turn: the fake
+    # counts one prompt token per word and streams five completion tokens.
+    prompt_tokens = [r.usage.prompt_tokens for r in batch.results[1:] if r.ok]
+    assert prompt_tokens == [1, 2, 3]
+    assert {r.usage.completion_tokens for r in batch.results[1:] if r.ok} == {5}
+    assert batch.results[2].usage is None
+    assert batch.usage.prompt_tokens == 6
+    assert batch.usage.completion_tokens == 15
+    assert batch.usage.cost == sum(r.usage.cost for r in batch.results if r.usage)
+    # Two reads per turn, except the missing session's failed first read.
+    assert fake.stats().requests["GET /api/sessions/{id}"] == 2 * 4 + 1
+
+
+def test_query_many_only_runs_concurrency_turns_at_a_time(fake, mix):
+    sessions = [
+        mix.sessions.create(browser_mode="local-browser-service", title=str(i))
+        for i in range(8)
+    ]
+    turns = [(s.id, "hi") for s in sessions]
+
+    async def run():
+        batch = query_many(fake.mix(), turns, concurrency=2, track_usage=False)
+        most = 0
+        async for _ in batch:
+            most = max(most, len(asyncio.all_tasks()))
+        return batch, most
+
+    batch, most = asyncio.run(run())
+
+    assert all(result.ok for result in batch.results)
+    # This task, plus a worker and its send and receive tasks for each slot.
+    assert most <= 1 + 2 * 3
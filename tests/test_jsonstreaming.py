@@ -0,0 +1,166 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from mix_python_sdk import Mix
+from mix_python_sdk.utils.jsonstreaming import UTF8_BOM, JSONArrayScanner
+
+_DOCUMENT = json.dumps(
+    {
+        "id": "s-1",
+        "title": 'Quotes " and braces } ] { [ and \\\\ in a string',
+        "empty": [],
+        "nothing": None,
+        "messages": [
+            {"id": "m-1", "content": "a \"quoted\" } value", "tags": []},
+            {"id": "m-2", "nested": {"deep": [1, [2, {"x": None}]]}},
+            "escaped \\u00e9 \\\" string",
+            None,
+            12.5e-3,
+            [],
+        ],
+        "usage": {"tokens": [1, 2, 3], "cost": 0.25},
+    }
+).encode()
+
+
+def _scan(document, chunks, array_key="messages", expected=None):
+    scanner = JSONArrayScanner(array_key)
+    items, metadata = [], {}
+    for chunk in chunks:
+        for key, raw in scanner.feed(chunk):
+            if key is None:
+                items.append(json.loads(raw))
+            else:
+                metadata[key] = json.loads(raw)
+    scanner.close()
+    if expected is None:
+        expected = json.loads(document)
+        expected_items = expected.pop(array_key)
+    else:
+        expected_items, expected = expected
+    assert items == expected_items
+    assert metadata == expected
+
+
+def test_whole_document():
+    _scan(_DOCUMENT, [_DOCUMENT])
+
+
+def test_document_split_at_every_offset():
+    for i in range(len(_DOCUMENT) + 1):
+        _scan(_DOCUMENT, [_DOCUMENT[:i], _DOCUMENT[i:]])
+
+
+def test_document_fed_byte_by_byte():
+    _scan(_DOCUMENT, [_DOCUMENT[i : i + 1] for i in range(len(_DOCUMENT))])
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"messages": []}',
+        b'{"messages": [], "id": "s-1"}',
+        b' \n{ "id" : "s-1" , "messages" : [ 1 , 2 ] }\n',
+    ],
+)
+def test_edge_cases(document):
+    for i in range(len(document) + 1):
+        _scan(document, [document[:i], document[i:]])
+
+
+@pytest.mark.parametrize(
+    "document, metadata",
+    [(b"{}", {}), (b'{"messages": null}', {"messages": None})],
+)
+def test_missing_or_null_array_has_no_items(document, metadata):
+    _scan(document, [document], expected=([], metadata))
+
+
+def test_leading_bom_is_skipped():
+    _scan(_DOCUMENT, [UTF8_BOM + _DOCUMENT[:5], _DOCUMENT[5:]])
+
+
+def test_nested_array_with_the_same_key_is_not_the_array():
+    document = b'{"meta": {"messages": [1]}, "messages": [2]}'
+    _scan(document, [document])
+
+
+def test_truncated_document_raises():
+    scanner = JSONArrayScanner("messages")
+    scanner.feed(_DOCUMENT[:-1])
+    with pytest.raises(ValueError):
+        scanner.close()
+
+
+def test_non_object_document_raises():
+    with pytest.raises(ValueError):
+        JSONArrayScanner("messages").feed(b"[1, 2]")
+
+
+def _export_mix(chunks):
+    class Body(httpx.SyncByteStream, httpx.AsyncByteStream):
+        def __iter__(self):
+            yield from chunks
+
+        async def __aiter__(self):
+            for chunk in chunks:
+                yield chunk
+
+    def handle(request):
+        return httpx.Response(
+            200, headers={"content-type": "application/json"}, stream=Body()
+        )
+
+    transport = httpx.MockTransport(handle)
+    return Mix(
+        server_url="http://mix.fake",
+        client=httpx.Client(transport=transport),
+        async_client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def _message(number):
+    return {
+        "id": f"m-{number}",
+        "role": "assistant",
+        "content": f"reply {number} with \"quotes\" and {{braces}}",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+    }
+
+
+_EXPORT = json.dumps(
+    {"id": "s-1", "messages": [_message(1), _message(2)], "title": "Export"}
+).encode()
+_EXPORT_CHUNKS = [_EXPORT[i : i + 7] for i in range(0, len(_EXPORT), 7)]
+
+
+def test_export_session_stream():
+    with _export_mix(_EXPORT_CHUNKS) as mix:
+        res = mix.sessions.export_session_stream(id="s-1")
+        with res.result as messages:
+            first = next(messages)
+            # Members sent before the array are known once it is reached.
+            assert res.result.metadata == {"id": "s-1"}
+            contents = [first.content] + [message.content for message in messages]
+        metadata = res.result.metadata
+
+    assert contents == [_message(1)["content"], _message(2)["content"]]
+    assert metadata == {"id": "s-1", "title": "Export"}
+
+
+def test_export_session_stream_async():
+    async def run():
+        async with _export_mix(_EXPORT_CHUNKS) as mix:
+            res = await mix.sessions.export_session_stream_async(id="s-1")
+            async with res.result as messages:
+                ids = [message.id async for message in messages]
+            return ids, res.result.metadata
+
+    ids, metadata = asyncio.run(run())
+
+    assert ids == ["m-1", "m-2"]
+    assert metadata == {"id": "s-1", "title": "Export"}
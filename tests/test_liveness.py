@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from mix_python_sdk import Mix
+from mix_python_sdk.errors import StreamStalledError
+from mix_python_sdk.fakeserver import FakeMixServer
+from mix_python_sdk.utils.liveness import (
+    StreamLiveness,
+    watch_chunks,
+    watch_chunks_async,
+)
+from mix_python_sdk.utils.ssecapture import load_capture
+
+
+def _stream_path(mix):
+    session = mix.sessions.create(browser_mode="local-browser-service", title="test")
+    return f"/stream?sessionId={session.id}"
+
+
+def test_watch_chunks_raises_when_the_socket_goes_silent():
+    with FakeMixServer(heartbeat_interval=60) as fake, fake.mix() as mix:
+        url = fake.serve() + _stream_path(mix)
+        liveness = StreamLiveness(heartbeat_interval=0.1, max_missed_heartbeats=2)
+        started = time.monotonic()
+        with httpx.Client() as client, client.stream("GET", url) as response:
+            chunks = []
+            with pytest.raises(StreamStalledError):
+                for chunk in watch_chunks(response, liveness):
+                    chunks.append(chunk)
+
+    assert b"event: connected" in b"".join(chunks)
+    assert liveness.stalls == 1
+    assert time.monotonic() - started < 5
+
+
+def test_watch_chunks_is_kept_alive_by_heartbeats_and_slow_consumers():
+    with FakeMixServer(heartbeat_interval=0.05) as fake, fake.mix() as mix:
+        url = fake.serve() + _stream_path(mix)
+        liveness = StreamLiveness(heartbeat_interval=0.1, max_missed_heartbeats=2)
+        deadline = time.monotonic() + 0.6
+        with httpx.Client() as client, client.stream("GET", url) as response:
+            for _ in watch_chunks(response, liveness):
+                # Time spent here, away from the socket, is not a stall.
+                time.sleep(0.25)
+                if time.monotonic() > deadline:
+                    break
+
+    assert liveness.stalls == 0
+
+
+def test_watch_chunks_async_raises_when_the_stream_goes_silent():
+    async def run(fake, path, liveness):
+        chunks = []
+        async with httpx.AsyncClient(
+            transport=fake.transport(), base_url="http://mix.fake"
+        ) as client:
+            async with client.stream("GET", path) as response:
+                with pytest.raises(StreamStalledError):
+                    async for chunk in watch_chunks_async(response, liveness):
+                        chunks.append(chunk)
+        return chunks
+
+    with FakeMixServer(heartbeat_interval=60) as fake, fake.mix() as mix:
+        liveness = StreamLiveness(heartbeat_interval=0.1, max_missed_heartbeats=2)
+        chunks = asyncio.run(run(fake, _stream_path(mix), liveness))
+
+    assert b"event: connected" in b"".join(chunks)
+    assert liveness.stalls == 1
+
+
+def _connections(path):
+    capture = load_capture(path)
+    return b"".join(chunk for _, chunk in capture.chunks).count(b"event: connected")
+
+
+def test_capture_continues_across_reconnects(tmp_path):
+    path = tmp_path / "stream.mixsse"
+    with FakeMixServer(heartbeat_interval=60) as fake:
+        with Mix(server_url=fake.serve()) as mix:
+            session = mix.sessions.create(
+                browser_mode="local-browser-service", title="test"
+            )
+            res = mix.streaming.stream_events(session_id=session.id, capture=path)
+            events = res.result.monitor(
+                0.1, max_missed_heartbeats=2, on_stall="reconnect"
+            )
+            with events:
+                # Each connection sends ``connected``, then stalls.
+                for event in events:
+                    if events.liveness.reconnects == 2:
+                        break
+
+    assert _connections(path) == 3
+
+
+def test_capture_continues_across_reconnects_async(tmp_path):
+    path = tmp_path / "stream.mixsse"
+
+    async def run(mix, session_id):
+        res = await mix.streaming.stream_events_async(
+            session_id=session_id, capture=path
+        )
+        events = res.result.monitor(0.1, max_missed_heartbeats=2, on_stall="reconnect")
+        async with events:
+            async for event in events:
+                if events.liveness.reconnects == 2:
+                    break
+
+    with FakeMixServer(heartbeat_interval=60) as fake, fake.mix() as mix:
+        session = mix.sessions.create(browser_mode="local-browser-service", title="t")
+        asyncio.run(run(mix, session.id))
+
+    assert _connections(path) == 3
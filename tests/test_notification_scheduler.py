@@ -0,0 +1,85 @@
+import asyncio
+import json
+import time
+
+import httpx
+
+from mix_python_sdk import Mix
+from mix_python_sdk.models import SSENotificationEvent
+from mix_python_sdk.notification_scheduler import NotificationScheduler
+
+
+def _recording_mix(fake, sent):
+    inner = fake.transport()
+
+    async def handle(request):
+        if request.url.path.endswith("/respond"):
+            sent.append((time.time(), request.url.path, json.loads(request.content)))
+        return await inner.handle_async_request(request)
+
+    return Mix(
+        server_url="http://mix.fake",
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+    )
+
+
+def _notification(notification_id, timeout, **data):
+    return SSENotificationEvent.model_validate(
+        {
+            "event": "notification",
+            "id": "1",
+            "data": {
+                "id": notification_id,
+                "sessionId": "session-1",
+                "createdAt": int(time.time() * 1000),
+                "timeout": timeout,
+                "title": "Continue?",
+                "message": "The build failed",
+                "notificationType": "question",
+                "type": "notification",
+                **data,
+            },
+        }
+    )
+
+
+def test_default_is_sent_before_expiry(fake):
+    sent = []
+    event = _notification("n-1", 1, responseType="choice", choices=["retry", "skip"])
+
+    async def run():
+        async with _recording_mix(fake, sent) as mix, NotificationScheduler(
+            mix, margin=0.7, default_choice="skip"
+        ) as scheduler:
+            pending = scheduler.feed(event)
+            await asyncio.sleep(0.6)
+            await scheduler.flush()
+            return pending, scheduler.stats
+
+    pending, stats = asyncio.run(run())
+
+    assert [(path, body) for _, path, body in sent] == [
+        ("/api/notifications/n-1/respond", {"type": "choice", "value": "skip"})
+    ]
+    assert sent[0][0] < pending.expires_at
+    assert stats.defaulted == 1 and stats.sent == 1 and stats.pending == 0
+
+
+def test_answered_notifications_are_not_defaulted(fake):
+    sent = []
+    event = _notification("n-1", 1, responseType="text")
+
+    async def run():
+        async with _recording_mix(fake, sent) as mix, NotificationScheduler(
+            mix, margin=0.7
+        ) as scheduler:
+            scheduler.feed(event)
+            assert scheduler.respond("n-1", "text", "done")
+            assert not scheduler.respond("n-1", "text", "again")
+            await asyncio.sleep(0.6)
+            return scheduler.stats
+
+    stats = asyncio.run(run())
+
+    assert [body for _, _, body in sent] == [{"type": "text", "value": "done"}]
+    assert stats.answered == 1 and stats.defaulted == 0
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from mix_python_sdk.utils.partialjson import PartialJSONParser
+
+_DOCUMENTS = [
+    r'{"command": "ls -la", "timeout": 5000}',
+    r'{"text": "quote \" backslash \\ slash \/ controls \b\f\n\r\t"}',
+    r'{"unicode": "caf\u00e9 \u4e2d", "emoji": "\ud83d\ude00 \uD83D\uDE00"}',
+    r'{"lone": ["\ud800", "\udc00", "\ud800x", "\ud800A"]}',
+    r'{"raw": "caf' + "é \U0001f600" + r'"}',
+    r'[0, -1, 12.5, -0.5e-3, 6.02E+23, 1234567890123456789, true, false, null]',
+    r'{"nested": {"a": [1, {"b": [[], {}]}], "c": {"d": null}}, "e": []}',
+    ' \n\t{ "spaced" :\r\n [ 1 , "two" , { } ] } \n',
+    r'"just a string"',
+    r'-42.5e1',
+    r'[]',
+    r'{}',
+]
+
+
+def _parse(chunks):
+    parser = PartialJSONParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        # Reading the partial value never fails.
+        parser.value  # pylint: disable=pointless-statement
+    return parser.close()
+
+
+@pytest.mark.parametrize("document", _DOCUMENTS)
+def test_split_at_every_offset(document):
+    expected = json.loads(document)
+    for i in range(len(document) + 1):
+        assert _parse([document[:i], document[i:]]) == expected, i
+
+
+@pytest.mark.parametrize("document", _DOCUMENTS)
+def test_fed_character_by_character(document):
+    assert _parse(list(document)) == json.loads(document)
+
+
+def test_partial_values_grow_as_fragments_arrive():
+    parser = PartialJSONParser()
+    parser.feed('{"command": "ls -')
+    assert parser.value == {"command": "ls -"}
+    parser.feed('la", "timeout": 12')
+    # The number might continue, so it is not shown yet.
+    assert parser.value == {"command": "ls -la"}
+    parser.feed('3, "items": ["a", ')
+    assert parser.value == {"command": "ls -la", "timeout": 123, "items": ["a"]}
+    assert not parser.complete
+    parser.feed('"b"]}')
+    assert parser.complete
+    assert parser.close() == {"command": "ls -la", "timeout": 123, "items": ["a", "b"]}
+
+
+def test_partial_string_with_a_pending_escape():
+    parser = PartialJSONParser()
+    parser.feed(r'{"text": "caf\u00')
+    assert parser.value == {"text": "caf"}
+    parser.feed(r'e9 \ud83d')
+    parser.feed(r'\ude00"}')
+    assert parser.close() == {"text": "café \U0001f600"}
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"a" 1}',
+        '{"a": 1,}',
+        "[1,]",
+        "[1 2]",
+        '{"a": 1}}',
+        "{1: 2}",
+        '"bad \\q escape"',
+        "tru",
+        "nul",
+        "01",
+        "1.2.3",
+        "[-]",
+        '{"a": 1',
+        '"unterminated',
+        "",
+        "@",
+    ],
+)
+def test_malformed_input_raises(document):
+    with pytest.raises(ValueError):
+        json.loads(document)
+    for i in range(len(document) + 1):
+        with pytest.raises(ValueError):
+            _parse([document[:i], document[i:]])
+
+
+def test_error_is_reported_and_later_input_ignored():
+    parser = PartialJSONParser()
+    parser.feed("[1 2")
+    assert parser.error is not None
+    parser.feed("]")
+    with pytest.raises(ValueError, match="Expected"):
+        parser.close()
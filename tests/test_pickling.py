@@ -0,0 +1,76 @@
+import functools
+import pickle
+
+import httpx
+import pytest
+
+from mix_python_sdk import Mix
+from mix_python_sdk.endpoints import EndpointRouter
+from mix_python_sdk.threadclient import PerThreadClient
+
+_URL = "http://mix.fake"
+
+
+def _make_client():
+    return httpx.Client(headers={"X-Factory": "yes"})
+
+
+def _round_trip(mix):
+    with mix:
+        return pickle.loads(pickle.dumps(mix))
+
+
+def test_client_factories_are_pickled_as_they_are():
+    with _round_trip(Mix(server_url=_URL, client_factory=_make_client)) as copy:
+        restored = copy.sdk_configuration.client
+
+    assert restored.headers["X-Factory"] == "yes"
+
+
+def test_partial_client_factories_carry_their_settings():
+    factory = functools.partial(
+        httpx.Client, headers={"X-Team": "search"}, timeout=7, follow_redirects=True
+    )
+
+    with _round_trip(Mix(server_url=_URL, client_factory=factory)) as copy:
+        restored = copy.sdk_configuration.client
+
+    assert restored.headers["X-Team"] == "search"
+    assert restored.timeout == httpx.Timeout(7)
+    assert restored.follow_redirects
+
+
+def test_per_thread_clients_are_rebuilt_from_their_options():
+    client = PerThreadClient(8, connections_per_thread=2, timeout=7)
+
+    with _round_trip(Mix(server_url=_URL, client=client)) as copy:
+        restored = copy.sdk_configuration.client
+
+    assert isinstance(restored, PerThreadClient)
+    assert restored is not client
+    assert restored.max_connections == 8
+    assert restored.connections_per_thread == 2
+    assert restored.client_options["timeout"] == 7
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"client": httpx.Client()},
+        {"async_client": httpx.AsyncClient()},
+        {"client": httpx.Client(proxy="http://proxy.internal:3128")},
+    ],
+    ids=["client", "async_client", "proxy"],
+)
+def test_supplied_httpx_clients_are_refused(options):
+    with Mix(server_url=_URL, **options) as mix:
+        with pytest.raises(TypeError, match="client_factory"):
+            pickle.dumps(mix)
+
+
+def test_supplied_clients_are_refused_behind_an_endpoint_router():
+    router = EndpointRouter([_URL, "http://mix-b.fake"], probe_interval=3600)
+
+    with Mix(server_url=router, client=httpx.Client()) as mix:
+        with pytest.raises(TypeError, match="client_factory"):
+            pickle.dumps(mix)
@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+
+from mix_python_sdk import Mix
+from mix_python_sdk.utils.prefetching import Prefetcher
+
+
+def _counter(limit):
+    numbers = iter(range(limit))
+    return lambda: next(numbers)
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_reads_ahead_up_to_max_events():
+    prefetcher = Prefetcher(_counter(10), max_events=3, interrupt=lambda: None)
+    try:
+        _wait_for(lambda: prefetcher.buffered == 3)
+        assert [prefetcher.get() for _ in range(10)] == list(range(10))
+        with pytest.raises(StopIteration):
+            prefetcher.get()
+    finally:
+        prefetcher.close()
+
+
+def test_reraises_reader_errors_after_buffered_events():
+    events = iter([1, 2])
+
+    def pull():
+        for event in events:
+            return event
+        raise ConnectionError("dropped")
+
+    prefetcher = Prefetcher(pull, max_events=8, interrupt=lambda: None)
+    try:
+        assert prefetcher.get() == 1
+        assert prefetcher.get() == 2
+        with pytest.raises(ConnectionError):
+            prefetcher.get()
+        with pytest.raises(StopIteration):
+            prefetcher.get()
+    finally:
+        prefetcher.close()
+
+
+def test_close_interrupts_a_blocked_read():
+    release = threading.Event()
+
+    def pull():
+        release.wait()
+        raise ConnectionError("interrupted")
+
+    prefetcher = Prefetcher(pull, max_events=1, interrupt=release.set)
+    prefetcher.close()
+
+    assert release.is_set()
+    with pytest.raises(StopIteration):
+        prefetcher.get()
+
+
+def test_event_stream_prefetch(fake):
+    # Closing interrupts the reader through the socket, so serve over one.
+    with Mix(server_url=fake.serve()) as mix:
+        session = mix.sessions.create(
+            browser_mode="local-browser-service", title="test"
+        )
+        response = mix.streaming.stream_events(session_id=session.id)
+        mix.messages.send(id=session.id, text="hello")
+        names = []
+        with response.result.prefetch(max_events=2) as events:
+            for event in events:
+                names.append(event.event)
+                if event.event == "complete":
+                    break
+
+    assert names[0] == "connected"
+    assert names[-1] == "complete"
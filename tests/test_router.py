@@ -0,0 +1,158 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mix_python_sdk.helpers import send_with_callbacks
+from mix_python_sdk.router import EventRouter
+
+
+def _event(tag, **data):
+    return SimpleNamespace(event=tag, data=SimpleNamespace(**data))
+
+
+def _recorder(calls, name):
+    return lambda event: calls.append((name, event.event))
+
+
+def test_handlers_run_by_priority_then_registration_order():
+    router, calls = EventRouter(), []
+    router.on("content", _recorder(calls, "low"), priority=-1)
+    router.on("content", _recorder(calls, "first"))
+    router.on("content", _recorder(calls, "high"), priority=5)
+    router.on("content", _recorder(calls, "second"))
+
+    router.dispatch_sync(_event("content"))
+
+    assert [name for name, _ in calls] == ["high", "first", "second", "low"]
+
+
+def test_wildcard_handlers_merge_into_the_ordering():
+    router, calls = EventRouter(), []
+    router.on("content", _recorder(calls, "content"))
+    router.on("*", _recorder(calls, "all-first"), priority=1)
+    router.on("*", _recorder(calls, "all-last"), priority=-1)
+
+    router.dispatch_sync(_event("content"))
+    router.dispatch_sync(_event("thinking"))
+
+    assert calls == [
+        ("all-first", "content"),
+        ("content", "content"),
+        ("all-last", "content"),
+        ("all-first", "thinking"),
+        ("all-last", "thinking"),
+    ]
+
+
+def test_scoped_routes_only_see_their_subagent_or_message():
+    router, calls = EventRouter(), []
+    router.on("content", _recorder(calls, "unscoped"))
+    router.on("content", _recorder(calls, "tool-1"), parent_tool_call_id="tool-1")
+    router.on("*", _recorder(calls, "msg-1"), assistant_message_id="msg-1")
+
+    router.dispatch_sync(_event("content", parent_tool_call_id="tool-1"))
+    router.dispatch_sync(_event("content", parent_tool_call_id="tool-2"))
+    router.dispatch_sync(_event("thinking", assistant_message_id="msg-1"))
+
+    assert [name for name, _ in calls] == [
+        "unscoped",
+        "tool-1",
+        "unscoped",
+        "msg-1",
+    ]
+
+
+def test_a_route_cannot_be_scoped_twice():
+    with pytest.raises(ValueError):
+        EventRouter().on(
+            "content",
+            lambda event: None,
+            parent_tool_call_id="tool-1",
+            assistant_message_id="msg-1",
+        )
+
+
+def test_routes_added_or_removed_after_dispatch_take_effect():
+    router, calls = EventRouter(), []
+    first = router.on("content", _recorder(calls, "first"))
+    router.dispatch_sync(_event("content"))
+    router.on("*", _recorder(calls, "all"))
+    router.dispatch_sync(_event("content"))
+
+    assert router.remove(first)
+    assert not router.remove(first)
+    router.dispatch_sync(_event("content"))
+
+    assert [name for name, _ in calls] == ["first", "first", "all", "all"]
+
+
+def test_dispatch_awaits_async_handlers_in_order():
+    router, calls = EventRouter(), []
+
+    @router.route("content", priority=1)
+    async def slow(event):
+        await asyncio.sleep(0.01)
+        calls.append("async")
+
+    @router.route("content")
+    def fast(event):
+        calls.append("sync")
+
+    asyncio.run(router.dispatch(_event("content")))
+
+    assert calls == ["async", "sync"]
+
+
+def test_dispatch_sync_rejects_async_handlers():
+    router = EventRouter()
+
+    @router.route("content")
+    async def handler(event):
+        pass
+
+    with pytest.raises(TypeError, match="dispatch"):
+        router.dispatch_sync(_event("content"))
+
+
+def test_dispatch_sync_rejects_handlers_returning_awaitables():
+    router = EventRouter()
+
+    async def work():
+        pass
+
+    router.on("content", lambda event: work())
+
+    with pytest.raises(TypeError, match="awaitable"):
+        router.dispatch_sync(_event("content"))
+
+
+def test_send_with_callbacks_runs_callbacks_and_router_handlers(fake, mix, session):
+    fake.config.thinking_tokens = 2
+    fake.config.tool_calls = 1
+    fake.config.tool_duration = 0
+    router, calls = EventRouter(), []
+    router.on("*", lambda event: calls.append(event.event), priority=1)
+    text, thinking, tools = [], [], []
+
+    async def on_thinking(chunk):
+        thinking.append(chunk)
+
+    asyncio.run(
+        send_with_callbacks(
+            mix,
+            session.id,
+            "hello",
+            on_thinking=on_thinking,
+            on_content=text.append,
+            on_tool_execution_complete=tools.append,
+            on_complete=lambda: calls.append("done"),
+            router=router,
+        )
+    )
+
+    assert len(thinking) == 2
+    assert len(text) == 5
+    assert [tool.tool_name for tool in tools] == ["bash"]
+    # The router sees each event after the keyword callbacks.
+    assert calls[-2:] == ["done", "complete"]
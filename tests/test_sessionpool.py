@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from mix_python_sdk.sessionpool import SessionPool
+from mix_python_sdk.streamhub import StreamHub
+
+
+async def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.01)
+
+
+def test_start_warms_sessions_with_connected_streams(fake, mix):
+    async def run():
+        async with StreamHub(mix, idle_timeout=0) as hub:
+            async with SessionPool(mix, "pooled", size=2, hub=hub) as pool:
+                assert pool.available == 2
+                ready = list(pool._ready)  # pylint: disable=protected-access
+                assert all(hub.is_connected(session.id) for session in ready)
+
+                async with await pool.acquire() as session:
+                    assert session.id == ready[0].id
+                    text = await session.send("hello")
+                    # The acquired session is replaced in the background.
+                    await _wait_for(lambda: pool.available == 2)
+                return text
+
+    text = asyncio.run(run())
+
+    assert text
+    stats = fake.stats()
+    assert stats.requests["POST /api/sessions"] == 3
+    # A turn on a warm session reuses the connection opened by the pool.
+    assert stats.requests["GET /stream"] == 3
+
+
+def test_sessions_are_deleted_after_use_and_on_close(mix):
+    async def run():
+        async with StreamHub(mix, idle_timeout=0) as hub:
+            pool = SessionPool(mix, "pooled", size=2, hub=hub)
+            await pool.start()
+            async with await pool.acquire() as session:
+                used = session.id
+            remaining = mix.sessions.list()
+            await pool.aclose()
+            return used, remaining, hub
+
+    used, remaining, hub = asyncio.run(run())
+
+    assert used not in {session.id for session in remaining}
+    # Including the replacement the pool was creating when it was closed.
+    assert mix.sessions.list() == []
+    assert not hub.is_connected(used)
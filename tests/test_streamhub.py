@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from mix_python_sdk.errors import StreamOverflowError
+from mix_python_sdk.streamhub import StreamHub
+
+
+async def _names_until_complete(subscription):
+    names = []
+    async for event in subscription:
+        names.append(event.event)
+        if event.event == "complete":
+            break
+    return names
+
+
+def test_subscribers_share_one_connection(fake, mix, session):
+    async def run():
+        async with StreamHub(mix, idle_timeout=0) as hub:
+            first, second = hub.subscribe(session.id), hub.subscribe(session.id)
+            async with first, second:
+                assert first.new_connection and not second.new_connection
+                assert hub.subscriber_count(session.id) == 2
+                await mix.messages.send_async(id=session.id, text="hello")
+                return await asyncio.gather(
+                    _names_until_complete(first), _names_until_complete(second)
+                )
+
+    first, second = asyncio.run(run())
+
+    # The second subscriber may join after the ``connected`` event.
+    assert [name for name in first if name != "connected"] == [
+        name for name in second if name != "connected"
+    ]
+    assert second[-1] == "complete"
+    assert fake.stats().requests["GET /stream"] == 1
+
+
+def test_slow_subscriber_overflows_without_stalling_others(mix, session):
+    async def run():
+        async with StreamHub(mix, idle_timeout=0) as hub:
+            slow = hub.subscribe(session.id, queue_size=2)
+            async with slow, hub.subscribe(session.id) as fast:
+                await mix.messages.send_async(id=session.id, text="hello")
+                names = await _names_until_complete(fast)
+                received = []
+                with pytest.raises(StreamOverflowError):
+                    async for event in slow:
+                        received.append(event)
+                return names, received, hub.subscriber_count(session.id)
+
+    names, received, remaining = asyncio.run(run())
+
+    assert names[-1] == "complete"
+    assert len(received) == 2
+    assert remaining == 1
@@ -0,0 +1,297 @@
+import asyncio
+
+from mix_python_sdk.models import (
+    SSECompleteEvent,
+    SSEContentEvent,
+    SSEToolExecutionCompleteEvent,
+    SSEToolExecutionStartEvent,
+    SSEToolUseStartEvent,
+)
+from mix_python_sdk.subagents import SubagentDemux
+
+
+def _data(type_, parent, **fields):
+    data = {"type": type_, **fields}
+    if parent is not None:
+        data["parentToolCallId"] = parent
+    return data
+
+
+def _tool(call_id, name="task", parent=None):
+    return SSEToolUseStartEvent.model_validate(
+        {
+            "event": "tool_use_start",
+            "id": "1",
+            "data": _data("tool_use_start", parent, id=call_id, name=name),
+        }
+    )
+
+
+def _exec_start(call_id, parent=None):
+    return SSEToolExecutionStartEvent.model_validate(
+        {
+            "event": "tool_execution_start",
+            "id": "2",
+            "data": _data(
+                "tool_execution_start",
+                parent,
+                toolCallId=call_id,
+                toolName="task",
+                progress="running",
+            ),
+        }
+    )
+
+
+def _exec_complete(call_id, parent=None, success=True):
+    return SSEToolExecutionCompleteEvent.model_validate(
+        {
+            "event": "tool_execution_complete",
+            "id": "3",
+            "data": _data(
+                "tool_execution_complete",
+                parent,
+                toolCallId=call_id,
+                toolName="task",
+                progress="done",
+                success=success,
+            ),
+        }
+    )
+
+
+def _content(text, parent=None):
+    return SSEContentEvent.model_validate(
+        {
+            "event": "content",
+            "id": "4",
+            "data": _data("content", parent, content=text),
+        }
+    )
+
+
+def _complete(parent=None):
+    return SSECompleteEvent.model_validate(
+        {
+            "event": "complete",
+            "id": "5",
+            "data": _data("complete", parent, done=True),
+        }
+    )
+
+
+def _texts(iterator, close=True):
+    """Everything delivered to ``iterator``, as content texts or event tags."""
+
+    async def collect():
+        return [
+            event.data.content if event.event == "content" else event.event
+            async for event in iterator
+        ]
+
+    if close:
+        iterator.close()
+    return asyncio.run(collect())
+
+
+def _nested(demux):
+    """Feed a main agent running task t1, which runs task t2, which runs t3."""
+    demux.feed(_tool("t1"))
+    demux.feed(_exec_start("t1"))
+    demux.feed(_tool("t2", parent="t1"))
+    demux.feed(_exec_start("t2", parent="t1"))
+    demux.feed(_tool("t3", name="bash", parent="t2"))
+
+
+def test_tree_is_built_from_parent_tool_call_ids():
+    demux = SubagentDemux()
+    _nested(demux)
+
+    t1, t2, t3 = demux.get("t1"), demux.get("t2"), demux.get("t3")
+    assert list(demux.root.children) == ["t1"]
+    assert t1.parent is demux.root and list(t1.children) == ["t2"]
+    assert t2.parent is t1 and list(t2.children) == ["t3"]
+    assert t3.parent is t2 and not t3.children
+    assert (t1.depth, t2.depth, t3.depth) == (1, 2, 3)
+    assert t1.tool_name == "task" and t3.tool_name == "bash"
+    assert t1.started and t2.started and not t3.started
+
+    assert demux.feed(_content("main")) is demux.root
+    assert demux.feed(_content("deep", parent="t2")) is t2
+    demux.feed(_complete(parent="t2"))
+    assert t2.complete and not t1.complete
+
+
+def test_events_before_tool_use_start_are_reparented():
+    demux = SubagentDemux()
+    # Joined mid-stream: t2's events arrive before we see where it started.
+    early = demux.feed(_content("early", parent="t2"))
+    assert early.parent is demux.root
+    assert list(demux.root.children) == ["t2"]
+
+    _nested(demux)
+
+    t2 = demux.get("t2")
+    assert t2 is early
+    assert t2.parent is demux.get("t1")
+    assert list(demux.root.children) == ["t1"]
+    assert list(demux.get("t1").children) == ["t2"]
+
+
+def test_subtree_events_reach_ancestor_subscribers():
+    demux = SubagentDemux()
+    everything = demux.subscribe()
+    # Subscribed before t2 exists and before it is adopted by t1.
+    inner = demux.subscribe("t2")
+    _nested(demux)
+    outer = demux.subscribe("t1")
+    leaf = demux.subscribe("t3")
+
+    demux.feed(_content("main"))
+    demux.feed(_content("one", parent="t1"))
+    demux.feed(_content("two", parent="t2"))
+    demux.feed(_content("three", parent="t3"))
+
+    assert _texts(leaf) == ["three"]
+    assert _texts(inner) == ["tool_use_start", "two", "three"]
+    assert _texts(outer) == ["one", "two", "three"]
+    assert _texts(everything) == [
+        "tool_use_start",
+        "tool_execution_start",
+        "tool_use_start",
+        "tool_execution_start",
+        "tool_use_start",
+        "main",
+        "one",
+        "two",
+        "three",
+    ]
+
+
+def test_listener_cache_follows_subscriptions():
+    demux = SubagentDemux()
+    _nested(demux)
+    first = demux.subscribe("t1")
+    # Fill t3's cached listeners, then change the subscriptions under it.
+    demux.feed(_content("a", parent="t3"))
+    second = demux.subscribe("t2")
+    demux.feed(_content("b", parent="t3"))
+    first.close()
+    demux.feed(_content("c", parent="t3"))
+    third = demux.subscribe()
+    demux.feed(_content("d", parent="t3"))
+
+    assert _texts(first) == ["a", "b"]
+    assert _texts(second) == ["b", "c", "d"]
+    assert _texts(third) == ["d"]
+
+
+def test_listener_cache_follows_reparenting():
+    demux = SubagentDemux()
+    outer = demux.subscribe("t1")
+    demux.feed(_tool("t1"))
+    demux.feed(_content("orphan", parent="t2"))
+    demux.feed(_tool("t2", parent="t1"))
+    demux.feed(_content("adopted", parent="t2"))
+
+    assert _texts(outer) == ["tool_use_start", "adopted"]
+
+
+def test_tool_execution_complete_frees_the_subtree():
+    demux = SubagentDemux()
+    _nested(demux)
+    outer = demux.subscribe("t1")
+    inner = demux.subscribe("t2")
+    demux.feed(_content("two", parent="t2"))
+
+    node = demux.get("t1")
+    assert demux.feed(_exec_complete("t1")) is demux.root
+
+    assert node.success is True
+    assert demux.get("t1") is None
+    assert demux.get("t2") is None
+    assert demux.get("t3") is None
+    assert not demux.root.children
+    # Subscriptions end on their own; buffered events are still delivered.
+    # t1's own lifecycle events belong to its parent, the main agent.
+    assert _texts(inner, close=False) == ["two"]
+    assert _texts(outer, close=False) == ["two"]
+
+
+def test_failed_tool_call_records_success():
+    demux = SubagentDemux()
+    _nested(demux)
+    node = demux.get("t3")
+    demux.feed(_exec_complete("t3", parent="t2", success=False))
+
+    assert node.success is False
+    assert demux.get("t3") is None
+    assert demux.get("t2") is not None
+    assert not demux.get("t2").children
+
+
+def test_late_events_for_freed_subtree_go_to_root():
+    demux = SubagentDemux()
+    _nested(demux)
+    demux.feed(_exec_complete("t1"))
+    everything = demux.subscribe()
+
+    assert demux.feed(_content("late", parent="t2")) is demux.root
+    assert demux.feed(_tool("t4", parent="t1")) is demux.root
+    demux.feed(_exec_start("t1"))
+
+    assert demux.get("t4").parent is demux.root
+    assert demux.get("t1") is None and demux.get("t2") is None
+    assert list(demux.root.children) == ["t4"]
+    assert _texts(everything) == [
+        "late",
+        "tool_use_start",
+        "tool_execution_start",
+    ]
+    # Subscribing to a finished tool call yields nothing.
+    assert _texts(demux.subscribe("t2"), close=False) == []
+
+
+def test_close_ends_every_subscription():
+    demux = SubagentDemux()
+    _nested(demux)
+    subscriptions = [demux.subscribe(), demux.subscribe("t2")]
+    demux.feed(_content("x", parent="t2"))
+    demux.close()
+
+    assert [_texts(s, close=False) for s in subscriptions] == [["x"], ["x"]]
+    assert _texts(demux.subscribe("t1"), close=False) == []
+
+
+def test_run_feeds_a_stream_and_waits_for_subscribers():
+    demux = SubagentDemux()
+
+    async def source():
+        for event in [
+            _tool("t1"),
+            _content("hello", parent="t1"),
+            _exec_complete("t1"),
+            _content("bye"),
+        ]:
+            await asyncio.sleep(0)
+            yield event
+
+    async def main():
+        inner = demux.subscribe("t1")
+        everything = demux.subscribe()
+
+        async def follow(iterator):
+            return [event.event async for event in iterator]
+
+        followers = asyncio.gather(follow(inner), follow(everything))
+        await demux.run(source())
+        return await followers
+
+    inner, everything = asyncio.run(main())
+    assert inner == ["content"]
+    assert everything == [
+        "tool_use_start",
+        "content",
+        "tool_execution_complete",
+        "content",
+    ]
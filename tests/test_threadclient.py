@@ -0,0 +1,111 @@
+import threading
+import time
+
+import httpx
+
+from mix_python_sdk import Mix
+from mix_python_sdk.threadclient import PerThreadClient
+
+_THREADS = 8
+
+
+def _in_threads(target, count=_THREADS):
+    """Run ``target(index)`` on ``count`` threads started together."""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(index):
+        try:
+            barrier.wait(5)
+            target(index)
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert not errors, errors
+
+
+def test_sub_sdks_are_created_once_under_concurrent_access(monkeypatch):
+    imports = []
+    original = Mix.dynamic_import
+
+    def slow_import(self, modname, retries=3):
+        imports.append(modname)
+        time.sleep(0.01)  # Widen the window in which threads race.
+        return original(self, modname, retries)
+
+    monkeypatch.setattr(Mix, "dynamic_import", slow_import)
+    mix = Mix(server_url="http://mix.fake")
+    seen = [None] * _THREADS
+
+    def touch(index):
+        seen[index] = (mix.sessions, mix.messages)
+
+    _in_threads(touch)
+
+    assert len({id(sessions) for sessions, _ in seen}) == 1
+    assert len({id(messages) for _, messages in seen}) == 1
+    assert sorted(imports) == ["mix_python_sdk.messages", "mix_python_sdk.sessions"]
+
+
+def test_each_thread_gets_its_own_client(fake, session):
+    client = PerThreadClient(_THREADS, transport=fake.transport())
+    mix = Mix(server_url="http://mix.fake", client=client)
+    owners = [None] * _THREADS
+    done = threading.Barrier(_THREADS + 1)
+
+    def work(index):
+        first = client.client()
+        assert mix.sessions.get(id=session.id).id == session.id
+        assert client.client() is first
+        owners[index] = first
+        # Stay alive until the main thread has counted the clients.
+        done.wait(5)
+        done.wait(5)
+
+    thread = threading.Thread(target=_in_threads, args=(work,))
+    thread.start()
+    done.wait(5)
+    open_clients = client.clients
+    done.wait(5)
+    thread.join(10)
+
+    assert len({id(owner) for owner in owners}) == _THREADS
+    assert open_clients == _THREADS
+    assert fake.stats().requests["GET /api/sessions/{id}"] == _THREADS
+    client.close()
+    assert client.clients == 0
+
+
+def test_requests_in_flight_stay_within_the_shared_limit(fake, session):
+    handler = fake.transport().handler
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def handle(request):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        try:
+            time.sleep(0.02)
+            return handler(request)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    client = PerThreadClient(3, transport=httpx.MockTransport(handle))
+    with Mix(server_url="http://mix.fake", client=client) as mix:
+
+        def work(_):
+            for _ in range(3):
+                mix.sessions.get(id=session.id)
+
+        _in_threads(work)
+
+    assert peak[0] == 3
+    client.close()
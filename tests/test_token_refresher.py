@@ -0,0 +1,48 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mix_python_sdk.fakeserver import FakeMixServer
+from mix_python_sdk.token_refresher import TokenRefresher
+
+_REFRESH = "POST /internal/auth/refresh-tokens"
+
+
+def test_concurrent_refreshes_share_one_call():
+    with FakeMixServer(latency=0.2) as fake, fake.mix() as mix:
+        refresher = TokenRefresher(mix)
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: refresher.refresh(), range(8)))
+
+    assert fake.stats().requests[_REFRESH] == 1
+    assert all(result is results[0] for result in results)
+    stats = refresher.stats
+    assert stats.refreshes == 1 and stats.joined == 7
+
+
+def test_requests_wait_for_a_refresh_in_flight():
+    with FakeMixServer(latency=0.2) as fake, fake.mix() as mix:
+        with TokenRefresher(mix, poll_interval=60) as refresher:
+            leader = threading.Thread(target=refresher.refresh)
+            leader.start()
+            while not refresher.refreshing:
+                time.sleep(0.001)
+            mix.system.get_system_info()
+            refreshed = refresher.stats.last_refresh
+            leader.join()
+
+    assert refreshed is not None
+    assert refresher.stats.paused == 1
+
+
+def test_tokens_inside_the_lead_time_are_refreshed_once():
+    with FakeMixServer() as fake, fake.mix() as mix:
+        # Tokens last an hour, so every check finds them due.
+        with TokenRefresher(mix, lead_time=7200, jitter=0, retry_interval=60):
+            deadline = time.monotonic() + 2
+            while not fake.stats().requests.get(_REFRESH):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            time.sleep(0.2)
+
+    assert fake.stats().requests[_REFRESH] == 1
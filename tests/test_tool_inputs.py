@@ -0,0 +1,152 @@
+import json
+
+from pydantic import BaseModel, ValidationError
+
+from mix_python_sdk.models import (
+    SSEToolUseParameterDeltaEvent,
+    SSEToolUseParameterStreamingCompleteEvent,
+    SSEToolUseStartEvent,
+)
+from mix_python_sdk.tool_inputs import ToolInputAssembler
+from mix_python_sdk.tool_models import TOOL_PARAMS, BashParams, EditParams
+
+
+def _start(call_id, name):
+    return SSEToolUseStartEvent.model_validate(
+        {
+            "event": "tool_use_start",
+            "id": "1",
+            "data": {"id": call_id, "name": name, "type": "tool_use_start"},
+        }
+    )
+
+
+def _delta(call_id, text):
+    return SSEToolUseParameterDeltaEvent.model_validate(
+        {
+            "event": "tool_use_parameter_delta",
+            "id": "2",
+            "data": {
+                "toolCallId": call_id,
+                "input": text,
+                "type": "tool_use_parameter_delta",
+            },
+        }
+    )
+
+
+def _complete(call_id, name, arguments):
+    raw = arguments if isinstance(arguments, str) else json.dumps(arguments)
+    return SSEToolUseParameterStreamingCompleteEvent.model_validate(
+        {
+            "event": "tool_use_parameter_streaming_complete",
+            "id": "3",
+            "data": {
+                "id": call_id,
+                "name": name,
+                "input": raw,
+                "type": "tool_use_parameter_streaming_complete",
+            },
+        }
+    )
+
+
+def _stream(assembler, call_id, name, arguments, size=4):
+    raw = json.dumps(arguments)
+    assembler.feed(_start(call_id, name))
+    for i in range(0, len(raw), size):
+        assembler.feed(_delta(call_id, raw[i : i + size]))
+    return assembler.feed(_complete(call_id, name, raw))
+
+
+def test_arguments_preview_while_streaming_then_validate():
+    assembler = ToolInputAssembler()
+    assembler.feed(_start("call-1", "bash"))
+    assembler.feed(_delta("call-1", '{"command": "ls'))
+
+    assert assembler.partial("call-1") == {"command": "ls"}
+    assert not assembler.get("call-1").complete
+
+    assembler.feed(_delta("call-1", ' -la", "timeout": 5000}'))
+    tool_input = assembler.feed(
+        _complete("call-1", "bash", {"command": "ls -la", "timeout": 5000})
+    )
+
+    assert tool_input.complete and tool_input.error is None
+    assert tool_input.params == BashParams(command="ls -la", timeout=5000)
+    assert tool_input.value == {"command": "ls -la", "timeout": 5000}
+
+
+def test_every_core_tool_name_validates_against_its_model():
+    edit = {"file_path": "/tmp/a", "old_string": "a", "new_string": "b"}
+    tool_input = _stream(ToolInputAssembler(), "call-1", "edit", edit)
+
+    assert type(tool_input.params) is TOOL_PARAMS["edit"] is EditParams
+    assert tool_input.params.new_string == "b"
+
+
+def test_interleaved_tool_calls_are_assembled_separately():
+    assembler = ToolInputAssembler()
+    bash = json.dumps({"command": "echo one"})
+    edit = json.dumps({"file_path": "/x", "old_string": "1", "new_string": "2"})
+    assembler.feed(_start("call-1", "bash"))
+    assembler.feed(_start("call-2", "edit"))
+    for i in range(0, max(len(bash), len(edit)), 3):
+        assembler.feed(_delta("call-2", edit[i : i + 3]))
+        assembler.feed(_delta("call-1", bash[i : i + 3]))
+        partial = assembler.partial("call-1")
+        assert set(partial) <= {"command"}
+
+    first = assembler.feed(_complete("call-1", "bash", bash))
+    second = assembler.feed(_complete("call-2", "edit", edit))
+
+    assert first.params == BashParams(command="echo one")
+    assert second.params == EditParams(file_path="/x", old_string="1", new_string="2")
+
+
+def test_invalid_arguments_keep_the_value_and_report_the_error():
+    tool_input = _stream(ToolInputAssembler(), "call-1", "bash", {"timeout": 5})
+
+    assert tool_input.params is None
+    assert isinstance(tool_input.error, ValidationError)
+    assert tool_input.arguments == {"timeout": 5}
+
+
+def test_completion_input_wins_over_missed_or_broken_deltas():
+    assembler = ToolInputAssembler()
+    assembler.feed(_delta("call-1", '{"command": "ec'))
+    tool_input = assembler.feed(_complete("call-1", "bash", {"command": "echo"}))
+
+    assert tool_input.params == BashParams(command="echo")
+
+    assembler.feed(_delta("call-2", '{"command": "ec'))
+    broken = assembler.feed(_complete("call-2", "bash", '{"command": "ec'))
+
+    assert isinstance(broken.error, json.JSONDecodeError)
+    assert broken.arguments == {"command": "ec"}
+
+
+def test_unknown_tools_are_not_validated_unless_given_a_model():
+    class LookupParams(BaseModel):
+        query: str
+
+    arguments = {"query": "weather"}
+    plain = _stream(ToolInputAssembler(), "call-1", "lookup", arguments)
+    custom = _stream(
+        ToolInputAssembler({"lookup": LookupParams}), "call-1", "lookup", arguments
+    )
+
+    assert plain.params is None and plain.error is None
+    assert plain.arguments == arguments
+    assert custom.params == LookupParams(query="weather")
+
+
+def test_late_deltas_are_ignored_and_calls_can_be_discarded():
+    assembler = ToolInputAssembler()
+    tool_input = _stream(assembler, "call-1", "bash", {"command": "true"})
+    assembler.feed(_delta("call-1", "garbage"))
+
+    assert tool_input.value == {"command": "true"}
+    assert assembler.discard("call-1") is tool_input
+    assert assembler.get("call-1") is None
+    assert assembler.feed(_start("call-1", "bash")) is not tool_input
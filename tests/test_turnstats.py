@@ -0,0 +1,157 @@
+from types import SimpleNamespace
+
+import pytest
+
+from mix_python_sdk import helpers
+from mix_python_sdk.helpers import GAP_BUCKETS, StreamEvent, TurnStats
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Makes ``time.monotonic()`` return the timestamps given to ``at``."""
+    now = [0.0]
+    monkeypatch.setattr(helpers.time, "monotonic", lambda: now[0])
+
+    def at(timestamp):
+        now[0] = timestamp
+
+    return at
+
+
+def _feed(stats, clock, timeline):
+    """Record ``(timestamp, event type, data fields)`` entries in order."""
+    for timestamp, event_type, fields in timeline:
+        clock(timestamp)
+        event = StreamEvent(event_type, SimpleNamespace(**fields))
+        stats.record(event.type, event.data)
+
+
+def _tokens(stats, clock, *timestamps, event_type="content"):
+    _feed(stats, clock, [(t, event_type, {"content": "x"}) for t in timestamps])
+
+
+def _bucket(bound):
+    return GAP_BUCKETS.index(bound)
+
+
+def test_gap_buckets_run_from_one_millisecond_to_five_seconds():
+    assert GAP_BUCKETS == pytest.approx(
+        [0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5]
+    )
+    assert list(GAP_BUCKETS) == sorted(GAP_BUCKETS)
+
+
+def test_gaps_between_tokens_are_bucketed(clock):
+    stats = TurnStats(sent=-1.0)
+    _tokens(stats, clock, 0.0, 0.0005, event_type="thinking")
+    _tokens(stats, clock, 0.0035, 0.0065, 0.0215, 7.0215)
+
+    expected = [0] * (len(GAP_BUCKETS) + 1)
+    expected[_bucket(0.001)] = 1  # 0.5 ms
+    expected[_bucket(0.005)] = 2  # 3 ms, twice
+    expected[_bucket(0.02)] = 1  # 15 ms
+    expected[-1] = 1  # 7 s, above the last bound
+    assert stats.gap_histogram == expected
+    assert stats.tokens == 6
+    assert stats.max_gap == pytest.approx(7.0)
+    assert stats.total_gap == pytest.approx(7.0215)
+    assert stats.mean_gap == pytest.approx(7.0215 / 5)
+    assert stats.last_token == 7.0215
+    # The clock starts at zero, which still counts as a timestamp.
+    assert stats.first_thinking == 0.0
+    assert stats.first_content == 0.0035
+    assert stats.time_to_first_token == 1.0
+    assert stats.time_to_first_content == pytest.approx(1.0035)
+
+
+def test_a_gap_on_a_bound_falls_in_that_bucket(clock):
+    on_bound = TurnStats()
+    _tokens(on_bound, clock, 0.0, GAP_BUCKETS[1])
+    above = TurnStats()
+    _tokens(above, clock, 0.0, GAP_BUCKETS[1] * 1.001)
+
+    assert on_bound.gap_histogram.index(1) == 1
+    assert above.gap_histogram.index(1) == 2
+
+
+def test_gap_percentiles_come_from_the_histogram(clock):
+    stats = TurnStats()
+    _tokens(stats, clock, 0.0, 0.0005, 0.0035, 0.0065, 0.0215, 7.0215)
+
+    # Five gaps: 0.5 ms, 3 ms, 3 ms, 15 ms and 7 s.
+    assert stats.gap_percentile(20) == 0.001
+    assert stats.gap_percentile(50) == pytest.approx(0.005)
+    assert stats.gap_percentile(60) == pytest.approx(0.005)
+    assert stats.gap_percentile(80) == pytest.approx(0.02)
+    assert stats.gap_percentile(100) == pytest.approx(7.0)
+
+
+def test_gap_figures_need_two_tokens(clock):
+    stats = TurnStats()
+    assert stats.mean_gap is None
+    assert stats.gap_percentile(50) is None
+
+    _tokens(stats, clock, 3.0)
+
+    assert stats.tokens == 1
+    assert stats.mean_gap is None
+    assert stats.gap_percentile(50) is None
+    assert sum(stats.gap_histogram) == 0
+
+
+def test_tool_completions_are_matched_to_their_starts(clock):
+    stats = TurnStats()
+    _feed(
+        stats,
+        clock,
+        [
+            (1.0, "tool_execution_start", {"tool_call_id": "a", "tool_name": "bash"}),
+            (2.0, "tool_execution_start", {"tool_call_id": "b", "tool_name": "read"}),
+            (5.0, "tool_execution_complete", {"tool_call_id": "b", "success": False}),
+            (7.0, "tool_execution_complete", {"tool_call_id": "a", "success": True}),
+            # Started before the stream was joined.
+            (
+                8.0,
+                "tool_execution_complete",
+                {"tool_call_id": "c", "tool_name": "grep", "success": True},
+            ),
+        ],
+    )
+
+    summary = [
+        (t.tool_call_id, t.tool_name, t.started, t.completed, t.success)
+        for t in stats.tools
+    ]
+    assert summary == [
+        ("a", "bash", 1.0, 7.0, True),
+        ("b", "read", 2.0, 5.0, False),
+        ("c", "grep", None, 8.0, True),
+    ]
+    assert [t.duration for t in stats.tools] == [6.0, 3.0, None]
+    assert stats.tokens == 0
+
+
+def test_turn_end_and_send_timings(clock):
+    stats = TurnStats(sent=10.0, accepted=10.25)
+    _feed(
+        stats,
+        clock,
+        [
+            (11.0, "content", {"content": "hi"}),
+            (12.5, "complete", {"reasoning_duration": 800}),
+        ],
+    )
+
+    assert stats.time_to_accept == 0.25
+    assert stats.time_to_first_token == 1.0
+    assert stats.duration == 2.5
+    assert stats.reasoning_duration == 800
+    assert stats.failed is None
+
+    failed = TurnStats(sent=0.0)
+    _feed(failed, clock, [(4.0, "error", {"error": "model overloaded"})])
+
+    assert failed.duration == 4.0
+    assert failed.error == "model overloaded"
+    assert failed.completed is None
+    assert failed.time_to_first_token is None